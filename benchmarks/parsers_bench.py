@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+import argparse
+import glob
+import json
+import logging
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+sys.path[0] = os.path.join(os.path.dirname(__file__), "..")
+logger = logging.getLogger(__name__)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "html")
+HISTORY = os.path.join(os.path.dirname(__file__), "parsers_history.jsonl")  # local to each machine, git ignored
+
+LANES = 4
+TRAINERAS_RACES = [
+    "traineras_race.html",
+    "traineras_race_double.html",
+    "traineras_race_double_1.html",
+    "traineras_race_triple.html",
+    "traineras_race_with_label.html",
+]
+
+# cells read by the participant getters of the parsers (lane, name, series, laps, disqualified, retired...)
+CELLS = ["td[1]/text()", "td[2]/text()", "td[3]/text()", "td[4]/text()", "td/text()", "td/text()", "td/text()"]
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    Parser call measured over some documents.
+
+    Args:
+        group (str): Datasource of the parser, or the loading path being compared ('selector', 'rows').
+        name (str): Name of the parser method or strategy.
+        documents (Callable[[], list[Any]]): Builds new documents for each call, not timed.
+        run (Callable[..., Any]): Calls the parser with the documents and returns its consumed output.
+    """
+
+    group: str
+    name: str
+    documents: Callable[[], list[Any]]
+    run: Callable[..., Any]
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}.{self.name}"
+
+
+def _parse_arguments():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "groups", nargs="*", help="Datasources or comparisons (selector, rows) to benchmark, all of them by default."
+    )
+    parser.add_argument("--repeat", type=int, default=50, help="Times each parser call is run.")
+    parser.add_argument("--history", type=str, default=HISTORY, help="JSON Lines file with the previous runs.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed p50 latency increase over the last recorded run before failing (0.2 = 20%%).",
+    )
+    parser.add_argument("--no-save", action="store_true", default=False, help="Don't record this run in the history.")
+    return parser.parse_args()
+
+
+####################################################
+#                    DOCUMENTS                     #
+####################################################
+
+
+def fixtures(*names: str) -> Callable[[], list["Selector"]]:
+    """
+    Returns: Callable[[], list[Selector]]: Builds a new Selector for each of the given fixtures.
+    """
+    bodies = []
+    for name in names:
+        with open(os.path.join(FIXTURES, name), "rb") as file:
+            bodies.append(file.read())
+    return lambda: [Selector(body=body, encoding="utf-8") for body in bodies]
+
+
+def listing_page(rows: int) -> Callable[[], list["requests.Response"]]:
+    """
+    Build a Traineras listing response with the given number of rows out of the results fixture.
+    """
+    with open(os.path.join(FIXTURES, "traineras_results.html"), "rb") as file:
+        content = file.read()
+
+    body = re.search(rb"<tbody>(.*)</tbody>", content, re.DOTALL)
+    assert body is not None
+    row = re.findall(rb"<tr>.*?</tr>", body.group(1), re.DOTALL)[0]
+    content = content.replace(body.group(1), row * rows)
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "text/html; charset=UTF-8"
+    response._content = content
+    return lambda: [response]
+
+
+def _heats(boats: int) -> list[list[int]]:
+    return [list(range(i, min(i + LANES, boats))) for i in range(0, boats, LANES)]
+
+
+def act_regatta(boats: int) -> Callable[[], list["Selector"]]:
+    def heat(boats: list[int]) -> str:
+        rows = "".join(
+            f"<tr><td>{b % LANES + 1}</td><td>CLUB {b}</td><td>05:0{b % 10}</td><td>20:0{b % 10}</td><td>1</td></tr>"
+            for b in boats
+        )
+        return f"<div><div></div><div><div><table><tbody>{rows}</tbody></table></div></div></div>"
+
+    heats = "".join(heat(h) for h in _heats(boats))
+    html = f'<html><body><div id="col-a"><div><section>{heats}</section></div></div></body></html>'
+    return lambda: [Selector(html)]
+
+
+def arc_regatta(boats: int) -> Callable[[], list["Selector"]]:
+    def heat(boats: list[int]) -> str:
+        rows = "".join(
+            f"<tr><th>{b % LANES + 1}</th><td><span><a>CLUB {b}</a></span></td><td>05:0{b % 10}</td></tr>"
+            for b in boats
+        )
+        return f"<table><tbody>{rows}</tbody></table>"
+
+    final_times = "".join(
+        f"<tr><td><span><a>CLUB {b}</a></span></td><td></td><td>{0 if b % 10 == 0 else b}</td></tr>"
+        for b in range(boats)
+    )
+    final_times = f"<div><div></div><div><div><table><tbody>{final_times}</tbody></table></div></div></div>"
+    heats = "".join(heat(h) for h in _heats(boats))
+    html = (
+        f'<html><body><div id="widget-resultados"><div>{final_times}<div></div><div><div>{heats}</div></div></div>'
+        "</div></body></html>"
+    )
+    return lambda: [Selector(html)]
+
+
+def lgt_regatta(boats: int) -> Callable[[], list["Selector"]]:
+    def heat(boats: list[int]) -> str:
+        return "".join(
+            f"<tr><td>{b % LANES + 1}</td><td>CLUB {b}</td><td>05:0{b % 10}</td><td>20:0{b % 10}</td></tr>"
+            for b in boats
+        )
+
+    # single cell rows separate the heats
+    heats = "<tr><td></td></tr>".join(heat(h) for h in _heats(boats))
+    header = "<tr><th>BOIA</th><th>CLUB</th><th>1</th><th>FINAL</th></tr>"
+    html = f'<html><body><table id="tabla-tempos">{header}{heats}</table></body></html>'
+    return lambda: [Selector(html)]
+
+
+####################################################
+#                   STRATEGIES                     #
+####################################################
+
+
+def reparsed_rows(*selectors: "Selector") -> list:
+    """
+    Serialise every row and load it into a new Selector, querying it from the root.
+    """
+    rows = [Selector(r) for selector in selectors for r in selector.xpath("//tr").getall()]
+    for row in rows:
+        for cell in CELLS:
+            row.xpath(f"//*/{cell}").getall()
+    return rows
+
+
+def relative_rows(*selectors: "Selector") -> list:
+    """
+    Query every row node of the original tree with relative paths.
+    """
+    rows = [row for selector in selectors for row in selector.xpath("//tr")]
+    for row in rows:
+        for cell in CELLS:
+            row.xpath(f".//{cell}").getall()
+    return rows
+
+
+def races_by_table(parser: "TrainerasHtmlParser", documents: Callable[[], list["Selector"]]) -> Callable[..., list]:
+    """
+    Returns: Callable[..., list]: Parses each race of the pages on its own, as the client does when a table is
+        requested.
+    """
+    counts = [len(parser.parse_races(s, race_id="1")) for s in documents()]
+
+    def run(*selectors: "Selector") -> list:
+        races = []
+        for selector, count in zip(selectors, counts):
+            races.extend(parser.parse_race(selector, race_id="1", table=t) for t in range(1, count + 1))
+        return races
+
+    return run
+
+
+def parse_results(datasource: str, selector: "Selector") -> list:
+    """
+    Run the participant getters used to parse the results of a race.
+    """
+    if datasource == "act":
+        parser = ACTHtmlParser()
+        rows = parser.get_participants(selector)
+        for row in rows:
+            parser.get_club_name(row), parser.get_lane(row), parser.get_series(row), parser.is_disqualified(row)
+    elif datasource == "arc":
+        parser = ARCHtmlParser()
+        final_times = parser.get_final_times(selector)
+        rows = parser.get_participants(selector)
+        for row in rows:
+            parser.get_club_name(row), parser.get_lane(row), parser.get_series(row)
+            parser.is_disqualified(row, final_times)
+    else:
+        parser = LGTHtmlParser()
+        rows = parser.get_participants(selector)
+        for row in rows:
+            parser.get_club_name(row), parser.get_lane(row), parser.get_series(row), parser.is_disqualified(row)
+    return list(rows)
+
+
+def _cases() -> list[Case]:
+    act, arc, lgt, traineras = ACTHtmlParser(), ARCHtmlParser(), LGTHtmlParser(), TrainerasHtmlParser()
+    cases = [
+        Case(
+            "act", "parse_race", fixtures("act_details.html"), lambda s: act.parse_race(s, race_id="1", is_female=False)
+        ),
+        Case("act", "parse_race_ids", fixtures("act_races.html"), lambda s: list(act.parse_race_ids(s))),
+        Case(
+            "act",
+            "parse_race_names",
+            fixtures("act_races.html"),
+            lambda s: list(act.parse_race_names(s, is_female=False)),
+        ),
+        Case(
+            "arc", "parse_race", fixtures("arc_details.html"), lambda s: arc.parse_race(s, race_id="1", is_female=False)
+        ),
+        Case("arc", "parse_race_ids", fixtures("arc_races.html"), lambda s: list(arc.parse_race_ids(s))),
+        Case(
+            "arc",
+            "parse_race_names",
+            fixtures("arc_races.html"),
+            lambda s: list(arc.parse_race_names(s, is_female=False)),
+        ),
+        Case(
+            "lgt",
+            "parse_race",
+            fixtures("lgt_details.html", "lgt_results.html"),
+            lambda s, r: lgt.parse_race(s, results_selector=r, race_id="1"),
+        ),
+        Case("lgt", "parse_race_ids", fixtures("lgt_races.html"), lambda s: list(lgt.parse_race_ids(s))),
+        Case(
+            "lgt",
+            "parse_race_names",
+            fixtures("lgt_races.html"),
+            lambda s: list(lgt.parse_race_names(s, is_female=False)),
+        ),
+        Case(
+            "traineras", "parse_race", fixtures("traineras_race.html"), lambda s: traineras.parse_race(s, race_id="1")
+        ),
+        Case(
+            "traineras",
+            "parse_races",
+            fixtures("traineras_race_triple.html"),
+            lambda s: traineras.parse_races(s, race_id="1"),
+        ),
+        # every race of a page parsed at once against one table at a time
+        Case(
+            "traineras",
+            "parse_races_by_page",
+            fixtures(*TRAINERAS_RACES),
+            lambda *s: [r for selector in s for r in traineras.parse_races(selector, race_id="1")],
+        ),
+        Case(
+            "traineras",
+            "parse_races_by_table",
+            fixtures(*TRAINERAS_RACES),
+            races_by_table(traineras, fixtures(*TRAINERAS_RACES)),
+        ),
+        Case(
+            "traineras",
+            "parse_race_ids",
+            fixtures("traineras_results.html"),
+            lambda s: list(traineras.parse_race_ids(s)),
+        ),
+        Case(
+            "traineras",
+            "parse_race_names",
+            fixtures("traineras_results.html"),
+            lambda s: list(traineras.parse_race_names(s)),
+        ),
+        Case(
+            "traineras",
+            "parse_flag_race_ids",
+            fixtures("traineras_flag.html"),
+            lambda s: list(traineras.parse_flag_race_ids(s, gender=GENDER_MALE, category=CATEGORY_ABSOLUT)),
+        ),
+        Case(
+            "traineras",
+            "parse_flag_editions",
+            fixtures("traineras_flag_editions.html"),
+            lambda s: list(traineras.parse_flag_editions(s, gender=GENDER_MALE, category=CATEGORY_ABSOLUT)),
+        ),
+        Case(
+            "traineras",
+            "parse_searched_flag_urls",
+            fixtures("traineras_search_flags.html"),
+            lambda s: traineras.parse_searched_flag_urls(s),
+        ),
+        Case(
+            "traineras",
+            "parse_club_race_ids",
+            fixtures("traineras_club.html"),
+            lambda s: list(traineras.parse_club_race_ids(s)),
+        ),
+        Case(
+            "traineras",
+            "parse_club_details",
+            fixtures("traineras_club_details.html"),
+            lambda s: traineras.parse_club_details(s),
+        ),
+        Case(
+            "traineras",
+            "parse_rower_race_ids",
+            fixtures("traineras_rower.html"),
+            lambda s: list(traineras.parse_rower_race_ids(s)),
+        ),
+        # a listing page loaded from the decoded str against the raw bytes, the raw bytes only save allocations
+        Case("selector", "decoded_str", listing_page(5000), lambda r: Selector(r.content.decode("utf-8"))),
+        Case("selector", "raw_bytes", listing_page(5000), lambda r: Client._to_selector(r)),
+        # rows of every fixture queried as new documents against relative to the original tree
+        Case("rows", "reparsed", fixtures(*_all_fixtures()), reparsed_rows),
+        Case("rows", "relative", fixtures(*_all_fixtures()), relative_rows),
+    ]
+
+    # results of generated regattas, results per second stays flat while the times scale linearly with the boats
+    regattas = {"act": act_regatta, "arc": arc_regatta, "lgt": lgt_regatta}
+    for datasource, regatta in regattas.items():
+        for boats in [15, 30, 60]:
+            cases.append(Case(datasource, f"results_{boats}_boats", regatta(boats), partial(parse_results, datasource)))
+
+    return cases
+
+
+def _all_fixtures() -> list[str]:
+    return sorted(os.path.basename(p) for p in glob.glob(os.path.join(FIXTURES, "*.html")))
+
+
+####################################################
+#                     RUNNER                       #
+####################################################
+
+
+def measure(case: Case, repeat: int) -> dict[str, float]:
+    """
+    Run the case with new documents each time, so nothing cached for a document is reused, and only the parser call is
+    timed.
+
+    Returns: dict[str, float]: Results per second, p50/p99 latency in milliseconds and peak of Python allocations in
+        KiB.
+    """
+    output = case.run(*case.documents())  # warm up
+    results = len(output) if isinstance(output, list) else 1
+
+    timings = []
+    for _ in range(repeat):
+        documents = case.documents()
+        start = time.perf_counter()
+        case.run(*documents)
+        timings.append(time.perf_counter() - start)
+
+    # traced apart as tracing slows down the timed runs
+    documents = case.documents()
+    tracemalloc.start()
+    case.run(*documents)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    percentiles = statistics.quantiles(timings, n=100, method="inclusive")
+    return {
+        "results": results,
+        "results_per_second": results * len(timings) / sum(timings),
+        "p50_ms": statistics.median(timings) * 1000,
+        "p99_ms": percentiles[98] * 1000,
+        "peak_kib": peak / 1024,
+    }
+
+
+def load_baseline(history: str) -> dict[str, dict[str, float]]:
+    """
+    Returns: dict[str, dict[str, float]]: The results of each case in the last run of the history that measured it.
+    """
+    baseline = {}
+    if os.path.exists(history):
+        with open(history) as file:
+            for line in file:
+                if line.strip():
+                    baseline.update(json.loads(line)["results"])
+    return baseline
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float
+) -> list[tuple[str, float, float]]:
+    """
+    Returns: list[tuple[str, float, float]]: The cases whose p50 latency grew beyond the threshold, with the previous
+        and current p50.
+    """
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous and result["p50_ms"] > previous["p50_ms"] * (1 + threshold):
+            regressions.append((key, previous["p50_ms"], result["p50_ms"]))
+    return regressions
+
+
+def _commit() -> str | None:
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        return output.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(groups: list[str], repeat: int, history: str, threshold: float, save: bool) -> int:
+    cases = [c for c in _cases() if not groups or c.group in groups]
+
+    results = {}
+    print(f"{'case':>36} {'results/s':>12} {'p50':>10} {'p99':>10} {'peak':>10}")
+    for case in cases:
+        results[case.key] = result = measure(case, repeat)
+        print(
+            f"{case.key:>36} {result['results_per_second']:>12.1f} {result['p50_ms']:>7.2f} ms "
+            f"{result['p99_ms']:>7.2f} ms {result['peak_kib']:>6.0f} KiB"
+        )
+
+    regressions = find_regressions(results, load_baseline(history), threshold)
+    for key, previous, current in regressions:
+        print(f"REGRESSION {key}: p50 {previous:.3f} ms -> {current:.3f} ms (threshold {threshold:.0%})")
+
+    # a regressed run is not recorded so it doesn't become the baseline of the next one
+    if save and not regressions:
+        run = {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "repeat": repeat,
+            "results": results,
+        }
+        with open(history, "a") as file:
+            file.write(json.dumps(run) + "\n")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    import requests
+    from parsel.selector import Selector
+
+    from rscraping.clients import Client
+    from rscraping.data.constants import CATEGORY_ABSOLUT, GENDER_MALE
+    from rscraping.parsers.html import ACTHtmlParser, ARCHtmlParser, LGTHtmlParser, TrainerasHtmlParser
+
+    args = _parse_arguments()
+    logger.info(f"{os.path.basename(__file__)}:: args -> {args.__dict__}")
+
+    sys.exit(main(args.groups, args.repeat, args.history, args.threshold, save=not args.no_save))
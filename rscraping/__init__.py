@@ -1 +1,2 @@
 from ._functions import find_race as find_race
+from ._timing import StageRecorder as StageRecorder, record_stages as record_stages
@@ -1,4 +1,4 @@
-from rscraping.clients import Client
+from rscraping.clients import Client, Transport
 from rscraping.data.models import Datasource, Race
 
 
@@ -8,6 +8,7 @@ def find_race(
     is_female: bool,
     category: str | None = None,
     table: int | None = None,
+    transport: Transport | None = None,
 ) -> Race | None:  # pragma: no cover - wrapper function for the Client class
     """
     Find a race based on the provided parameters.
@@ -18,10 +19,11 @@ def find_race(
     - is_female (bool): Whether the race is for females (True) or not (False).
     - category (Optional[str]): The category of the race (optional).
     - table (Optional[int]): The day of the race (optional).
+    - transport (Optional[Transport]): The transport used to fetch the race, the shared one by default (optional).
 
     Returns:
     - Optional[Race]: The found Race object if the race is found, otherwise None.
     """
 
-    client = Client(source=datasource, is_female=is_female, category=category)
+    client = Client(source=datasource, is_female=is_female, category=category, transport=transport)
     return client.get_race_by_id(race_id, table=table)
@@ -0,0 +1,109 @@
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar, copy_context
+
+
+class StageRecorder:
+    """
+    Aggregates the time spent in each stage of the scraping (fetch, tree build, header, participants...) per datasource.
+
+    A recorder only receives the stages timed in the context it's enabled with 'record_stages', worker threads need to
+    run in a copy of that context (see 'in_context').
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: dict[tuple[str, str], list[float]] = {}
+
+    def add(self, datasource: str, stage: str, seconds: float):
+        with self._lock:
+            totals = self._stages.setdefault((datasource, stage), [0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+
+    @property
+    def stats(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Returns: dict[str, dict[str, dict[str, float]]]: Times each stage ran and its total and mean seconds, grouped by
+            datasource.
+        """
+        with self._lock:
+            stages = {key: list(totals) for key, totals in self._stages.items()}
+
+        stats = {}
+        for (datasource, stage), (calls, total) in stages.items():
+            stats.setdefault(datasource, {})[stage] = {"calls": calls, "total": total, "mean": total / calls}
+        return stats
+
+    def clear(self):
+        with self._lock:
+            self._stages.clear()
+
+
+class _StageTimer:
+    __slots__ = ("_recorder", "_datasource", "_stage", "_start")
+
+    def __init__(self, recorder: StageRecorder, datasource: str, stage: str):
+        self._recorder = recorder
+        self._datasource = datasource
+        self._stage = stage
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, *_):
+        self._recorder.add(str(self._datasource), self._stage, time.perf_counter() - self._start)
+
+
+_RECORDER: ContextVar[StageRecorder | None] = ContextVar("stage_recorder", default=None)
+_DISABLED = nullcontext()
+
+
+def stage(datasource: str, name: str) -> AbstractContextManager:
+    """
+    Time the wrapped block as a stage of the given datasource. Without an enabled recorder it's a shared no-op context,
+    so the instrumented code only pays for a context variable lookup.
+
+    Args:
+        datasource (str): The datasource being scraped.
+        name (str): The stage name.
+
+    Returns: AbstractContextManager: The stage timer.
+    """
+    recorder = _RECORDER.get()
+    return _StageTimer(recorder, datasource, name) if recorder is not None else _DISABLED
+
+
+@contextmanager
+def record_stages(recorder: StageRecorder | None = None) -> Generator[StageRecorder]:
+    """
+    Enable the stage timing for the current context.
+
+    Args:
+        recorder (StageRecorder | None): The recorder receiving the timings, a new one by default.
+
+    Yields: StageRecorder: The enabled recorder.
+    """
+    recorder = recorder or StageRecorder()
+    token = _RECORDER.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _RECORDER.reset(token)
+
+
+def in_context[**P, T](func: Callable[P, T]) -> Callable[P, T]:
+    """
+    Bind the given function to the current context, so the stages it times from a worker thread reach the recorder of
+    the caller.
+    """
+    context = copy_context()
+
+    def run(*args: P.args, **kwargs: P.kwargs) -> T:
+        # each call gets its own copy as a context can't be entered by several threads at once
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
@@ -1,9 +1,27 @@
+from ._archive import (
+    ArchiveMissException as ArchiveMissException,
+    ArchiveRecord as ArchiveRecord,
+    ResponseArchive as ResponseArchive,
+)
+from ._async_client import AsyncClient as AsyncClient
+from ._cache import CachePolicy as CachePolicy, ResponseCache as ResponseCache
 from ._client import Client as Client
-from ._protocol import ClientProtocol as ClientProtocol
-from .act import ACTClient as ACTClient
-from .arc import ARCClient as ARCClient
-from .lgt import LGTClient as LGTClient
-from .traineras import TrainerasClient as TrainerasClient
+from ._documents import DocumentCache as DocumentCache
+from ._downloader import Download as Download, Downloader as Downloader
+from ._index import RaceYearIndex as RaceYearIndex
+from ._protocol import ClientProtocol as ClientProtocol, AsyncClientProtocol as AsyncClientProtocol
+from ._ratelimit import RateLimit as RateLimit, RateLimiter as RateLimiter
+from ._retry import (
+    CircuitBreaker as CircuitBreaker,
+    CircuitOpenException as CircuitOpenException,
+    RetryBudget as RetryBudget,
+    RetryPolicy as RetryPolicy,
+)
+from ._transport import Transport as Transport
+from .act import ACTClient as ACTClient, ACTAsyncClient as ACTAsyncClient
+from .arc import ARCClient as ARCClient, ARCAsyncClient as ARCAsyncClient
+from .lgt import LGTClient as LGTClient, LGTAsyncClient as LGTAsyncClient
+from .traineras import TrainerasClient as TrainerasClient, TrainerasAsyncClient as TrainerasAsyncClient
 from .tabular import (
     TabularClientConfig as TabularClientConfig,
     TabularDataClient as TabularDataClient,
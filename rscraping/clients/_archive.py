@@ -0,0 +1,153 @@
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ._cache import ResponseCache
+
+
+class ArchiveMissException(Exception):
+    pass
+
+
+@dataclass
+class ArchiveRecord:
+    method: str
+    url: str
+    data: dict | None
+    status_code: int
+    headers: dict[str, str]
+    recorded_at: float
+    offset: int
+    length: int
+
+
+class ResponseArchive:
+    """
+    Single file archive of the requests sent by a Transport and their responses.
+
+    In record mode every response is appended to the archive as a JSON header line followed by the raw body. In replay
+    mode the recorded responses are served back from the archive and nothing is sent to the network, so a crawl can be
+    reproduced offline.
+
+    The file is append-only, the index mapping each request to its record is built when the archive is opened by
+    reading the header lines and skipping over the bodies. When a request was recorded several times the last record
+    wins.
+
+    Args:
+        path (str): The archive file.
+        replay (bool): Serve the recorded responses instead of recording new ones.
+    """
+
+    def __init__(self, path: str, replay: bool = False):
+        self.path = path
+        self.replay = replay
+
+        self._lock = threading.Lock()
+        self._index: dict[str, ArchiveRecord] = {}
+
+        if replay and not os.path.exists(path):
+            raise FileNotFoundError(path)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._file = open(path, "rb" if replay else "a+b")
+        end = self._load_index()
+        if not replay:
+            # drop the partial record of an interrupted recording, otherwise the new records would follow it and be
+            # unreachable on replay
+            self._file.truncate(end)
+
+    def __enter__(self) -> "ResponseArchive":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @property
+    def records(self) -> list[ArchiveRecord]:
+        return list(self._index.values())
+
+    def record(self, method: str, url: str, data: dict | None, response: requests.Response):
+        """
+        Append the response of a request to the archive.
+        """
+        if self.replay:
+            raise ValueError("can't record in a replay archive")
+
+        content = response.content
+        header = {
+            "method": method.upper(),
+            "url": url,
+            "data": data,
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "recorded_at": time.time(),
+            "length": len(content),
+        }
+        line = json.dumps(header, default=str).encode() + b"\n"
+
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell() + len(line)
+            self._file.write(line + content + b"\n")
+            self._file.flush()
+            self._index[ResponseCache.key(method, url, data)] = ArchiveRecord(offset=offset, **header)
+
+    def get(self, method: str, url: str, data: dict | None = None) -> requests.Response:
+        """
+        Retrieve the recorded response of a request.
+
+        Raises:
+            ArchiveMissException: If the request is not in the archive.
+        """
+        record = self._index.get(ResponseCache.key(method, url, data))
+        if not record:
+            raise ArchiveMissException(f"not archived {method=} {url=} {data=}")
+
+        with self._lock:
+            self._file.seek(record.offset)
+            content = self._file.read(record.length)
+
+        response = requests.Response()
+        response.url = record.url
+        response.status_code = record.status_code
+        response.headers = CaseInsensitiveDict(record.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = content
+        return response
+
+    def close(self):
+        self._file.close()
+
+    ####################################################
+    #                      UTILS                       #
+    ####################################################
+
+    def _load_index(self) -> int:
+        """
+        Returns: int: The end of the last complete record.
+        """
+        end = 0
+        self._file.seek(0)
+        while True:
+            line = self._file.readline()
+            if not line:
+                break
+            try:
+                header = json.loads(line)
+            except ValueError:  # truncated by an interrupted recording
+                break
+            offset = self._file.tell()
+            if offset + header["length"] + 1 > os.fstat(self._file.fileno()).st_size:
+                break
+            self._file.seek(header["length"] + 1, os.SEEK_CUR)
+            self._index[ResponseCache.key(header["method"], header["url"], header["data"])] = ArchiveRecord(
+                offset=offset, **header
+            )
+            end = self._file.tell()
+        return end
@@ -0,0 +1,100 @@
+import asyncio
+import weakref
+from collections.abc import AsyncGenerator, Callable
+from typing import override
+from urllib.parse import urlsplit
+
+from rscraping.data.models import Datasource, Race, RaceName
+
+from ._client import Client
+from ._protocol import AsyncClientProtocol
+
+
+class AsyncClient(AsyncClientProtocol):
+    """
+    Asyncio flavour of the Client hierarchy.
+
+    Each coroutine runs the blocking Client method in a worker thread, so the parsing logic is shared with the
+    synchronous clients, while a bounded semaphore per host limits how many requests overlap against each datasource.
+    """
+
+    _registry = {}
+    _semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    DATASOURCE: Datasource
+    MAX_CONCURRENCY: int = 10
+
+    _client: Client
+
+    def __init_subclass__(cls, **kwargs):
+        source = kwargs.pop("source", None)
+        super().__init_subclass__(**kwargs)
+        if source:
+            cls._registry[source] = cls
+
+    def __new__(cls, source: Datasource, max_concurrency: int | None = None, **kwargs) -> "AsyncClient":
+        subclass = cls._registry[source]
+        final_obj = object.__new__(subclass)
+        final_obj._client = Client(source=source, **kwargs)
+        if max_concurrency:
+            final_obj.MAX_CONCURRENCY = max_concurrency
+        return final_obj
+
+    @property
+    def client(self) -> Client:
+        return self._client
+
+    @override
+    async def get_race_by_id(self, race_id: str, **kwargs) -> Race | None:
+        return await self._run(self._client.get_race_by_id, race_id, **kwargs)
+
+    @override
+    async def get_race_ids_by_year(self, year: int, **kwargs) -> list[str]:
+        return await self._run(lambda: list(self._client.get_race_ids_by_year(year, **kwargs)))
+
+    @override
+    async def get_race_names_by_year(self, year: int, **kwargs) -> list[RaceName]:
+        return await self._run(lambda: list(self._client.get_race_names_by_year(year, **kwargs)))
+
+    @override
+    async def get_last_weekend_race_ids(self, **kwargs) -> list[str]:
+        return await self._run(lambda: list(self._client.get_last_weekend_race_ids(**kwargs)))
+
+    @override
+    async def get_races_by_ids(self, race_ids: list[str], **kwargs) -> AsyncGenerator[Race]:
+        tasks = [asyncio.ensure_future(self.get_race_by_id(race_id, **kwargs)) for race_id in race_ids]
+        try:
+            for task in asyncio.as_completed(tasks):
+                race = await task
+                if race:
+                    yield race
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @override
+    async def get_races_by_year(self, year: int, **kwargs) -> AsyncGenerator[Race]:
+        race_ids = await self.get_race_ids_by_year(year)
+        async for race in self.get_races_by_ids(race_ids, **kwargs):
+            yield race
+
+    ####################################################
+    #                      UTILS                       #
+    ####################################################
+
+    @property
+    def _host(self) -> str:
+        return urlsplit(self._client.get_race_details_url("0", is_female=self._client.is_female)).netloc
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # semaphores are bound to the running loop, so we keep one set of them for each loop
+        semaphores = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        if self._host not in semaphores:
+            semaphores[self._host] = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        return semaphores[self._host]
+
+    async def _run[T](self, func: Callable[..., T], *args, **kwargs) -> T:
+        async with self._semaphore():
+            return await asyncio.to_thread(func, *args, **kwargs)
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+DEFAULT_CACHE_DIR = os.environ.get("RSCRAPING_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "rscraping"))
+
+
+@dataclass
+class CachePolicy:
+    """
+    Freshness rules for the responses of a datasource.
+
+    Each rule is a (pattern, ttl) pair searched in the request URL, the first matching one wins. When the pattern
+    captures a 'year' group, pages of past seasons are considered immutable. A None ttl never expires.
+    """
+
+    rules: list[tuple[str, float | None]] = field(default_factory=list)
+    default_ttl: float | None = DAY
+
+    def ttl(self, url: str) -> float | None:
+        for pattern, ttl in self.rules:
+            match = re.search(pattern, url)
+            if match:
+                year = match.groupdict().get("year")
+                if year and int(year) < date.today().year:
+                    return None
+                return ttl
+        return self.default_ttl
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    stored_at: float
+    expires_at: float | None
+    content: bytes
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > time.time()
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """
+        Conditional request headers to revalidate the entry with the server.
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        validators = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = self.content
+        return response
+
+
+class ResponseCache:
+    """
+    Persistent on-disk HTTP response cache.
+
+    Entries are addressed by the hash of the method, URL and body of the request, so POST requests with different
+    form data are stored apart. Each entry is kept as a '.body' file with the raw content next to a '.json' file with
+    its metadata. When the cache grows over 'max_size' bytes the least recently used entries are evicted.
+
+    Args:
+        path (str): Directory where the entries are stored.
+        max_size (int): Maximum size in bytes of the stored bodies.
+    """
+
+    SYNC_PUTS = 100
+
+    def __init__(self, path: str = DEFAULT_CACHE_DIR, max_size: int = 512 * 1024 * 1024):
+        self.path = path
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._size: int | None = None
+        self._puts = 0
+
+    @staticmethod
+    def key(method: str, url: str, data: dict | None = None) -> str:
+        body = json.dumps(data, sort_keys=True, default=str) if data else ""
+        return hashlib.sha256(f"{method.upper()} {url}\n{body}".encode()).hexdigest()
+
+    def get(self, key: str) -> CacheEntry | None:
+        body_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path) as file:
+                meta = json.load(file)
+            with open(body_path, "rb") as file:
+                content = file.read()
+            os.utime(body_path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+
+        return CacheEntry(content=content, **meta)
+
+    def put(self, key: str, response: requests.Response, ttl: float | None):
+        now = time.time()
+        entry = CacheEntry(
+            url=response.url,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            stored_at=now,
+            expires_at=now + ttl if ttl is not None else None,
+            content=response.content,
+        )
+
+        body_path, _ = self._paths(key)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+
+        with self._lock:
+            # other processes sharing the directory change its size too, so the count is synced with the disk now
+            # and then and always before evicting
+            self._puts += 1
+            if self._size is None or self._puts % self.SYNC_PUTS == 0:
+                self._size = self._disk_size()
+            previous_size = os.path.getsize(body_path) if os.path.exists(body_path) else 0
+            self._write(key, entry)
+
+            self._size += len(entry.content) - previous_size
+            if self._size > self.max_size:
+                self._size = self._disk_size()
+                if self._size > self.max_size:
+                    self._evict()
+
+    def refresh(self, key: str, ttl: float | None):
+        """
+        Restart the freshness lifetime of an entry, used after a successful revalidation.
+        """
+        with self._lock:
+            entry = self.get(key)
+            if entry:
+                entry.stored_at = time.time()
+                entry.expires_at = entry.stored_at + ttl if ttl is not None else None
+                self._write(key, entry, content=False)
+
+    def pin(self, key: str):
+        """
+        Mark an entry as immutable so it's never requested again.
+        """
+        with self._lock:
+            entry = self.get(key)
+            if entry and entry.expires_at is not None:
+                entry.expires_at = None
+                self._write(key, entry, content=False)
+
+    def clear(self):
+        with self._lock:
+            for path in self._entries():
+                self._remove(path)
+            self._size = 0
+
+    ####################################################
+    #                      UTILS                       #
+    ####################################################
+
+    def _paths(self, key: str) -> tuple[str, str]:
+        base = os.path.join(self.path, key[:2], key)
+        return f"{base}.body", f"{base}.json"
+
+    def _write(self, key: str, entry: CacheEntry, content: bool = True):
+        body_path, meta_path = self._paths(key)
+        meta = {k: v for k, v in entry.__dict__.items() if k != "content"}
+        if content:
+            self._atomic_write(body_path, entry.content)
+        self._atomic_write(meta_path, json.dumps(meta).encode())
+
+    @staticmethod
+    def _atomic_write(path: str, content: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        os.replace(tmp_path, path)
+
+    def _entries(self) -> list[str]:
+        if not os.path.isdir(self.path):
+            return []
+        return [os.path.join(root, f) for root, _, files in os.walk(self.path) for f in files if f.endswith(".body")]
+
+    def _disk_size(self) -> int:
+        return sum(os.path.getsize(p) for p in self._entries())
+
+    def _evict(self):
+        assert self._size is not None
+        # drop least recently used entries until we are comfortably under the limit
+        target = self.max_size * 0.9
+        for path in sorted(self._entries(), key=os.path.getmtime):
+            if self._size <= target:
+                break
+            self._size -= os.path.getsize(path)
+            self._remove(path)
+
+    @staticmethod
+    def _remove(body_path: str):
+        for path in [body_path, f"{os.path.splitext(body_path)[0]}.json"]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:  # already removed by another process
+                pass
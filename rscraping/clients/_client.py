@@ -1,24 +1,36 @@
-from collections.abc import Generator
+import re
+from collections.abc import Callable, Generator
 from datetime import date, datetime, timedelta
 from typing import override
 
 import requests
 from parsel.selector import Selector
 
-from rscraping.data.constants import GENDER_FEMALE, GENDER_MALE, HTTP_HEADERS
+from rscraping._timing import stage
+from rscraping.data.constants import GENDER_FEMALE, GENDER_MALE
 from rscraping.data.models import Datasource, Race, RaceName
 from rscraping.parsers.html import HtmlParser
 
+from ._cache import HOUR, CachePolicy
+from ._documents import DocumentCache
 from ._protocol import ClientProtocol
+from ._ratelimit import RateLimit
+from ._transport import Transport
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w-]+)", re.IGNORECASE)
 
 
 class Client(ClientProtocol):
     _registry = {}
     _gender: str = GENDER_MALE
+    _transport: Transport = Transport()  # shared by all the clients unless one is given
+    _documents: DocumentCache
 
     DATASOURCE: Datasource
     FEMALE_START: int
     MALE_START: int
+    CACHE_POLICY: CachePolicy = CachePolicy(default_ttl=HOUR)
+    RATE_LIMIT: RateLimit = RateLimit()
 
     def __init_subclass__(cls, **kwargs):
         source = kwargs.pop("source", None)
@@ -26,12 +38,22 @@ class Client(ClientProtocol):
         if source:
             cls._registry[source] = cls
 
-    def __new__(cls, source: Datasource, gender: str = GENDER_MALE, **_) -> "Client":
+    def __new__(
+        cls,
+        source: Datasource,
+        gender: str = GENDER_MALE,
+        transport: Transport | None = None,
+        documents: DocumentCache | None = None,
+        **_,
+    ) -> "Client":
         subclass = cls._registry[source]
         final_obj = object.__new__(subclass)
         if not final_obj._is_valid_gender(gender):
             raise ValueError(f"invalid {gender}")
         final_obj._gender = gender
+        if transport:
+            final_obj._transport = transport
+        final_obj._documents = documents or DocumentCache()
         return final_obj
 
     @property
@@ -63,17 +85,21 @@ class Client(ClientProtocol):
     def get_race_by_url(self, url: str, race_id: str, **kwargs) -> Race | None:
         self.validate_url(url)
         try:
-            race = self._html_parser.parse_race(
-                selector=Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8")),
-                race_id=race_id,
-                is_female=self.is_female,
-                **kwargs,
-            )
+            selector = self._get_selector(url)
+            with stage(self.DATASOURCE, "parse"):
+                race = self._html_parser.parse_race(
+                    selector=selector,
+                    race_id=race_id,
+                    is_female=self.is_female,
+                    **kwargs,
+                )
         except AssertionError:
             return None
         else:
             if race:
                 race.url = url
+                if race.year < date.today().year:
+                    self._transport.pin("GET", url)
             return race
 
     @override
@@ -82,7 +108,7 @@ class Client(ClientProtocol):
 
         url = self.get_races_url(year, is_female=self.is_female)
         yield from self._html_parser.parse_race_ids(
-            selector=Selector(requests.get(url=url, headers=HTTP_HEADERS()).text),
+            selector=self._get_selector(url),
             is_female=self.is_female,
             **kwargs,
         )
@@ -95,7 +121,7 @@ class Client(ClientProtocol):
 
         url = self.get_races_url(today.year, is_female=self.is_female)
         yield from self._html_parser.parse_race_ids_by_days(
-            selector=Selector(requests.get(url=url, headers=HTTP_HEADERS()).text),
+            selector=self._get_selector(url),
             is_female=self.is_female,
             days=[
                 datetime.combine(last_saturday.date(), datetime.min.time()),
@@ -110,11 +136,53 @@ class Client(ClientProtocol):
 
         url = self.get_races_url(year, is_female=self.is_female)
         yield from self._html_parser.parse_race_names(
-            selector=Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8")),
+            selector=self._get_selector(url),
             is_female=self.is_female,
             **kwargs,
         )
 
+    ####################################################
+    #                      UTILS                       #
+    ####################################################
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        return self._transport.get(url, cache_policy=self.CACHE_POLICY, rate_limit=self.RATE_LIMIT, **kwargs)
+
+    def _post(self, url: str, data: dict, **kwargs) -> requests.Response:
+        return self._transport.post(
+            url, data=data, cache_policy=self.CACHE_POLICY, rate_limit=self.RATE_LIMIT, **kwargs
+        )
+
+    def _get_selector(self, url: str) -> Selector:
+        return self._documents.get_or_load(
+            self._documents.key("GET", url),
+            lambda: self._load_selector(lambda: self._get(url)),
+        )
+
+    def _post_selector(self, url: str, data: dict) -> Selector:
+        return self._documents.get_or_load(
+            self._documents.key("POST", url, data),
+            lambda: self._load_selector(lambda: self._post(url, data=data)),
+        )
+
+    def _load_selector(self, fetch: Callable[[], requests.Response]) -> Selector:
+        with stage(self.DATASOURCE, "fetch"):
+            response = fetch()
+        with stage(self.DATASOURCE, "tree"):
+            return self._to_selector(response)
+
+    @staticmethod
+    def _to_selector(response: requests.Response) -> Selector:
+        """
+        Build the document tree straight from the raw response bytes, so the HTML is not decoded into an intermediate
+        str that parsel would encode back for lxml. The pages are UTF-8 unless the server declares another charset.
+
+        NOTE: The gain is in allocations only (a 4.4 MiB page peaks at 4.4 MiB instead of 17.6 MiB), building the tree
+        takes about the same time either way.
+        """
+        charset = _CHARSET_RE.search(response.headers.get("Content-Type", ""))
+        return Selector(body=response.content, encoding=charset.group(1) if charset else "utf-8")
+
     ####################################################
     #                     ABSTRACT                     #
     ####################################################
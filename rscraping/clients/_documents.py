@@ -0,0 +1,87 @@
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from parsel.selector import Selector
+
+
+class DocumentCache:
+    """
+    Run-scoped cache of parsed documents.
+
+    Keeps the last 'max_size' parsed Selectors in memory so a page requested several times in the same run is only
+    fetched and parsed once. Concurrent callers asking for a document that is still being loaded wait for that load
+    instead of starting a new one.
+
+    Args:
+        max_size (int): Maximum number of documents kept in memory.
+    """
+
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._documents: OrderedDict[str, Selector] = OrderedDict()
+        self._in_flight: dict[str, Future[Selector]] = {}
+
+    @staticmethod
+    def key(method: str, url: str, data: dict | None = None) -> str:
+        return f"{method.upper()} {url} {json.dumps(data, sort_keys=True, default=str) if data else ''}"
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._documents
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._documents)}
+
+    def get_or_load(self, key: str, load: Callable[[], Selector]) -> Selector:
+        """
+        Retrieve the document for the given key, loading it if it's not available.
+
+        Args:
+            key (str): The document key.
+            load (Callable[[], Selector]): Function fetching and parsing the document.
+
+        Returns: Selector: The parsed document.
+        """
+        with self._lock:
+            if key in self._documents:
+                self.hits += 1
+                self._documents.move_to_end(key)
+                return self._documents[key]
+
+            future = self._in_flight.get(key)
+            loading = future is None
+            if loading:
+                self.misses += 1
+                future = self._in_flight[key] = Future()
+            else:
+                self.hits += 1
+        if not loading:
+            return future.result()
+
+        try:
+            document = load()
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._documents[key] = document
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+            self._in_flight.pop(key, None)
+        future.set_result(document)
+        return document
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+            self.hits = self.misses = 0
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from ._ratelimit import RateLimit
+from ._transport import Transport
+
+logger = logging.getLogger(os.path.dirname(os.path.realpath(__file__)))
+
+
+@dataclass
+class Download:
+    url: str
+    path: str
+    sha256: str
+    skipped: bool = False
+
+
+class Downloader:
+    """
+    Concurrent and resumable file downloader.
+
+    Files are streamed to disk while they are downloaded, so they are never fully kept in memory, and only moved to
+    their final path once completed. Every finished download is appended to a manifest in the output folder, so an
+    interrupted run resumes where it stopped, and files with the same content as an already downloaded one are
+    discarded. Files already in the folder but not in the manifest, i.e. saved by an older run, are adopted by the first
+    URL with their name instead of downloaded again. A different file saved with the same name by another URL is kept
+    and the new one gets part of its hash appended to the name.
+
+    Args:
+        transport (Transport): Transport used to fetch the files.
+        output (str): Output folder.
+        max_workers (int): Number of concurrent downloads.
+        rate_limit (RateLimit | None): Throttling for the hosts of the files.
+    """
+
+    MANIFEST = ".manifest.jsonl"
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, transport: Transport, output: str, max_workers: int = 4, rate_limit: RateLimit | None = None):
+        self.transport = transport
+        self.output = output
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit
+
+        self._lock = threading.Lock()
+        self._urls: dict[str, Download] = {}
+        self._hashes: dict[str, str] = {}
+        self._paths: set[str] = set()  # files already claimed by a URL
+
+        os.makedirs(output, exist_ok=True)
+        self._load_manifest()
+        self._load_existing()
+
+    def download(self, files: Iterable[tuple[str, str]]) -> Generator[Download]:
+        """
+        Download the given files, skipping the ones already downloaded.
+
+        Args:
+            files (Iterable[tuple[str, str]]): (url, file name) pairs.
+
+        Yields: Download: The downloaded files as they are completed.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._download, url, name) for url, name in files]
+            for future in as_completed(futures):
+                yield future.result()
+
+    ####################################################
+    #                      UTILS                       #
+    ####################################################
+
+    def _download(self, url: str, name: str) -> Download:
+        path = os.path.join(self.output, name)
+        with self._lock:
+            done = self._urls.get(url)
+            existing = not done and os.path.exists(path) and path not in self._paths
+            if existing:
+                self._paths.add(path)
+        if done and os.path.exists(done.path):
+            return Download(url=url, path=done.path, sha256=done.sha256, skipped=True)
+        if existing:
+            return self._record(url, path, self._file_hash(path), skipped=True)
+
+        sha256 = hashlib.sha256()
+        tmp_path = f"{path}.{threading.get_ident()}.part"  # files from several URLs can have the same name
+        try:
+            with self.transport.stream(url, rate_limit=self.rate_limit) as response, open(tmp_path, "wb") as file:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    sha256.update(chunk)
+                    file.write(chunk)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            # checked and moved under the lock so concurrent downloads of the same content are deduplicated too
+            duplicated = self._hashes.get(sha256.hexdigest())
+            if not duplicated or not os.path.exists(duplicated):
+                if os.path.exists(path) and self._file_hash(path) != sha256.hexdigest():
+                    # a file with the same name but another content, i.e. from another URL
+                    root, ext = os.path.splitext(path)
+                    path = f"{root}_{sha256.hexdigest()[:8]}{ext}"
+                duplicated = self._hashes[sha256.hexdigest()] = path
+                os.replace(tmp_path, path)
+
+        if duplicated != path:
+            logger.info(f"{url=} has the same content as {duplicated}")
+            os.remove(tmp_path)
+            return self._record(url, duplicated, sha256.hexdigest(), skipped=True)
+        return self._record(url, path, sha256.hexdigest())
+
+    def _record(self, url: str, path: str, sha256: str, skipped: bool = False) -> Download:
+        download = Download(url=url, path=path, sha256=sha256, skipped=skipped)
+        with self._lock:
+            self._urls[url] = download
+            self._hashes.setdefault(sha256, path)
+            self._paths.add(path)
+            with open(os.path.join(self.output, self.MANIFEST), "a") as file:
+                file.write(json.dumps({"url": url, "path": path, "sha256": sha256}) + "\n")
+        return download
+
+    def _load_manifest(self):
+        try:
+            with open(os.path.join(self.output, self.MANIFEST)) as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:  # truncated by an interrupted run
+                continue
+            self._urls[entry["url"]] = Download(**entry)
+            self._hashes.setdefault(entry["sha256"], entry["path"])
+            self._paths.add(entry["path"])
+
+    def _load_existing(self):
+        for entry in os.scandir(self.output):
+            if not entry.is_file() or entry.path in self._paths or entry.name == self.MANIFEST:
+                continue
+            if entry.name.endswith(".part"):  # left by an interrupted run
+                continue
+            self._hashes.setdefault(self._file_hash(entry.path), entry.path)
+
+    def _file_hash(self, path: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(self.CHUNK_SIZE), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
@@ -0,0 +1,109 @@
+import os
+import sqlite3
+from collections.abc import Generator
+from contextlib import closing, contextmanager
+
+from ._cache import DEFAULT_CACHE_DIR
+
+
+class RaceYearIndex:
+    """
+    Persistent race ID to year index of a datasource, IDs without a valid race are stored with a None year.
+
+    Invalid IDs after the last valid race may be races that are not published yet, so they are never stored and the
+    ones left by older runs are dropped, they need to be probed again on each run.
+
+    The index is kept in a SQLite database so it survives between runs and can be shared by concurrent processes, each
+    operation uses its own short lived connection and SQLite takes care of the locking.
+
+    Args:
+        datasource (str): The datasource of the indexed IDs.
+        path (str): The database file.
+    """
+
+    def __init__(self, datasource: str, path: str = os.path.join(DEFAULT_CACHE_DIR, "race_years.sqlite")):
+        self.datasource = datasource
+        self.path = path
+
+        self._initialized = False
+
+    def __contains__(self, race_id: int | str) -> bool:
+        return self._fetchone("SELECT 1 FROM race_years WHERE datasource = ? AND race_id = ?", race_id) is not None
+
+    def __getitem__(self, race_id: int | str) -> int | None:
+        row = self._fetchone("SELECT year FROM race_years WHERE datasource = ? AND race_id = ?", race_id)
+        if row is None:
+            raise KeyError(race_id)
+        return row[0]
+
+    def __setitem__(self, race_id: int | str, year: int | None):
+        with self._connect() as conn:
+            if year is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO race_years (datasource, race_id, year) VALUES (?, ?, ?)",
+                    (self.datasource, int(race_id), year),
+                )
+                return
+
+            # only kept when a later valid race shows the ID is not just unpublished
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO race_years (datasource, race_id, year)
+                SELECT :datasource, :race_id, NULL
+                WHERE EXISTS (
+                    SELECT 1 FROM race_years WHERE datasource = :datasource AND race_id > :race_id AND year IS NOT NULL
+                )
+                """,
+                {"datasource": self.datasource, "race_id": int(race_id)},
+            )
+
+    def items(self) -> dict[int, int | None]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT race_id, year FROM race_years WHERE datasource = ?", (self.datasource,))
+            return dict(rows.fetchall())
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM race_years WHERE datasource = ?", (self.datasource,))
+
+    ####################################################
+    #                      UTILS                       #
+    ####################################################
+
+    def _fetchone(self, query: str, race_id: int | str) -> tuple | None:
+        with self._connect() as conn:
+            return conn.execute(query, (self.datasource, int(race_id))).fetchone()
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection]:
+        """
+        Open a connection for a single transaction, committed (or rolled back) and closed on exit.
+        """
+        if not self._initialized:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS race_years (
+                        datasource TEXT NOT NULL,
+                        race_id INTEGER NOT NULL,
+                        year INTEGER,
+                        PRIMARY KEY (datasource, race_id)
+                    )
+                    """
+                )
+                conn.execute(
+                    """
+                    DELETE FROM race_years
+                    WHERE year IS NULL AND race_id > (
+                        SELECT COALESCE(MAX(v.race_id), 0) FROM race_years v
+                        WHERE v.datasource = race_years.datasource AND v.year IS NOT NULL
+                    )
+                    """
+                )
+            self._initialized = True
+
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            yield conn
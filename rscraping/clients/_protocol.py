@@ -1,4 +1,4 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Protocol
 
 from rscraping.data.constants import GENDER_MALE
@@ -120,3 +120,75 @@ class ClientProtocol(Protocol):
         Return the URL for retrieving details of a specific race.
         """
         ...
+
+
+class AsyncClientProtocol(Protocol):
+    DATASOURCE: Datasource
+
+    async def get_race_by_id(self, race_id: str, **kwargs) -> Race | None:
+        """
+        Coroutine version of ClientProtocol.get_race_by_id.
+
+        Args:
+            race_id (str): The ID of the race.
+            **kwargs: Additional keyword arguments.
+
+        Returns: Race | None: The parsed race details or None if the race is not found.
+        """
+        ...
+
+    async def get_race_ids_by_year(self, year: int, **kwargs) -> list[str]:
+        """
+        Coroutine version of ClientProtocol.get_race_ids_by_year.
+
+        Args:
+            year (int): The year for which to find the IDs.
+            **kwargs: Additional keyword arguments.
+
+        Returns: list[str]: Race IDs.
+        """
+        ...
+
+    async def get_race_names_by_year(self, year: int, **kwargs) -> list[RaceName]:
+        """
+        Coroutine version of ClientProtocol.get_race_names_by_year.
+
+        Args:
+            year (int): The year for which find the names.
+            **kwargs: Additional keyword arguments.
+
+        Returns: list[RaceName]: Race names.
+        """
+        ...
+
+    async def get_last_weekend_race_ids(self, **kwargs) -> list[str]:
+        """
+        Coroutine version of ClientProtocol.get_last_weekend_race_ids.
+
+        Returns: list[str]: Race IDs.
+        """
+        ...
+
+    def get_races_by_ids(self, race_ids: list[str], **kwargs) -> AsyncGenerator[Race]:
+        """
+        Retrieve the races for the given IDs concurrently.
+
+        Args:
+            race_ids (list[str]): The IDs of the races.
+            **kwargs: Additional keyword arguments.
+
+        Yields: Race: Each race as soon as it's retrieved, not in the given order.
+        """
+        ...
+
+    def get_races_by_year(self, year: int, **kwargs) -> AsyncGenerator[Race]:
+        """
+        Retrieve all the races that took place in a given year concurrently.
+
+        Args:
+            year (int): The year for which to find the races.
+            **kwargs: Additional keyword arguments.
+
+        Yields: Race: Each race as soon as it's retrieved, not in the given order.
+        """
+        ...
@@ -0,0 +1,91 @@
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Throttling rules for a host.
+
+    Args:
+        rate (float): Sustained requests per second.
+        burst (int): Requests that can be sent at once after an idle period.
+        max_concurrency (int): Maximum number of in-flight requests.
+    """
+
+    rate: float = 2
+    burst: int = 4
+    max_concurrency: int = 4
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a token is available and consume it.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Per host token-bucket rate limiter with a concurrency cap.
+
+    Each host gets its own bucket the first time it's requested, using the explicitly configured limit for that host
+    or the one given with the request.
+
+    Args:
+        limits (dict[str, RateLimit] | None): Explicit limits by host, they take precedence over the requested ones.
+        default (RateLimit): Limit for hosts without any other configuration.
+    """
+
+    def __init__(self, limits: dict[str, RateLimit] | None = None, default: RateLimit = RateLimit()):
+        self.limits = limits or {}
+        self.default = default
+
+        self._lock = threading.Lock()
+        self._hosts: dict[str, tuple[TokenBucket, threading.BoundedSemaphore]] = {}
+
+    @contextmanager
+    def acquire(self, url: str, rate_limit: RateLimit | None = None) -> Generator[None]:
+        """
+        Wait for a free slot in the host of the given URL, the slot is held until the context is exited.
+
+        Args:
+            url (str): The URL to request.
+            rate_limit (RateLimit | None): Limit to use for the host if it's not configured yet.
+        """
+        bucket, semaphore = self._host(urlsplit(url).netloc, rate_limit)
+        with semaphore:
+            bucket.acquire()
+            yield
+
+    def _host(self, host: str, rate_limit: RateLimit | None) -> tuple[TokenBucket, threading.BoundedSemaphore]:
+        with self._lock:
+            if host not in self._hosts:
+                limit = self.limits.get(host, rate_limit or self.default)
+                self._hosts[host] = (
+                    TokenBucket(limit.rate, limit.burst),
+                    threading.BoundedSemaphore(limit.max_concurrency),
+                )
+            return self._hosts[host]
@@ -0,0 +1,110 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+
+
+class CircuitOpenException(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry rules for failed requests.
+
+    Args:
+        retries (int): Maximum number of retries after the first attempt.
+        backoff (float): Base delay in seconds, doubled on each retry.
+        max_backoff (float): Upper bound for the delay between retries.
+        statuses (frozenset[int]): Response status codes considered transient failures.
+    """
+
+    retries: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 10
+    statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """
+        Jittered exponential delay for the given attempt, honoring the server 'Retry-After' when it's given in seconds.
+        """
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the requests so a failing datasource doesn't multiply the load we send to it.
+
+    Each request deposits 'ratio' tokens and each retry withdraws a whole one.
+
+    Args:
+        ratio (float): Retries allowed per request.
+        max_tokens (float): Retries that can be spent at once, also the initial balance.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """
+    Per host circuit breaker.
+
+    After 'failure_threshold' consecutive failures the circuit of a host opens and every request fails fast with a
+    CircuitOpenException. Once 'reset_timeout' seconds have passed a single trial request is let through, closing the
+    circuit again if it succeeds.
+
+    Args:
+        failure_threshold (int): Consecutive failures needed to open the circuit.
+        reset_timeout (float): Seconds to wait before trying an open host again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+
+    def check(self, host: str):
+        """
+        Raise a CircuitOpenException if the host circuit is open.
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return
+            if time.monotonic() - opened_at < self.reset_timeout:
+                raise CircuitOpenException(f"circuit open for {host=}")
+            # half-open: let this request through and wait for another timeout before the next trial
+            self._opened_at[host] = time.monotonic()
+
+    def success(self, host: str):
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+
+    def failure(self, host: str):
+        with self._lock:
+            self._failures[host] = self._failures.get(host, 0) + 1
+            if self._failures[host] >= self.failure_threshold:
+                self._opened_at[host] = time.monotonic()
@@ -0,0 +1,223 @@
+import time
+from collections.abc import Generator
+from contextlib import ExitStack, contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rscraping.data.constants import HTTP_HEADERS
+
+from ._archive import ResponseArchive
+from ._cache import CachePolicy, ResponseCache
+from ._ratelimit import RateLimit, RateLimiter
+from ._retry import CircuitBreaker, RetryBudget, RetryPolicy
+
+
+class Transport:
+    """
+    HTTP transport shared by the clients.
+
+    Keeps a keep-alive connection pool per host so consecutive requests to the same datasource reuse the already
+    opened sockets instead of doing a new TCP+TLS handshake for each page.
+
+    Network failures (timeouts, connection errors and transient 5xx statuses) are retried with a jittered exponential
+    backoff while the retry budget allows it, and a per host circuit breaker fails fast while a datasource is down.
+
+    With an archive every response is recorded into it, or, if the archive is in replay mode, served from it without
+    touching the network.
+
+    Args:
+        pool_size (int): Maximum number of connections kept alive for each host.
+        max_hosts (int): Number of host pools kept at the same time.
+        timeout (tuple[float, float]): Default (connect, read) timeouts in seconds.
+        cache (ResponseCache | None): Optional on-disk cache for the responses.
+        rate_limiter (RateLimiter | None): Per host throttling, a default one is used when not given.
+        retry_policy (RetryPolicy): Retry rules for failed requests.
+        retry_budget (RetryBudget | None): Shared retry budget, a default one is used when not given.
+        circuit_breaker (CircuitBreaker | None): Per host circuit breaker, a default one is used when not given.
+        archive (ResponseArchive | None): Optional archive where the responses are recorded or replayed from.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_hosts: int = 10,
+        timeout: tuple[float, float] = (5, 30),
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        archive: ResponseArchive | None = None,
+    ):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy
+        self.retry_budget = retry_budget or RetryBudget()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.archive = archive
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_hosts, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: dict | None = None,
+        cache_policy: CachePolicy | None = None,
+        bypass_cache: bool = False,
+        rate_limit: RateLimit | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request through the pooled session.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            data (dict | None): The form data to send in the body.
+            cache_policy (CachePolicy | None): Freshness rules used to store the response in the cache.
+            bypass_cache (bool): Ignore the cache and always hit the network.
+            rate_limit (RateLimit | None): Throttling for the host if the rate limiter doesn't have one configured.
+            **kwargs: Additional keyword arguments forwarded to 'requests'.
+
+        Returns: requests.Response: The response.
+
+        Raises:
+            ArchiveMissException: If replaying an archive that doesn't have the request.
+        """
+        if self.archive and self.archive.replay:
+            return self.archive.get(method, url, data)
+
+        response = self._cached_request(method, url, data, cache_policy, bypass_cache, rate_limit, **kwargs)
+        if self.archive:
+            self.archive.record(method, url, data, response)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, data: dict | None = None, **kwargs) -> requests.Response:
+        return self.request("POST", url, data=data, **kwargs)
+
+    @contextmanager
+    def stream(self, url: str, rate_limit: RateLimit | None = None, **kwargs) -> Generator[requests.Response]:
+        """
+        Stream the body of a GET request, used for binary downloads.
+
+        The response skips the cache and the archive, as both would read the whole body into memory, and the rate
+        limiter slot of the host is held until the context is exited, so the body is downloaded within the slot.
+
+        Args:
+            url (str): The URL to request.
+            rate_limit (RateLimit | None): Throttling for the host if the rate limiter doesn't have one configured.
+            **kwargs: Additional keyword arguments forwarded to 'requests'.
+
+        Yields: requests.Response: The response with its body not read yet, closed on exit.
+        """
+        with ExitStack() as slot, self._send("GET", url, rate_limit=rate_limit, slot=slot, stream=True, **kwargs) as r:
+            yield r
+
+    def pin(self, method: str, url: str, data: dict | None = None):
+        """
+        Mark a cached response as immutable, used when we know the page will never change (i.e. past races).
+        """
+        if self.cache:
+            self.cache.pin(self.cache.key(method, url, data))
+
+    def close(self):
+        self._session.close()
+        if self.archive:
+            self.archive.close()
+
+    def _cached_request(
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        cache_policy: CachePolicy | None,
+        bypass_cache: bool,
+        rate_limit: RateLimit | None,
+        **kwargs,
+    ) -> requests.Response:
+        if not self.cache or bypass_cache:
+            return self._send(method, url, data=data, rate_limit=rate_limit, **kwargs)
+
+        key = self.cache.key(method, url, data)
+        ttl = cache_policy.ttl(url) if cache_policy else CachePolicy().ttl(url)
+
+        entry = self.cache.get(key)
+        if entry and entry.is_fresh:
+            return entry.to_response()
+
+        if entry:
+            kwargs["headers"] = entry.validators | kwargs.get("headers", {})
+        response = self._send(method, url, data=data, rate_limit=rate_limit, **kwargs)
+
+        if entry and response.status_code == 304:
+            self.cache.refresh(key, ttl)
+            return entry.to_response()
+        if response.status_code == 200:
+            self.cache.put(key, response, ttl)
+        return response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: dict | None = None,
+        rate_limit: RateLimit | None = None,
+        slot: ExitStack | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send the request to the network, retrying transient failures.
+
+        The rate limiter slot is released once the response headers are received, unless a 'slot' stack is given, then
+        the slot of the returned response is moved into it and held until the stack is closed.
+
+        Raises:
+            CircuitOpenException: If the host circuit is open.
+            requests.HTTPError: If the response still has a transient failure status after all the retries.
+            requests.RequestException: If the request still fails after all the retries.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        headers = HTTP_HEADERS() | kwargs.pop("headers", {})
+        host = urlsplit(url).netloc
+
+        self.retry_budget.deposit()
+        attempt = 0
+        while True:
+            self.circuit_breaker.check(host)
+            try:
+                with ExitStack() as attempt_slot:
+                    attempt_slot.enter_context(self.rate_limiter.acquire(url, rate_limit))
+                    response = self._session.request(method, url, data=data, headers=headers, **kwargs)
+                    if slot is not None and response.status_code not in self.retry_policy.statuses:
+                        slot.enter_context(attempt_slot.pop_all())
+            except (requests.ConnectionError, requests.Timeout):
+                self.circuit_breaker.failure(host)
+                if not self._can_retry(attempt):
+                    raise
+                time.sleep(self.retry_policy.delay(attempt))
+            else:
+                if response.status_code not in self.retry_policy.statuses:
+                    self.circuit_breaker.success(host)
+                    return response
+
+                self.circuit_breaker.failure(host)
+                # closed so a streamed body doesn't keep its pooled connection while waiting
+                response.close()
+                if not self._can_retry(attempt):
+                    response.raise_for_status()
+                time.sleep(self.retry_policy.delay(attempt, response.headers.get("Retry-After")))
+            attempt += 1
+
+    def _can_retry(self, attempt: int) -> bool:
+        return attempt < self.retry_policy.retries and self.retry_budget.withdraw()
@@ -4,6 +4,8 @@ from typing import override
 from rscraping.data.models import Datasource
 from rscraping.parsers.html import ACTHtmlParser
 
+from ._async_client import AsyncClient
+from ._cache import HOUR, CachePolicy
 from ._client import Client
 
 
@@ -11,6 +13,7 @@ class ACTClient(Client, source=Datasource.ACT):
     DATASOURCE = Datasource.ACT
     MALE_START = 2003
     FEMALE_START = 2009
+    CACHE_POLICY = CachePolicy(rules=[(r"index\.php\?t=(?P<year>\d{4})", HOUR)], default_ttl=HOUR)
 
     @property
     def _html_parser(self) -> ACTHtmlParser:
@@ -39,3 +42,7 @@ class ACTClient(Client, source=Datasource.ACT):
 
         if not pattern.match(url):
             raise ValueError(f"invalid {url=}")
+
+
+class ACTAsyncClient(AsyncClient, source=Datasource.ACT):
+    DATASOURCE = Datasource.ACT
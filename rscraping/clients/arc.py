@@ -4,6 +4,8 @@ from typing import override
 from rscraping.data.models import Datasource
 from rscraping.parsers.html import ARCHtmlParser
 
+from ._async_client import AsyncClient
+from ._cache import HOUR, CachePolicy
 from ._client import Client
 
 
@@ -11,6 +13,7 @@ class ARCClient(Client, source=Datasource.ARC):
     DATASOURCE = Datasource.ARC
     MALE_START = 2009
     FEMALE_START = 2018
+    CACHE_POLICY = CachePolicy(rules=[(r"/calendario/(?P<year>\d{4})", HOUR)], default_ttl=HOUR)
 
     @property
     def _html_parser(self) -> ARCHtmlParser:
@@ -38,3 +41,7 @@ class ARCClient(Client, source=Datasource.ARC):
 
         if not pattern.match(url):
             raise ValueError(f"invalid {url=}")
+
+
+class ARCAsyncClient(AsyncClient, source=Datasource.ARC):
+    DATASOURCE = Datasource.ARC
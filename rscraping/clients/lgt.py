@@ -1,17 +1,21 @@
 import re
+from bisect import bisect_left
 from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from typing import override
 
-import requests
 from parsel.selector import Selector
 
 from pyutils.strings import whitespaces_clean
-from rscraping.data.constants import HTTP_HEADERS
+from rscraping._timing import in_context
 from rscraping.data.models import Datasource, Race, RaceName
 from rscraping.parsers.html import LGTHtmlParser
 
+from ._async_client import AsyncClient
 from ._client import Client
+from ._index import RaceYearIndex
+from ._transport import Transport
 
 
 class LGTClient(Client, source=Datasource.LGT):
@@ -73,6 +77,7 @@ class LGTClient(Client, source=Datasource.LGT):
 
     DATASOURCE = Datasource.LGT
     MALE_START = FEMALE_START = 2020
+    RACE_YEARS = RaceYearIndex(datasource=Datasource.LGT.value)
 
     @property
     def _html_parser(self) -> LGTHtmlParser:
@@ -83,16 +88,21 @@ class LGTClient(Client, source=Datasource.LGT):
         return f"https://www.ligalgt.com/principal/regata/{race_id}"
 
     @staticmethod
-    def get_results_selector(race_id: str) -> Selector:
-        url = "https://www.ligalgt.com/ajax/principal/ver_resultados.php"
-        data = {"liga_id": 1, "regata_id": race_id}
-        return Selector(requests.post(url=url, headers=HTTP_HEADERS(), data=data).content.decode("utf-8"))
+    def get_results_selector(race_id: str, transport: Transport | None = None) -> Selector:
+        """
+        Args:
+            race_id (str): The race to retrieve the results from.
+            transport (Transport | None): The transport used to fetch the results, the shared one by default.
+        """
+        return LGTClient._post_with(transport, LGTClient._RESULTS_URL, LGTClient._results_data(race_id))
 
     @staticmethod
-    def get_calendar_selector() -> Selector:
-        url = "https://www.ligalgt.com/ajax/principal/regatas.php"
-        data = {"lng": "es"}
-        return Selector(requests.post(url=url, headers=HTTP_HEADERS(), data=data).content.decode("utf-8"))
+    def get_calendar_selector(transport: Transport | None = None) -> Selector:
+        """
+        Args:
+            transport (Transport | None): The transport used to fetch the calendar, the shared one by default.
+        """
+        return LGTClient._post_with(transport, LGTClient._CALENDAR_URL, LGTClient._CALENDAR_DATA)
 
     @override
     def validate_url(self, url: str):
@@ -111,32 +121,67 @@ class LGTClient(Client, source=Datasource.LGT):
         if race_id in self._excluded_ids:
             return None
 
-        kwargs["results_selector"] = self.get_results_selector(race_id)
         return super().get_race_by_id(race_id, **kwargs)
 
     @override
     def get_race_by_url(self, url: str, race_id: str, **kwargs):
+        """
+        Retrieve the details of a race, the details page and the results are both needed so they are fetched at the
+        same time.
+        """
         if race_id in self._excluded_ids:
             return None
 
-        kwargs["results_selector"] = self.get_results_selector(race_id)
-        return super().get_race_by_url(url, race_id, **kwargs)
+        self.validate_url(url)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = executor.submit(in_context(self._get_results_selector), race_id)
+            self._get_selector(url)  # loaded in the document cache while the results are fetched
+            kwargs["results_selector"] = results.result()
+
+        race = super().get_race_by_url(url, race_id, **kwargs)
+        if race and race.year < date.today().year:
+            self._transport.pin("POST", self._RESULTS_URL, data=self._results_data(race_id))
+        return race
 
     @override
     def get_race_names_by_year(self, year: int, **_) -> Generator[RaceName]:
         today = date.today().year
         if today == year:
-            race_names = self._html_parser.parse_race_names(selector=self.get_calendar_selector())
+            race_names = self._html_parser.parse_race_names(selector=self._get_calendar_selector())
             if race_names:
                 yield from race_names
                 return
 
-        for id in self.get_race_ids_by_year(year, is_female=self.is_female):
-            url = self.get_race_details_url(id)
-            selector = Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8"))
-            if self._html_parser.is_valid_race(selector):
-                name = self._html_parser.get_name(selector)
-                yield RaceName(race_id=id, name=whitespaces_clean(name).upper())
+        race_ids = list(self.get_race_ids_by_year(year, is_female=self.is_female))
+
+        # skip the IDs the season search already found to be invalid
+        known = self.RACE_YEARS.items()
+        race_ids = [i for i in race_ids if int(i) not in known or known[int(i)]]
+
+        # pages already loaded while searching the season are parsed first so they are reused before being evicted
+        loaded = {
+            i: self._get_race_name(i)
+            for i in race_ids
+            if self._documents.key("GET", self.get_race_details_url(i)) in self._documents
+        }
+
+        # only a few pages are fetched ahead, so a consumer stopping early doesn't wait for the whole season
+        window = self.RATE_LIMIT.max_concurrency * 2
+        pending = iter([i for i in race_ids if i not in loaded])
+        futures: dict[str, Future[RaceName | None]] = {}
+        get_race_name = in_context(self._get_race_name)
+        with ThreadPoolExecutor(max_workers=self.RATE_LIMIT.max_concurrency) as executor:
+            try:
+                for race_id in race_ids:
+                    while len(futures) < window and (next_id := next(pending, None)) is not None:
+                        futures[next_id] = executor.submit(get_race_name, next_id)
+
+                    race_name = loaded[race_id] if race_id in loaded else futures.pop(race_id).result()
+                    if race_name:
+                        yield race_name
+            finally:
+                for future in futures.values():
+                    future.cancel()
 
     @override
     def get_race_ids_by_year(self, year: int, **_) -> Generator[str]:
@@ -144,7 +189,10 @@ class LGTClient(Client, source=Datasource.LGT):
         Find the IDs of the races that took place in a given year.
 
         As the LGT datasource doesn't give us an easy way of retrieving the races for a given year we need to bruteforce
-        it, this method will do a binary search for the 'upper' and 'lower' bounds of a season.
+        it, this method will search for the 'upper' and 'lower' bounds of a season (see _find_season_bounds).
+
+        The years of the probed IDs are kept in a persistent index (RACE_YEARS), so the searches start from the bounds
+        already known and only the IDs missing from the index are fetched.
 
         We also need to ignore a hole ton of useless IDs (_excluded_ids) that are not used or have invalid information.
 
@@ -159,41 +207,13 @@ class LGTClient(Client, source=Datasource.LGT):
         """
         today = date.today().year
         if today == year:
-            race_ids = self._html_parser.parse_race_ids(selector=self.get_calendar_selector())
+            race_ids = self._html_parser.parse_race_ids(selector=self._get_calendar_selector())
             if race_ids:
                 yield from race_ids
                 return
 
         self.validate_year(year)
-        since = self.MALE_START
-
-        # asume 20 races per year for lower bound and 50 for the upper bound
-        left, right = (year - since) * 20, (today - since + 1) * 50
-        while left <= right:
-            mid = left + (right - left) // 2
-            while mid in self._excluded_ids and mid > (left + 1):
-                mid -= 1
-
-            race_year = self._get_race_year(str(mid))
-            if not race_year or race_year < year:
-                left = mid + 1
-            else:
-                right = mid - 1
-        lower_race_id = left
-
-        # asume 30 races per year for lower bound and 50 for the upper bound
-        left, right = (year - since) * 30, (today - since + 1) * 50
-        while left <= right:
-            mid = left + (right - left) // 2
-            while mid in self._excluded_ids and mid < (right - 1):
-                mid += 1
-
-            race_year = self._get_race_year(str(mid))
-            if not race_year or race_year > year:
-                right = mid - 1
-            else:
-                left = mid + 1
-        upper_race_id = right
+        lower_race_id, upper_race_id = self._find_season_bounds(year)
 
         yield from (str(r) for r in range(lower_race_id, (upper_race_id + 1)) if r not in self._excluded_ids)
 
@@ -204,7 +224,7 @@ class LGTClient(Client, source=Datasource.LGT):
         last_sunday = today - timedelta(days=(today.weekday()) % 7 + 1)
 
         yield from self._html_parser.parse_race_ids_by_days(
-            selector=self.get_calendar_selector(),
+            selector=self._get_calendar_selector(),
             is_female=self.is_female,
             days=[
                 datetime.combine(last_saturday.date(), datetime.min.time()),
@@ -217,18 +237,130 @@ class LGTClient(Client, source=Datasource.LGT):
     #                      UTILS                       #
     ####################################################
 
-    _RACE_YEARS: dict[str, int | None] = {}
+    _RESULTS_URL = "https://www.ligalgt.com/ajax/principal/ver_resultados.php"
+    _CALENDAR_URL = "https://www.ligalgt.com/ajax/principal/regatas.php"
+    _CALENDAR_DATA = {"lng": "es"}
+
+    @staticmethod
+    def _results_data(race_id: str) -> dict:
+        return {"liga_id": 1, "regata_id": race_id}
+
+    @staticmethod
+    def _post_with(transport: Transport | None, url: str, data: dict) -> Selector:
+        transport = transport or Client._transport
+        response = transport.post(url, data=data, cache_policy=LGTClient.CACHE_POLICY, rate_limit=LGTClient.RATE_LIMIT)
+        return Client._to_selector(response)
+
+    def _get_results_selector(self, race_id: str) -> Selector:
+        return self._post_selector(self._RESULTS_URL, data=self._results_data(race_id))
+
+    def _get_calendar_selector(self) -> Selector:
+        return self._post_selector(self._CALENDAR_URL, data=self._CALENDAR_DATA)
+
+    def _find_season_bounds(self, year: int) -> tuple[int, int]:
+        """
+        Find the first and last IDs of a season.
+
+        Each round interpolates, out of the years of the IDs already known, where the season starts and ends and probes
+        several IDs around both estimates concurrently, until there are no unknown IDs left between the seasons.
+        Invalid and excluded IDs say nothing about the season so they are never used to narrow the search, except for
+        a run of invalid IDs right after the last known race that marks the end of the data. The invalid IDs indexed
+        after the last valid race may have been published since, so they are probed again on each search.
+
+        Args:
+            year (int): The year of the season.
+
+        Returns: tuple[int, int]: The first and last IDs of the season, can be invalid IDs.
+        """
+        known = self.RACE_YEARS.items()
+        last_indexed = max((i for i, y in known.items() if y), default=0)
+        known = {i: y for i, y in known.items() if y or i < last_indexed}
+
+        end = (date.today().year - self.MALE_START + 1) * 50 + 1
+        probes_per_bound = self.RATE_LIMIT.max_concurrency
+        get_race_year = in_context(lambda i: self._get_race_year(str(i)))
+
+        with ThreadPoolExecutor(max_workers=probes_per_bound) as executor:
+            while True:
+                valid = {i: y for i, y in known.items() if y}
+                last_valid = max(valid, default=0)
+
+                # a few invalid IDs in a row after the last known race mean there is no more data
+                following = [i for i in range(last_valid + 1, end) if i not in self._excluded_ids][:3]
+                if following and all(i in known for i in following):
+                    end = following[0]
+                # until the end is confirmed, keep probing under the first invalid ID after the last race
+                right = min([end, *(i for i, y in known.items() if not y and i > last_valid)])
+
+                # brackets (known before, known in or after) and (known in or before, known after) the season
+                lower = (
+                    max((i for i, y in valid.items() if y < year), default=0),
+                    min([right, *(i for i, y in valid.items() if y >= year)]),
+                )
+                upper = (
+                    max((i for i, y in valid.items() if y <= year), default=0),
+                    min([right, *(i for i, y in valid.items() if y > year)]),
+                )
+
+                probes = self._season_probes(lower, year, valid, known, probes_per_bound)
+                probes |= self._season_probes(upper, year + 1, valid, known, probes_per_bound)
+                if last_valid and upper[1] == right:
+                    # gallop after the last known race in case the invalid ones were just a gap
+                    galloping = (last_valid + 2**n for n in range(2, probes_per_bound + 2))
+                    probes |= {i for i in [*following, *galloping] if i < end and i not in known}
+                if not probes:
+                    return lower[0] + 1, upper[1] - 1
+
+                probes = sorted(probes)
+                known.update(zip(probes, executor.map(get_race_year, probes)))
+
+    def _season_probes(
+        self,
+        bracket: tuple[int, int],
+        year: int,
+        valid: dict[int, int],
+        known: dict[int, int | None],
+        count: int,
+    ) -> set[int]:
+        """
+        Unknown IDs to probe inside the bracket, spread around the interpolated ID where the given year starts.
+        """
+        left, right = bracket
+        candidates = [i for i in range(left + 1, right) if i not in known and i not in self._excluded_ids]
+        if len(candidates) <= count:
+            return set(candidates)
+
+        estimate = left + (right - left) // 2
+        if left in valid and right in valid and valid[right] > valid[left]:
+            # races are roughly evenly spread along the season, so each known ID is taken as the middle of its season
+            ratio = (year - valid[left] - 0.5) / (valid[right] - valid[left])
+            estimate = left + round((right - left) * min(1, max(0, ratio)))
+
+        step = len(candidates) // (count + 1)
+        offset = bisect_left(candidates, estimate) - step * (count + 1) // 2
+        return {candidates[min(len(candidates) - 1, max(0, offset + step * (n + 1)))] for n in range(count)}
+
+    def _get_race_name(self, race_id: str) -> RaceName | None:
+        selector = self._get_selector(self.get_race_details_url(race_id))
+        if race_id not in self.RACE_YEARS:
+            self.RACE_YEARS[race_id] = self._parse_race_year(selector)
+        if not self._html_parser.is_valid_race(selector):
+            return None
+        return RaceName(race_id=race_id, name=whitespaces_clean(self._html_parser.get_name(selector)).upper())
 
     def _get_race_year(self, race_id: str) -> int | None:
-        if race_id in self._RACE_YEARS:
-            return self._RACE_YEARS[race_id]
+        if race_id in self.RACE_YEARS:
+            return self.RACE_YEARS[race_id]
 
         url = self.get_race_details_url(race_id)
-        selector = Selector(requests.get(url=url, headers=HTTP_HEADERS()).text)
+        race_year = self.RACE_YEARS[race_id] = self._parse_race_year(self._get_selector(url))
+        return race_year
+
+    def _parse_race_year(self, selector: Selector) -> int | None:
         if not self._html_parser.is_valid_race(selector):
-            self._RACE_YEARS[race_id] = None
             return None
-        race_year = self._html_parser.get_date(selector).year
+        return self._html_parser.get_date(selector).year
 
-        self._RACE_YEARS[race_id] = race_year
-        return race_year
+
+class LGTAsyncClient(AsyncClient, source=Datasource.LGT):
+    DATASOURCE = Datasource.LGT
@@ -1,10 +1,15 @@
+import logging
+import os
 import re
 from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import date
 from typing import override
 
 import requests
 from parsel.selector import Selector
 
+from rscraping._timing import in_context, stage
 from rscraping.data.constants import (
     CATEGORY_ABSOLUT,
     CATEGORY_SCHOOL,
@@ -12,17 +17,25 @@ from rscraping.data.constants import (
     GENDER_FEMALE,
     GENDER_MALE,
     GENDER_MIX,
-    HTTP_HEADERS,
 )
 from rscraping.data.models import Club, Datasource, Race, RaceName
-from rscraping.parsers.html import TrainerasHtmlParser
+from rscraping.parsers.html import MultiRaceException, TrainerasHtmlParser
 
+from ._async_client import AsyncClient
+from ._cache import HOUR, CachePolicy
 from ._client import Client
+from ._ratelimit import RateLimit
+from ._retry import CircuitOpenException
+
+logger = logging.getLogger(os.path.dirname(os.path.realpath(__file__)))
 
 
 class TrainerasClient(Client, source=Datasource.TRAINERAS):
     DATASOURCE = Datasource.TRAINERAS
     MALE_START = FEMALE_START = 1960
+    CACHE_POLICY = CachePolicy(rules=[(r"/regatas/(?P<year>\d{4})", HOUR)], default_ttl=HOUR)
+    RATE_LIMIT = RateLimit(rate=1, burst=2, max_concurrency=2)
+    PAGES_FAN_OUT = 2  # concurrent page requests when paginating
 
     _category: str = CATEGORY_ABSOLUT
 
@@ -96,7 +109,7 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
         Yields: str: Race IDs.
         """
         url = self.get_flag_url(flag_id)
-        content = Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8"))
+        content = self._get_selector(url)
         yield from self._html_parser.parse_flag_race_ids(content, gender=self._gender, category=self._category)
 
     @override
@@ -115,22 +128,71 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
         if not race:
             return None
 
-        # search the race name in the flags seach page
-        url = self.get_search_races_url(race.name)
-        content = Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8"))
-        flag_urls = self._html_parser.parse_searched_flag_urls(content)
+        self._set_edition(race, self._get_flag_editions(race.name))
+        return race
 
-        if len(flag_urls) < 1:
-            return race
+    def get_races_by_ids(self, race_ids: list[str], **kwargs) -> Generator[Race]:
+        """
+        Retrieve the details of several races at once parsing data from 'traineras.es'.
 
-        # the first flag should be an exact match of the given one, so we can use it to get the editions
-        content = Selector(requests.get(url=flag_urls[0], headers=HTTP_HEADERS()).content.decode("utf-8"))
-        editions = self._html_parser.parse_flag_editions(content, gender=self._gender, category=self._category)
-        edition = next((e for (y, e) in editions if y == race.year), None)
-        if edition:
-            race.normalized_names = [(n[0], edition) for n in race.normalized_names]
+        The race pages are fetched concurrently and grouped by their normalized names. The editions of each flag are
+        looked up in the same pool as soon as its first race is parsed, so they are only retrieved once for all the
+        races that share it. Multi-race pages are parsed into a race for each day.
 
-        return race
+        Args:
+            race_ids (list[str]): The IDs of the races.
+            **kwargs: Additional keyword arguments.
+
+        Yields: Race: The parsed race details in the given order, races not found or failing to load are skipped.
+        """
+
+        def get_races(race_id: str) -> list[Race]:
+            try:
+                # skip the flag lookup of each race, the editions are resolved below once per flag
+                race = Client.get_race_by_id(self, race_id, **kwargs)
+                return [race] if race else []
+            except MultiRaceException:
+                return self._get_race_days(race_id, **kwargs)
+
+        races: dict[str, list[Race]] = {}
+        editions: dict[tuple[str, ...], Future[dict[int, int]]] = {}
+        with ThreadPoolExecutor(max_workers=self.RATE_LIMIT.max_concurrency) as executor:
+            futures = {executor.submit(in_context(get_races), race_id): race_id for race_id in race_ids}
+            get_flag_editions = in_context(self._get_flag_editions)
+
+            for future in as_completed(futures):
+                race_id = futures[future]
+                try:
+                    races[race_id] = future.result()
+                except (requests.RequestException, CircuitOpenException) as e:
+                    logger.error(f"unable to load {race_id=}: {e}")
+                    continue
+
+                for race in races[race_id]:
+                    flag = self._flag_key(race)
+                    if flag not in editions:
+                        editions[flag] = executor.submit(get_flag_editions, flag[0] if flag else race.name)
+
+            for race in (r for race_id in race_ids for r in races.get(race_id, [])):
+                self._set_edition(race, editions[self._flag_key(race)].result())
+
+        yield from (race for race_id in race_ids for race in races.get(race_id, []))
+
+    def get_race_days_by_id(self, race_id: str, **kwargs) -> list[Race]:
+        """
+        Retrieve all the races (days) of a multi-race page with a single fetch.
+
+        Args:
+            race_id (str): The ID of the race.
+            **kwargs: Additional keyword arguments.
+
+        Returns: list[Race]: A race for each day in the page.
+        """
+        races = self._get_race_days(race_id, **kwargs)
+        editions = self._get_flag_editions(races[0].name) if races else {}
+        for race in races:
+            self._set_edition(race, editions)
+        return races
 
     @override
     def get_race_names_by_year(self, year: int, **_) -> Generator[RaceName]:
@@ -146,9 +208,7 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
 
     @override
     def get_race_ids_by_club(self, club_id: str, year: int, **kwargs) -> Generator[str]:
-        content = requests.get(url=self.get_club_races_url(club_id, year), headers=HTTP_HEADERS())
-        content = content.content.decode("utf-8")
-        return self._html_parser.parse_club_race_ids(Selector(content))
+        return self._html_parser.parse_club_race_ids(self._get_selector(self.get_club_races_url(club_id, year)))
 
     def get_race_ids_by_rower(self, rower_id: str, year: str | None = None, **_) -> Generator[str]:
         """
@@ -160,17 +220,85 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
 
         Yields: str: Race IDs associated with the rower.
         """
-        content = requests.get(url=self.get_rower_url(rower_id), headers=HTTP_HEADERS()).content.decode("utf-8")
-        yield from self._html_parser.parse_rower_race_ids(Selector(content), year=year)
+        yield from self._html_parser.parse_rower_race_ids(self._get_selector(self.get_rower_url(rower_id)), year=year)
 
     def get_club_details_by_url(self, url: str, **kwargs) -> Club | None:
-        selector = Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8"))
+        selector = self._get_selector(url)
         return self._html_parser.parse_club_details(selector, **kwargs)
 
+    def get_race_selector(self, race_id: str) -> Selector:
+        """
+        Args:
+            race_id (str): The ID of the race.
+
+        Returns: Selector: The race details page.
+        """
+        return self._get_selector(self.get_race_details_url(race_id))
+
+    def get_gallery_selector(self, url: str) -> Selector:
+        """
+        Args:
+            url (str): The URL of a participant image gallery, as linked from the race details page.
+
+        Returns: Selector: The gallery page.
+        """
+        return self._get_selector(url)
+
+    def _get_race_days(self, race_id: str, **kwargs) -> list[Race]:
+        url = self.get_race_details_url(race_id)
+        try:
+            selector = self._get_selector(url)
+            with stage(self.DATASOURCE, "parse"):
+                races = self._html_parser.parse_races(selector, race_id=race_id, **kwargs)
+        except AssertionError:
+            return []
+
+        for race in races:
+            race.url = url
+        if races and races[0].year < date.today().year:
+            self._transport.pin("GET", url)
+        return races
+
+    @staticmethod
+    def _flag_key(race: Race) -> tuple[str, ...]:
+        return tuple(n for (n, _) in race.normalized_names)
+
+    def _get_flag_editions(self, name: str) -> dict[int, int]:
+        """
+        Find the editions of the flag matching the given race name.
+
+        Args:
+            name (str): The name of the race.
+
+        Returns: dict[int, int]: The edition of the flag for each year.
+        """
+        # search the race name in the flags seach page
+        content = self._get_selector(self.get_search_races_url(name))
+        flag_urls = self._html_parser.parse_searched_flag_urls(content)
+
+        if len(flag_urls) < 1:
+            return {}
+
+        # the first flag should be an exact match of the given one, so we can use it to get the editions
+        content = self._get_selector(flag_urls[0])
+        editions: dict[int, int] = {}
+        for year, edition in self._html_parser.parse_flag_editions(content, self._gender, self._category):
+            editions.setdefault(year, edition)  # the first edition listed for a year wins
+        return editions
+
+    @staticmethod
+    def _set_edition(race: Race, editions: dict[int, int]):
+        edition = editions.get(race.year)
+        if edition:
+            race.normalized_names = [(n[0], edition) for n in race.normalized_names]
+
     def _get_pages(self, year: int) -> Generator[Selector]:
         """
         Generate Selector objects for each page of races in a specific year.
 
+        The first page is yielded as soon as it's loaded, the rest are fetched concurrently ('PAGES_FAN_OUT' at a time)
+        and yielded in order.
+
         Args:
             year (int): The year for which to generate race pages.
 
@@ -178,11 +306,18 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
         """
 
         def get_page_selector(page: int) -> Selector:
-            url = self.get_races_url(year, page=page)
-            content = requests.get(url, headers=HTTP_HEADERS()).content.decode("utf-8")
-            return Selector(content)
+            return self._get_selector(self.get_races_url(year, page=page))
 
         first_page = get_page_selector(1)
+        yield first_page
+
         total_pages = self._html_parser.get_number_of_pages(first_page)
-        for page_number in range(2, total_pages + 1):
-            yield get_page_selector(page_number)
+        if total_pages < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.PAGES_FAN_OUT) as executor:
+            yield from executor.map(in_context(get_page_selector), range(2, total_pages + 1))
+
+
+class TrainerasAsyncClient(AsyncClient, source=Datasource.TRAINERAS):
+    DATASOURCE = Datasource.TRAINERAS
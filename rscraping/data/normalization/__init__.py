@@ -40,3 +40,8 @@ from .penalty import (
     retrieve_penalty_times as retrieve_penalty_times,
 )
 from .lemmatize import lemmatize as lemmatize
+from ._memo import (
+    enable_memoization as enable_memoization,
+    clear_memoization as clear_memoization,
+    memoization_stats as memoization_stats,
+)
@@ -0,0 +1,114 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+_enabled = False
+_MISSING = object()
+
+
+class _LRUCache:
+    """
+    Bounded least recently used cache of the results of a normalization function.
+
+    Args:
+        max_size (int): Maximum number of results kept.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._values: OrderedDict[Any, Any] = OrderedDict()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._values), "max_size": self.max_size}
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            value = self._values.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._values.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any):
+        with self._lock:
+            self._values[key] = value
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self.hits = self.misses = 0
+
+
+_CACHES: dict[str, _LRUCache] = {}
+
+
+def memoized[**P, T](
+    max_size: int = 1024,
+    copy: Callable[[T], T] | None = None,
+) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """
+    Keep the results of a pure normalization function while the memoization is enabled, otherwise the function is
+    called straight away.
+
+    Args:
+        max_size (int): Maximum number of results kept for the function.
+        copy (Callable[[T], T] | None): Copies the kept result before returning it, for mutable results.
+
+    Returns: Callable[[Callable[P, T]], Callable[P, T]]: The decorator.
+    """
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        # qualified so functions with the same name in different modules don't share their stats
+        cache = _CACHES[f"{func.__module__}.{func.__qualname__}"] = _LRUCache(max_size)
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            if not _enabled:
+                return func(*args, **kwargs)
+
+            key = (args, tuple(kwargs.items())) if kwargs else args
+            value = cache.get(key)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return copy(value) if copy else value
+
+        return wrapper
+
+    return decorator
+
+
+def enable_memoization(enabled: bool = True):
+    """
+    Enable or disable the memoization of the normalization functions, the kept results are cleared either way.
+    """
+    global _enabled
+    _enabled = enabled
+    clear_memoization()
+
+
+def clear_memoization():
+    """
+    Drop the kept results and statistics of every normalization function, needed when the normalization tables change.
+    """
+    for cache in _CACHES.values():
+        cache.clear()
+
+
+def memoization_stats() -> dict[str, dict[str, int]]:
+    """
+    Returns: dict[str, dict[str, int]]: Hits, misses, size and max size of the cache of each normalization function,
+        by the qualified name of the function.
+    """
+    return {name: cache.stats for name, cache in _CACHES.items()}
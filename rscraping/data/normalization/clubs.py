@@ -9,6 +9,8 @@ from pyutils.strings import (
 from rscraping.data.checks import is_branch_club
 from rscraping.data.models import Race
 
+from ._memo import memoized
+
 _ENTITY_TITLES_SHORT = [
     "AD",
     "AE",
@@ -137,6 +139,7 @@ _KNOWN_SPONSORS = [
 ]
 
 
+@memoized(max_size=2048)
 def normalize_club_name(name: str) -> str:
     """
     Normalize a club name to a standard format
@@ -1,6 +1,8 @@
 from pyutils.strings import match_normalization
 from rscraping.data.checks import is_act, is_arc, is_ete, is_lgt, is_play_off
 
+from ._memo import memoized
+
 __LEAGUES_MAP = {
     "LIGA GALEGA DE TRAIÑAS": [["LGT"]],
     "LIGA GALEGA DE TRAIÑAS A": [["LIGA", "A"]],
@@ -26,6 +28,7 @@ def normalize_league_name(name: str, is_female: bool = False) -> str:
     return match_normalization(name, leagues)
 
 
+@memoized(max_size=512)
 def find_league(name: str) -> str | None:
     """
     Find the league of a competition by its name.
@@ -13,6 +13,8 @@ from pyutils.strings import (
 )
 from rscraping.data.checks import is_play_off
 
+from ._memo import memoized
+
 _MISSPELLINGS = {
     "": ["RECICLAMOS LA LUZ", " AE ", "EXCMO", "ILTMO"],
     "IKURRIÑA": ["IKURIÑA", "IKURINA", "IÑURRIÑA"],
@@ -77,6 +79,7 @@ _NORMALIZED_RACES = {
 }
 
 
+@memoized(copy=list)
 def normalize_name_parts(name: str) -> list[tuple[str, int | None]]:
     """
     Normalize the name to a list of (name, edition)
@@ -108,6 +111,7 @@ def normalize_name_parts(name: str) -> list[tuple[str, int | None]]:
     return parts
 
 
+@memoized()
 def normalize_race_name(name: str) -> str:
     """
     Normalize race name to a standard format
@@ -7,6 +7,8 @@ from pyutils.strings import (
 )
 from rscraping.data.constants import SYNONYM_BAY, SYNONYM_BEACH, SYNONYM_PORT, SYNONYMS
 
+from ._memo import memoized
+
 _NORMALIZED_TOWNS = {
     "A POBRA DO CARAMIÑAL": [["POBRA"], ["PUEBLA"]],
     "RIVEIRA": [["RIVEIRA"], ["RIBEIRA"]],
@@ -21,6 +23,7 @@ _PROVINCES = [
     "CANTABRIA",
 ]
 
+@memoized(max_size=512)
 def normalize_town(town: str) -> str:
     """
     Normalize a town name to a standard format
@@ -1,4 +1,5 @@
-from ._protocol import HtmlParser as HtmlParser
+from ._protocol import HtmlBackend as HtmlBackend, HtmlParser as HtmlParser
+from ._row import ParticipantRow as ParticipantRow
 from .act import ACTHtmlParser as ACTHtmlParser
 from .arc import ARCHtmlParser as ARCHtmlParser
 from .lgt import LGTHtmlParser as LGTHtmlParser
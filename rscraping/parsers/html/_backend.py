@@ -0,0 +1,105 @@
+from typing import Any, SupportsIndex, overload
+
+from lxml import etree
+from parsel.selector import Selector, SelectorList
+
+
+class LxmlNode:
+    """
+    Bare lxml result with the parts of the parsel Selector interface used by the parsers, so reading a value doesn't
+    need a Selector for each matched node.
+
+    Args:
+        root (Any): The lxml element, string or number matched by a query.
+    """
+
+    __slots__ = ("root", "__weakref__")
+
+    def __init__(self, root: Any):
+        self.root = root
+
+    def __repr__(self) -> str:
+        return f"LxmlNode({self.root!r})"
+
+    def get(self) -> str:
+        """
+        Serialize the matched node as parsel does.
+        """
+        if isinstance(self.root, str):
+            return self.root
+        try:
+            return etree.tostring(self.root, method="html", encoding="unicode", with_tail=False)
+        except (AttributeError, TypeError):
+            if self.root is True:
+                return "1"
+            if self.root is False:
+                return "0"
+            return str(self.root)
+
+    def xpath(self, query: str, **variables) -> "LxmlNodeList":
+        return LxmlBackend.wrap(self.root.xpath(query, smart_strings=False, **variables))
+
+
+class LxmlNodeList(list[LxmlNode]):
+    """
+    List of LxmlNode behaving as a parsel SelectorList.
+    """
+
+    @overload
+    def __getitem__(self, pos: SupportsIndex) -> LxmlNode: ...
+
+    @overload
+    def __getitem__(self, pos: slice) -> "LxmlNodeList": ...
+
+    def __getitem__(self, pos: SupportsIndex | slice) -> "LxmlNode | LxmlNodeList":
+        item = super().__getitem__(pos)
+        return LxmlNodeList(item) if isinstance(pos, slice) else item
+
+    @overload
+    def get(self, default: None = None) -> str | None: ...
+
+    @overload
+    def get(self, default: str) -> str: ...
+
+    def get(self, default: str | None = None) -> str | None:
+        return self[0].get() if self else default
+
+    def getall(self) -> list[str]:
+        return [node.get() for node in self]
+
+
+type HtmlNode = Selector | LxmlNode
+type HtmlNodeList = SelectorList[Selector] | LxmlNodeList
+
+
+class ParselBackend:
+    """
+    Wraps each result in a parsel Selector, the same objects a Selector.xpath call returns.
+    """
+
+    NAME = "parsel"
+
+    def select(self, xpath: etree.XPath, query: str, node: HtmlNode, **variables) -> SelectorList[Selector]:
+        result = xpath(node.root, **variables)
+        if type(result) is not list:
+            result = [result]
+        return SelectorList(Selector(root=r, _expr=query, type="html") for r in result)
+
+
+class LxmlBackend:
+    """
+    Returns the lxml results as they are, skipping the type detection and wrapping parsel does for each of them.
+    """
+
+    NAME = "lxml"
+
+    def select(self, xpath: etree.XPath, query: str, node: HtmlNode, **variables) -> LxmlNodeList:
+        return self.wrap(xpath(node.root, **variables))
+
+    @staticmethod
+    def wrap(result: Any) -> LxmlNodeList:
+        return LxmlNodeList(LxmlNode(r) for r in result) if type(result) is list else LxmlNodeList([LxmlNode(result)])
+
+
+PARSEL = ParselBackend()
+LXML = LxmlBackend()
@@ -2,10 +2,13 @@ from collections.abc import Generator
 from datetime import datetime
 from typing import Protocol
 
+from lxml import etree
 from parsel.selector import Selector
 
 from rscraping.data.models import Datasource, Race, RaceName
 
+from ._backend import HtmlNode, HtmlNodeList
+
 
 class HtmlParser(Protocol):
     DATASOURCE: Datasource
@@ -58,3 +61,21 @@ class HtmlParser(Protocol):
         Yields: RaceName: The names of the races.
         """
         ...
+
+
+class HtmlBackend(Protocol):
+    NAME: str
+
+    def select(self, xpath: etree.XPath, query: str, node: HtmlNode, **variables) -> HtmlNodeList:
+        """
+        Evaluate a compiled XPath over the tree of the given node.
+
+        Args:
+            xpath (etree.XPath): The compiled expression.
+            query (str): The source of the expression.
+            node (HtmlNode): The node the expression is evaluated from.
+            **variables: Values of the $variables used in the expression.
+
+        Returns: HtmlNodeList: The matched nodes, with the get/getall interface of a parsel SelectorList.
+        """
+        ...
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from ._backend import HtmlNode
+
+
+@dataclass(frozen=True, slots=True)
+class ParticipantRow:
+    """
+    Participant row of a results table, its cells are read once when the row is extracted so the getters don't need to
+    query the row again.
+
+    Args:
+        selector (HtmlNode): The row node, for the values not kept in the record.
+        lane (int | None): Lane of the participant.
+        series (int): Series of the participant, 0 if unknown.
+        name (str): Cleaned club name of the participant.
+        cells (tuple[str, ...]): Texts of the row cells.
+    """
+
+    selector: HtmlNode
+    lane: int | None
+    series: int
+    name: str
+    cells: tuple[str, ...]
@@ -0,0 +1,113 @@
+from dataclasses import dataclass, field
+from weakref import WeakKeyDictionary
+
+from lxml import etree
+
+from ._backend import PARSEL, HtmlNode, HtmlNodeList
+from ._protocol import HtmlBackend
+
+
+class XPath:
+    """
+    XPath expression compiled once and evaluated over the tree of the given Selectors.
+
+    Args:
+        query (str): The XPath expression, it can use $variables whose values are given when it's evaluated.
+        backend (HtmlBackend): Wraps the results of the expression, parsel Selectors by default.
+    """
+
+    def __init__(self, query: str, backend: HtmlBackend = PARSEL):
+        self.query = query
+        self.backend = backend
+        self._xpath = etree.XPath(query, smart_strings=False)
+
+    def __repr__(self) -> str:
+        return f"XPath({self.query!r})"
+
+    def __call__(self, selector: HtmlNode, **variables) -> HtmlNodeList:
+        return self.backend.select(self._xpath, self.query, selector, **variables)
+
+    def matches(self, selector: HtmlNode, **variables) -> bool:
+        return bool(self._xpath(selector.root, **variables))
+
+
+@dataclass(frozen=True)
+class LayoutProfile:
+    """
+    Variant of the pages of a datasource.
+
+    Args:
+        name (str): Name of the profile.
+        match (str): Expression only true for the pages with this layout.
+        paths (dict[str, str]): Expressions that change in this layout.
+    """
+
+    name: str
+    match: str
+    paths: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Layout:
+    name: str
+    paths: dict[str, XPath]
+
+    def __getitem__(self, name: str) -> XPath:
+        return self.paths[name]
+
+
+class XPathRegistry:
+    """
+    Compiled XPath expressions of a datasource grouped in layout profiles.
+
+    Pages of a datasource don't always share the same structure, each profile replaces the expressions that change in
+    one of its variants. The layout of a document is detected the first time it's requested and kept while its Selector
+    is alive, so later lookups go straight to the right expressions instead of probing the alternatives.
+
+    Args:
+        paths (dict[str, str]): Expressions of the default layout.
+        profiles (list[LayoutProfile]): Page variants, the first one matching a document is used.
+        backend (HtmlBackend): Wraps the results of the expressions, parsel Selectors by default.
+    """
+
+    def __init__(
+        self,
+        paths: dict[str, str],
+        profiles: list[LayoutProfile] | None = None,
+        backend: HtmlBackend = PARSEL,
+    ):
+        self.backend = backend
+        self.default = Layout(name="default", paths={name: XPath(query, backend) for name, query in paths.items()})
+
+        self._paths, self._raw_profiles = paths, profiles or []
+        self._profiles: list[tuple[XPath, Layout]] = []
+        for profile in self._raw_profiles:
+            assert all(name in paths for name in profile.paths), f"{profile.name}: unknown paths in the profile"
+            layout_paths = self.default.paths | {name: XPath(query, backend) for name, query in profile.paths.items()}
+            self._profiles.append((XPath(profile.match), Layout(name=profile.name, paths=layout_paths)))
+
+        self._layouts: WeakKeyDictionary[HtmlNode, Layout] = WeakKeyDictionary()
+
+    def __getitem__(self, name: str) -> XPath:
+        return self.default[name]
+
+    def with_backend(self, backend: HtmlBackend) -> "XPathRegistry":
+        """
+        Copy of the registry with the same expressions and profiles whose results are wrapped by the given backend.
+        """
+        return XPathRegistry(self._paths, profiles=self._raw_profiles, backend=backend)
+
+    def layout(self, selector: HtmlNode) -> Layout:
+        """
+        Retrieve the layout of the given document.
+
+        Args:
+            selector (HtmlNode): The document.
+
+        Returns: Layout: The first profile matching the document or the default one.
+        """
+        layout = self._layouts.get(selector)
+        if layout is None:
+            layout = next((layout for match, layout in self._profiles if match.matches(selector)), self.default)
+            self._layouts[selector] = layout
+        return layout
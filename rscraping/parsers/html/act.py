@@ -8,6 +8,7 @@ from typing import override
 from parsel.selector import Selector
 
 from pyutils.strings import find_date, remove_parenthesis, whitespaces_clean
+from rscraping._timing import stage
 from rscraping.data.checks import is_play_off
 from rscraping.data.constants import (
     CATEGORY_ABSOLUT,
@@ -30,6 +31,8 @@ from rscraping.data.normalization import (
 )
 
 from ._protocol import HtmlParser
+from ._row import ParticipantRow
+from ._xpath import XPathRegistry
 
 logger = logging.getLogger(os.path.dirname(os.path.realpath(__file__)))
 
@@ -37,51 +40,78 @@ logger = logging.getLogger(os.path.dirname(os.path.realpath(__file__)))
 class ACTHtmlParser(HtmlParser):
     DATASOURCE = Datasource.ACT
 
+    _XPATHS = XPathRegistry(
+        {
+            "race_urls": '//*[@id="col-a"]/div/section/div[5]/table/tbody/tr[*]/td[*]/a/@href',
+            "race_rows": '//*[@id="col-a"]/div/section/div[5]/table/tbody/tr[*]',
+            "race_links": '//*[@id="col-a"]/div/section/div[5]/table/tbody/tr[*]/td[*]/a',
+            "race_row_url": ".//td[2]/a/@href",
+            "race_row_date": ".//td[4]/text()",
+            "link_url": "./@href",
+            "link_text": ".//text()",
+            "name": '//*[@id="col-a"]/div/section/div[1]/h3/text()',
+            "town": '//*[@id="col-a"]/div/section/div[2]/table/tbody/tr/td[2]/text()',
+            "organizer": '//*[@id="col-a"]/div/section/div[2]/table/tbody/tr/td[1]/text()',
+            "laps_rows": '//*[@id="col-a"]/div/section/div[3]/div[2]/div/table/tbody/tr',
+            "cancelled": '//*[@id="col-a"]/div/section/div[1]/p/span/text()',
+            "series_tables": '//*[@id="col-a"]/div/section/div[*]/div[2]/div/table/tbody',
+            "series_names": ".//tr/td[2]/text()",
+            "series_rows": "./tr[*]",
+            "row_lane": ".//td[1]/text()",
+            "row_name": ".//td[2]/text()",
+            "row_cells": ".//td/text()",
+        }
+    )
+
     @override
     def parse_race(self, selector: Selector, *, race_id: str, is_female: bool, **_) -> Race:
-        name = self.get_name(selector)
-        assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
+        with stage(self.DATASOURCE, "header"):
+            name = self.get_name(selector)
+            assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
 
-        t_date = find_date(name)
-        assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
+            t_date = find_date(name)
+            assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
 
-        normalized_names = normalize_name_parts(normalize_race_name(name))
-        normalized_names = [
-            self._normalizations(remove_day_indicator(n), is_female=is_female, year=t_date.year, edition=e)
-            for (n, e) in normalized_names
-        ]
-        assert len(normalized_names) > 0, f"{self.DATASOURCE}: unable to normalize {name=}"
-        logger.info(f"{self.DATASOURCE}: found race {t_date}::{name}")
+            normalized_names = normalize_name_parts(normalize_race_name(name))
+            normalized_names = [
+                self._normalizations(remove_day_indicator(n), is_female=is_female, year=t_date.year, edition=e)
+                for (n, e) in normalized_names
+            ]
+            assert len(normalized_names) > 0, f"{self.DATASOURCE}: unable to normalize {name=}"
+            logger.info(f"{self.DATASOURCE}: found race {t_date}::{name}")
 
         gender = GENDER_FEMALE if is_female else GENDER_MALE
-        participants = self.get_participants(selector)
-
-        race = Race(
-            name=self.get_name(selector),
-            normalized_names=normalized_names,
-            date=t_date.strftime("%d/%m/%Y"),
-            type=self.get_type(selector, participants),
-            day=self.get_day(selector),
-            modality=RACE_TRAINERA,
-            league=self.get_league(selector, is_female),
-            town=self.get_town(selector),
-            organizer=self.get_organizer(selector),
-            sponsor=find_race_sponsor(self.get_name(selector)),
-            race_ids=[race_id],
-            url=None,
-            gender=gender,
-            category=CATEGORY_ABSOLUT,
-            datasource=self.DATASOURCE.value,
-            cancelled=self.is_cancelled(selector),
-            race_laps=self.get_race_laps(selector),
-            race_lanes=self.get_race_lanes(selector, participants),
-            participants=[],
-        )
+        with stage(self.DATASOURCE, "participants"):
+            participants = self.get_participants(selector)
+
+        with stage(self.DATASOURCE, "race"):
+            race = Race(
+                name=self.get_name(selector),
+                normalized_names=normalized_names,
+                date=t_date.strftime("%d/%m/%Y"),
+                type=self.get_type(selector, participants),
+                day=self.get_day(selector),
+                modality=RACE_TRAINERA,
+                league=self.get_league(selector, is_female),
+                town=self.get_town(selector),
+                organizer=self.get_organizer(selector),
+                sponsor=find_race_sponsor(self.get_name(selector)),
+                race_ids=[race_id],
+                url=None,
+                gender=gender,
+                category=CATEGORY_ABSOLUT,
+                datasource=self.DATASOURCE.value,
+                cancelled=self.is_cancelled(selector),
+                race_laps=self.get_race_laps(selector),
+                race_lanes=self.get_race_lanes(selector, participants),
+                participants=[],
+            )
 
         for row in participants:
             disqualified = self.is_disqualified(row)
             penalty = Penalty(reason=None, disqualification=disqualified) if disqualified else None
-            participant_name = normalize_club_name(self.get_club_name(row)).replace("ACT | ", "")
+            with stage(self.DATASOURCE, "normalization"):
+                participant_name = normalize_club_name(self.get_club_name(row)).replace("ACT | ", "")
             if any(w in participant_name for w in ["CASTRO", "CASTREÑA"]):
                 # HACK: CASTRO URDIALES was renamed to CASTREÑA when the club went down
                 participant_name = "CASTRO URDIALES"
@@ -92,7 +122,7 @@ class ACTHtmlParser(HtmlParser):
                     category=CATEGORY_ABSOLUT,
                     club_name=self.get_club_name(row),
                     lane=self.get_lane(row),
-                    series=self.get_series(selector, row),
+                    series=self.get_series(row),
                     laps=self.get_laps(row),
                     distance=self.get_distance(is_female),
                     handicap=None,
@@ -111,7 +141,7 @@ class ACTHtmlParser(HtmlParser):
 
     @override
     def parse_race_ids(self, selector: Selector, **_) -> Generator[str]:
-        urls = selector.xpath('//*[@id="col-a"]/div/section/div[5]/table/tbody/tr[*]/td[*]/a/@href').getall()
+        urls = self._XPATHS["race_urls"](selector).getall()
         return (url_parts[-1] for url_parts in (url.split("r=") for url in urls))
 
     @override
@@ -119,24 +149,22 @@ class ACTHtmlParser(HtmlParser):
         assert len(days) > 0, "days must have at least one element"
         assert all(d.year == days[0].year for d in days), "all days must be from the same year"
 
-        rows = selector.xpath('//*[@id="col-a"]/div/section/div[5]/table/tbody/tr[*]').getall()
-        selectors = [Selector(r) for r in rows]
+        rows = self._XPATHS["race_rows"](selector)
         return (
-            s.xpath("//*/td[2]/a/@href").get("").split("r=")[-1]
-            for s in selectors
-            if datetime.strptime(s.xpath("//*/td[4]/text()").get(""), "%d-%m-%Y") in days
+            self._XPATHS["race_row_url"](r).get("").split("r=")[-1]
+            for r in rows
+            if datetime.strptime(self._XPATHS["race_row_date"](r).get(""), "%d-%m-%Y") in days
         )
 
     @override
     def parse_race_names(self, selector: Selector, **_) -> Generator[RaceName]:
-        hrefs = selector.xpath('//*[@id="col-a"]/div/section/div[5]/table/tbody/tr[*]/td[*]/a').getall()
-        selectors = [Selector(h) for h in hrefs]
+        hrefs = self._XPATHS["race_links"](selector)
         return (
             RaceName(
-                race_id=s.xpath("//*/@href").get("").split("r=")[-1],
-                name=whitespaces_clean(s.xpath("//*/text()").get("")).upper(),
+                race_id=self._XPATHS["link_url"](h).get("").split("r=")[-1],
+                name=whitespaces_clean(self._XPATHS["link_text"](h).get("")).upper(),
             )
-            for s in selectors
+            for h in hrefs
         )
 
     ####################################################
@@ -144,7 +172,7 @@ class ACTHtmlParser(HtmlParser):
     ####################################################
 
     def get_name(self, selector: Selector) -> str:
-        return whitespaces_clean(selector.xpath('//*[@id="col-a"]/div/section/div[1]/h3/text()').get("")).upper()
+        return whitespaces_clean(self._XPATHS["name"](selector).get("")).upper()
 
     def get_day(self, selector: Selector) -> int:
         name = self.get_name(selector)
@@ -154,7 +182,7 @@ class ACTHtmlParser(HtmlParser):
         matches = re.findall(r"\(?(\dJ|J\d)\)?", name)
         return int(re.findall(r"\d+", matches[0])[0].strip()) if matches else 1
 
-    def get_type(self, selector: Selector, participants: list[Selector]) -> str:
+    def get_type(self, selector: Selector, participants: list[ParticipantRow]) -> str:
         if is_play_off(self.get_name(selector)):
             return RACE_TIME_TRIAL
         lanes = list(self.get_lane(p) for p in participants)
@@ -164,66 +192,74 @@ class ACTHtmlParser(HtmlParser):
         return "ACT" if is_play_off(self.get_name(selector)) else "LIGA EUSKOTREN" if is_female else "EUSKO LABEL LIGA"
 
     def get_town(self, selector: Selector) -> str:
-        value = selector.xpath('//*[@id="col-a"]/div/section/div[2]/table/tbody/tr/td[2]/text()').get("")
+        value = self._XPATHS["town"](selector).get("")
         return normalize_town(value)
 
     def get_organizer(self, selector: Selector) -> str | None:
-        organizer = whitespaces_clean(
-            selector.xpath('//*[@id="col-a"]/div/section/div[2]/table/tbody/tr/td[1]/text()').get("")
-        ).upper()
+        organizer = whitespaces_clean(self._XPATHS["organizer"](selector).get("")).upper()
         return organizer if organizer else None
 
-    def get_race_lanes(self, selector: Selector, participants: list[Selector]) -> int:
+    def get_race_lanes(self, selector: Selector, participants: list[ParticipantRow]) -> int:
         if self.get_type(selector, participants) == RACE_TIME_TRIAL:
             return 1
         lanes = list(self.get_lane(p) for p in participants)
         return max(int(lane) for lane in lanes)
 
     def get_race_laps(self, selector: Selector) -> int | None:
-        columns = selector.xpath('//*[@id="col-a"]/div/section/div[3]/div[2]/div/table/tbody/tr').getall()
-        columns = [Selector(c).xpath("//*/td/text()").getall() for c in columns]
+        rows = self._XPATHS["laps_rows"](selector)
+        columns = [self._XPATHS["row_cells"](r).getall() for r in rows]
         columns = max(len(c) - 3 for c in columns)
         return columns if columns > 1 else None
 
     def is_cancelled(self, selector: Selector) -> bool:
         # race_id=1301303104|1301302999
         # try to find the "No puntuable" text in the header
-        return selector.xpath('//*[@id="col-a"]/div/section/div[1]/p/span/text()').get("").upper() == "NO PUNTUABLE"
+        return self._XPATHS["cancelled"](selector).get("").upper() == "NO PUNTUABLE"
 
-    def get_participants(self, selector: Selector) -> list[Selector]:
-        rows = selector.xpath('//*[@id="col-a"]/div/section/div[*]/div[2]/div/table/tbody/tr[*]').getall()
-        return [Selector(text=t) for t in rows]
+    def get_participants(self, selector: Selector) -> list[ParticipantRow]:
+        participants, series = [], {}
+        for idx, table in enumerate(self._XPATHS["series_tables"](selector), 1):
+            # a club is in the first series it's found
+            for name in self._XPATHS["series_names"](table).getall():
+                series.setdefault(name, idx)
+            participants.extend(self._participant_row(row, series) for row in self._XPATHS["series_rows"](table))
+        return participants
 
-    def get_lane(self, participant: Selector) -> int:
-        lane = participant.xpath("//*/td[1]/text()").get()
-        return int(lane) if lane else 0
+    def get_lane(self, participant: ParticipantRow) -> int:
+        return participant.lane or 0
 
-    def get_club_name(self, participant: Selector) -> str:
-        name = participant.xpath("//*/td[2]/text()").get()
-        return whitespaces_clean(name).upper() if name else ""
+    def get_club_name(self, participant: ParticipantRow) -> str:
+        return participant.name
 
     def get_distance(self, is_female: bool) -> int:
         return 2778 if is_female else 5556
 
-    def get_laps(self, participant: Selector) -> list[str]:
-        laps = participant.xpath("//*/td/text()").getall()[2:-1]
+    def get_laps(self, participant: ParticipantRow) -> list[str]:
+        laps = participant.cells[2:-1]
         return [t.strftime("%M:%S.%f") for t in [normalize_lap_time(e) for e in laps if e] if t is not None]
 
-    def is_disqualified(self, participant: Selector) -> bool:
+    def is_disqualified(self, participant: ParticipantRow) -> bool:
         # race_id=1647864823
         # try to find the "Descal" text in the final crono
-        laps = participant.xpath("//*/td/text()").getall()[2:-1]
+        laps = participant.cells[2:-1]
         return whitespaces_clean(laps[-1]) == "Descal"
 
-    def get_series(self, selector: Selector, participant: Selector) -> int:
-        series = 1
-        searching_name = participant.xpath("//*/td[2]/text()").get("")
-        for table in selector.xpath('//*[@id="col-a"]/div/section/div[*]/div[2]/div/table/tbody').getall():
-            for p in Selector(table).xpath("//*/tr/td[2]/text()").getall():
-                if p == searching_name:
-                    return series
-            series += 1
-        return 0
+    def get_series(self, participant: ParticipantRow) -> int:
+        return participant.series
+
+    ####################################################
+    #                     PRIVATE                      #
+    ####################################################
+
+    def _participant_row(self, row: Selector, series: dict[str, int]) -> ParticipantRow:
+        lane, name = self._XPATHS["row_lane"](row).get(), self._XPATHS["row_name"](row).get()
+        return ParticipantRow(
+            selector=row,
+            lane=int(lane) if lane else 0,
+            series=series.get(name, 0) if name else 0,
+            name=whitespaces_clean(name).upper() if name else "",
+            cells=tuple(self._XPATHS["row_cells"](row).getall()),
+        )
 
     ####################################################
     #                  NORMALIZATION                   #
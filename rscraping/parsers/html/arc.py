@@ -8,6 +8,7 @@ from typing import override
 from parsel.selector import Selector
 
 from pyutils.strings import find_date, remove_parenthesis, whitespaces_clean
+from rscraping._timing import stage
 from rscraping.data.checks import is_play_off
 from rscraping.data.constants import (
     CATEGORY_ABSOLUT,
@@ -30,6 +31,8 @@ from rscraping.data.normalization import (
 )
 
 from ._protocol import HtmlParser
+from ._row import ParticipantRow
+from ._xpath import LayoutProfile, XPathRegistry
 
 logger = logging.getLogger(os.path.dirname(os.path.realpath(__file__)))
 
@@ -37,48 +40,89 @@ logger = logging.getLogger(os.path.dirname(os.path.realpath(__file__)))
 class ARCHtmlParser(HtmlParser):
     DATASOURCE = Datasource.ARC
 
+    _XPATHS = XPathRegistry(
+        {
+            "race_urls": '//*[@id="main"]/div[4]/table/tbody/tr[*]/td[2]/span/a/@href',
+            "race_rows": '//*[@id="main"]/div[4]/table/tbody/tr[*]',
+            "race_links": '//*[@id="main"]/div[4]/table/tbody/tr[*]/td[2]/span/a',
+            "race_row_date": ".//td[1]/span/text()",
+            "race_row_url": ".//td[2]/span/a/@href",
+            "link_url": "./@href",
+            "link_text": ".//text()",
+            "name": '//*[@id="main"]/div[2]/div[1]/h2/text()',
+            "date": '//*[@id="main"]/div[2]/div[2]/div[1]/div[1]/ul/li[1]/text()',
+            "league": '//*[@id="main"]/h1/span/span/text()',
+            "town": '//*[@id="main"]/div[2]/div[2]/div[1]/div[1]/ul/li[4]/text()',
+            "race_format": '//*[@id="main"]/div[2]/div[2]/div[1]/div[1]/ul/li[3]/text()',
+            "series_tables": '//*[@id="widget-resultados"]/div/div[3]/div/table',
+            "series_rows": "./tbody/tr",
+            "final_times_rows": '//*[@id="widget-resultados"]/div/div[1]/div[2]/div/table/tbody/tr',
+            "final_time": ".//td[3]/text()",
+            "row_lane": ".//th/text()",
+            "row_name": ".//td[1]/span/a/text()",
+            "row_cells": ".//td/text()",
+        },
+        profiles=[
+            # the listing of the current season starts with the upcoming races
+            LayoutProfile(
+                name="upcoming_races",
+                match='//*[@id="proximas-regatas"]',
+                paths={
+                    "race_urls": '//*[@id="main"]/div[6]/table/tbody/tr[*]/td[2]/span/a/@href',
+                    "race_rows": '//*[@id="main"]/div[6]/table/tbody/tr[*]',
+                    "race_links": '//*[@id="main"]/div[6]/table/tbody/tr[*]/td[2]/span/a',
+                },
+            ),
+        ],
+    )
+
     @override
     def parse_race(self, selector: Selector, *, race_id: str, is_female: bool, **_) -> Race:
-        name = self.get_name(selector)
-        assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
+        with stage(self.DATASOURCE, "header"):
+            name = self.get_name(selector)
+            assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
 
-        t_date = self.get_date(selector)
-        assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
+            t_date = self.get_date(selector)
+            assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
 
-        normalized_names = normalize_name_parts(normalize_race_name(name))
-        normalized_names = [(remove_day_indicator(n), e) for (n, e) in normalized_names]
-        assert len(normalized_names) > 0, f"{self.DATASOURCE}: unable to normalize {name=}"
-        logger.info(f"{self.DATASOURCE}: found race {t_date}::{name}")
+            normalized_names = normalize_name_parts(normalize_race_name(name))
+            normalized_names = [(remove_day_indicator(n), e) for (n, e) in normalized_names]
+            assert len(normalized_names) > 0, f"{self.DATASOURCE}: unable to normalize {name=}"
+            logger.info(f"{self.DATASOURCE}: found race {t_date}::{name}")
 
         gender = GENDER_FEMALE if is_female else GENDER_MALE
-        participants = self.get_participants(selector)
-
-        race = Race(
-            name=self.get_name(selector),
-            normalized_names=normalized_names,
-            date=t_date.strftime("%d/%m/%Y"),
-            type=self.get_type(participants),
-            day=self.get_day(selector),
-            modality=RACE_TRAINERA,
-            league=self.get_league(selector, is_female),
-            town=self.get_town(selector),
-            organizer=None,
-            sponsor=find_race_sponsor(self.get_name(selector)),
-            race_ids=[race_id],
-            url=None,
-            gender=gender,
-            category=CATEGORY_ABSOLUT,
-            datasource=self.DATASOURCE.value,
-            cancelled=self.is_cancelled(selector),
-            race_laps=self.get_race_laps(selector),
-            race_lanes=self.get_race_lanes(selector),
-            participants=[],
-        )
+        with stage(self.DATASOURCE, "participants"):
+            participants = self.get_participants(selector)
+
+        with stage(self.DATASOURCE, "race"):
+            race = Race(
+                name=self.get_name(selector),
+                normalized_names=normalized_names,
+                date=t_date.strftime("%d/%m/%Y"),
+                type=self.get_type(participants),
+                day=self.get_day(selector),
+                modality=RACE_TRAINERA,
+                league=self.get_league(selector, is_female),
+                town=self.get_town(selector),
+                organizer=None,
+                sponsor=find_race_sponsor(self.get_name(selector)),
+                race_ids=[race_id],
+                url=None,
+                gender=gender,
+                category=CATEGORY_ABSOLUT,
+                datasource=self.DATASOURCE.value,
+                cancelled=self.is_cancelled(selector),
+                race_laps=self.get_race_laps(selector),
+                race_lanes=self.get_race_lanes(selector),
+                participants=[],
+            )
 
+        final_times = self.get_final_times(selector)
         for row in participants:
-            disqualified = self.is_disqualified(selector, row)
+            disqualified = self.is_disqualified(row, final_times)
             penalty = Penalty(reason=None, disqualification=disqualified) if disqualified else None
-            participant_name = normalize_club_name(self.get_club_name(row))
+            with stage(self.DATASOURCE, "normalization"):
+                participant_name = normalize_club_name(self.get_club_name(row))
             if "CASTRO " in participant_name:
                 # HACK: CASTRO URDIALES, CASTRO and CASTREÑA differentiation
                 if t_date.year < 2013:
@@ -94,7 +138,7 @@ class ARCHtmlParser(HtmlParser):
                     category=CATEGORY_ABSOLUT,
                     club_name=self.get_club_name(row),
                     lane=self.get_lane(row),
-                    series=self.get_series(selector, row),
+                    series=self.get_series(row),
                     laps=self.get_laps(row),
                     distance=self.get_distance(is_female),
                     handicap=None,
@@ -113,11 +157,7 @@ class ARCHtmlParser(HtmlParser):
 
     @override
     def parse_race_ids(self, selector: Selector, **_) -> Generator[str]:
-        urls = (
-            selector.xpath('//*[@id="main"]/div[6]/table/tbody/tr[*]/td[2]/span/a/@href').getall()
-            if selector.xpath('//*[@id="proximas-regatas"]').get()
-            else selector.xpath('//*[@id="main"]/div[4]/table/tbody/tr[*]/td[2]/span/a/@href').getall()
-        )
+        urls = self._XPATHS.layout(selector)["race_urls"](selector).getall()
         return (url_parts[-2] for url_parts in (url.split("/") for url in urls))
 
     @override
@@ -125,33 +165,23 @@ class ARCHtmlParser(HtmlParser):
         assert len(days) > 0, "days must have at least one element"
         assert all(d.year == days[0].year for d in days), "all days must be from the same year"
 
-        def _find_date(s: Selector) -> datetime | None:
-            maybe_date = f"{whitespaces_clean(s.xpath("//*/td[1]/span/text()").get("")).upper()} {days[0].year}"
+        def _find_date(row: Selector) -> datetime | None:
+            maybe_date = f"{whitespaces_clean(self._XPATHS["race_row_date"](row).get("")).upper()} {days[0].year}"
             found_date = find_date(maybe_date, day_first=True)
             return datetime.combine(found_date, datetime.min.time()) if found_date else None
 
-        rows = (
-            selector.xpath('//*[@id="main"]/div[6]/table/tbody/tr[*]').getall()
-            if selector.xpath('//*[@id="proximas-regatas"]').get()
-            else selector.xpath('//*[@id="main"]/div[4]/table/tbody/tr[*]').getall()
-        )
-        selectors = [Selector(h) for h in rows]
-        return (s.xpath("//*/td[2]/span/a/@href").get("").split("/")[-2] for s in selectors if _find_date(s) in days)
+        rows = self._XPATHS.layout(selector)["race_rows"](selector)
+        return (self._XPATHS["race_row_url"](r).get("").split("/")[-2] for r in rows if _find_date(r) in days)
 
     @override
     def parse_race_names(self, selector: Selector, **_) -> Generator[RaceName]:
-        hrefs = (
-            selector.xpath('//*[@id="main"]/div[6]/table/tbody/tr[*]/td[2]/span/a').getall()
-            if selector.xpath('//*[@id="proximas-regatas"]').get()
-            else selector.xpath('//*[@id="main"]/div[4]/table/tbody/tr[*]/td[2]/span/a').getall()
-        )
-        selectors = [Selector(h) for h in hrefs]
+        hrefs = self._XPATHS.layout(selector)["race_links"](selector)
         return (
             RaceName(
-                race_id=s.xpath("//*/@href").get("").split("/")[-2],
-                name=whitespaces_clean(s.xpath("//*/text()").get("")).upper(),
+                race_id=self._XPATHS["link_url"](h).get("").split("/")[-2],
+                name=whitespaces_clean(self._XPATHS["link_text"](h).get("")).upper(),
             )
-            for s in selectors
+            for h in hrefs
         )
 
     ####################################################
@@ -159,10 +189,10 @@ class ARCHtmlParser(HtmlParser):
     ####################################################
 
     def get_name(self, selector: Selector) -> str:
-        return whitespaces_clean(selector.xpath('//*[@id="main"]/div[2]/div[1]/h2/text()').get("")).upper()
+        return whitespaces_clean(self._XPATHS["name"](selector).get("")).upper()
 
     def get_date(self, selector: Selector) -> date:
-        value = whitespaces_clean(selector.xpath('//*[@id="main"]/div[2]/div[2]/div[1]/div[1]/ul/li[1]/text()').get(""))
+        value = whitespaces_clean(self._XPATHS["date"](selector).get(""))
         value = value.upper().replace("AGO", "AUG")  # want to avoid changing the local
         return datetime.strptime(value, "%d %b %Y").date()
 
@@ -176,84 +206,86 @@ class ARCHtmlParser(HtmlParser):
             return int(matches) if matches <= 2 else 1
         return 1
 
-    def get_type(self, participants: list[Selector]) -> str:
+    def get_type(self, participants: list[ParticipantRow]) -> str:
         lanes = list(self.get_lane(p) for p in participants)
         return RACE_TIME_TRIAL if all(int(lane) == int(lanes[0]) for lane in lanes) else RACE_CONVENTIONAL
 
     def get_league(self, selector: Selector, is_female: bool) -> str | None:
         if is_female:
             return "EMAKUMEZKO TRAINERUEN ELKARTEA"
-        text = whitespaces_clean(selector.xpath('//*[@id="main"]/h1/span/span/text()').get("")).upper()
+        text = whitespaces_clean(self._XPATHS["league"](selector).get("")).upper()
         if is_play_off(text):
             return "ASOCIACIÓN DE REMO DEL CANTÁBRICO"
         return text.replace("GRUPO", "ASOCIACIÓN DE REMO DEL CANTÁBRICO")
 
     def get_town(self, selector: Selector) -> str:
-        text = remove_parenthesis(selector.xpath('//*[@id="main"]/div[2]/div[2]/div[1]/div[1]/ul/li[4]/text()').get(""))
+        text = remove_parenthesis(self._XPATHS["town"](selector).get(""))
         text = text.replace(" Ver mapaOcultar mapa", "")
         return normalize_town(text)
 
     def get_race_lanes(self, selector: Selector) -> int:
-        text = selector.xpath('//*[@id="main"]/div[2]/div[2]/div[1]/div[1]/ul/li[3]/text()').get("")
+        text = self._XPATHS["race_format"](selector).get("")
         if "CONTRARRELOJ" in text:
             return 1
         return int(re.findall(r"\d+", text)[0])
 
     def get_race_laps(self, selector: Selector) -> int:
-        text = selector.xpath('//*[@id="main"]/div[2]/div[2]/div[1]/div[1]/ul/li[3]/text()').get("")
+        text = self._XPATHS["race_format"](selector).get("")
         return int(re.findall(r"\d+", text)[1])
 
     def is_cancelled(self, selector: Selector) -> bool:
         # race_id=260
         # try to find the "NO PUNTUABLE" text in the name
-        return (
-            "NO PUNTUABLE"
-            in whitespaces_clean(selector.xpath('//*[@id="main"]/div[2]/div[1]/h2/text()').get("")).upper()
-        )
+        return "NO PUNTUABLE" in whitespaces_clean(self._XPATHS["name"](selector).get("")).upper()
 
-    def get_participants(self, selector: Selector) -> list[Selector]:
-        return [
-            Selector(p)
-            for p in selector.xpath('//*[@id="widget-resultados"]/div/div[3]/div/table[*]/tbody/tr').getall()
-        ]
+    def get_participants(self, selector: Selector) -> list[ParticipantRow]:
+        participants, series = [], {}
+        for idx, table in enumerate(self._XPATHS["series_tables"](selector), 1):
+            rows = [(row, self._XPATHS["row_name"](row).get("")) for row in self._XPATHS["series_rows"](table)]
+            # a club is in the first series it's found
+            for _, name in rows:
+                series.setdefault(name, idx)
+            participants.extend(self._participant_row(row, name, series[name]) for row, name in rows)
+        return participants
 
-    def get_lane(self, participant: Selector) -> int:
-        lane = participant.xpath("//*/th/text()").get("")
-        return int(lane) if lane else 0
+    def get_lane(self, participant: ParticipantRow) -> int:
+        return participant.lane or 0
 
-    def get_club_name(self, participant: Selector) -> str:
-        name = participant.xpath("//*/td[1]/span/a/text()").get("")
-        return whitespaces_clean(name).upper() if name else ""
+    def get_club_name(self, participant: ParticipantRow) -> str:
+        return participant.name
 
     def get_distance(self, is_female: bool) -> int:
         return 2778 if is_female else 5556
 
-    def get_laps(self, participant: Selector) -> list[str]:
-        laps = participant.xpath("//*/td/text()").getall()
+    def get_laps(self, participant: ParticipantRow) -> list[str]:
+        laps = participant.cells
         return [t.strftime("%M:%S.%f") for t in [normalize_lap_time(e) for e in laps if e] if t is not None]
 
-    def is_disqualified(self, selector: Selector, participant: Selector) -> bool:
+    def get_final_times(self, selector: Selector) -> dict[str, str]:
+        final_times = {}
+        for row in self._XPATHS["final_times_rows"](selector):
+            club_name = whitespaces_clean(self._XPATHS["row_name"](row).get("")).upper()
+            final_times.setdefault(club_name, self._XPATHS["final_time"](row).get(""))
+        return final_times
+
+    def is_disqualified(self, participant: ParticipantRow, final_times: dict[str, str]) -> bool:
         # race_id=472
         # try to find a club with 0 points
-        club_name = self.get_club_name(participant).upper()
-        final_times_rows = selector.xpath('//*[@id="widget-resultados"]/div/div[1]/div[2]/div/table/tbody/tr')
-
-        for row in final_times_rows:
-            club_name_in_row = whitespaces_clean(row.xpath(".//td[1]/span/a/text()").get("")).upper()
-            final_time = row.xpath(".//td[3]/text()").get("")
-
-            if club_name_in_row == club_name:
-                return final_time == "0"
-
-        return False
-
-    def get_series(self, selector: Selector, participant: Selector) -> int:
-        series = 1
-        rows = [Selector(p) for p in selector.xpath('//*[@id="widget-resultados"]/div/div[3]/div/table').getall()]
-        for row in rows:
-            for p in row.xpath("//*/tbody/tr").getall():
-                name = Selector(p).xpath("//*/td[1]/span/a/text()").get("")
-                if participant.xpath("//*/td[1]/span/a/text()").get("") == name:
-                    return series
-            series += 1
-        return 0
+        return final_times.get(self.get_club_name(participant).upper()) == "0"
+
+    def get_series(self, participant: ParticipantRow) -> int:
+        return participant.series
+
+    ####################################################
+    #                     PRIVATE                      #
+    ####################################################
+
+    def _participant_row(self, row: Selector, name: str, series: int) -> ParticipantRow:
+        lane = self._XPATHS["row_lane"](row).get("")
+        return ParticipantRow(
+            selector=row,
+            lane=int(lane) if lane else 0,
+            series=series,
+            name=whitespaces_clean(name).upper() if name else "",
+            cells=tuple(self._XPATHS["row_cells"](row).getall()),
+        )
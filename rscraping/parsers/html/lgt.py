@@ -9,6 +9,7 @@ from parsel.selector import Selector
 
 from pyutils.shortcuts import none
 from pyutils.strings import find_date, whitespaces_clean
+from rscraping._timing import stage
 from rscraping.data.checks import is_female, is_play_off
 from rscraping.data.constants import (
     CATEGORY_ABSOLUT,
@@ -34,6 +35,8 @@ from rscraping.data.normalization import (
 )
 
 from ._protocol import HtmlParser
+from ._row import ParticipantRow
+from ._xpath import XPathRegistry
 
 logger = logging.getLogger(os.path.dirname(os.path.realpath(__file__)))
 
@@ -41,70 +44,99 @@ logger = logging.getLogger(os.path.dirname(os.path.realpath(__file__)))
 class LGTHtmlParser(HtmlParser):
     DATASOURCE = Datasource.LGT
 
+    _XPATHS = XPathRegistry(
+        {
+            "race_urls": "//*/div/div/div[*]/div/a/@href",
+            "calendar_days": "/html/body/div/div/div[*]",
+            "calendar_month": "descendant-or-self::div/div/text()",
+            "calendar_day": "descendant-or-self::div/div/table/tr[1]/td[1]/text()",
+            "calendar_url": "descendant-or-self::div/a/@href",
+            "races": "//*/div/div/div[*]/div",
+            "race_url": ".//a/@href",
+            "race_name": ".//table/tr/td[2]/text()",
+            "name": '//*[@id="regata"]/div/div/div[3]/div[2]/h1/text()',
+            "date": '//*[@id="regata"]/div/div/div[3]/div[2]/p[2]/text()',
+            "league": '//*[@id="regata"]/div/div/div[3]/div[2]/p[3]/span/text()',
+            "town": '//*[@id="regata"]/div/div/div[3]/div[2]/p[1]/text()',
+            "organizer": '//*[@id="regata"]/div/div/div[3]/div[1]/text()',
+            "laps_header": '//*[@id="tabla-tempos"]/tr[1]/th',
+            "results_rows": '//*[@id="tabla-tempos"]/tr',
+            "row_columns": ".//td",
+            "row_lane": ".//td[1]/text()",
+            "row_name": ".//td[2]/text()",
+            "row_cells": ".//td/text()",
+        }
+    )
+
     @override
     def parse_race(self, selector: Selector, *, results_selector: Selector, race_id: str, **_) -> Race:
-        name = self.get_name(selector)
-        assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
-        if name.upper() == "EREWEWEWERW" or name.upper() == "REGATA" or "?" in name:  # wtf
-            raise AssertionError(f"{self.DATASOURCE}: invalid {name=} found for {race_id=}")
-
-        t_date = self.get_date(selector)
-        assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
-
-        league = self.get_league(selector)
-
-        normalized_names = normalize_name_parts(normalize_race_name(name))
-        normalized_names = [
-            self._normalizations(self._normalize(n, league, t_date), year=t_date.year, edition=e)
-            for (n, e) in normalized_names
-        ]
-        # try to find the edition in the original name before normalizations
-        if none(e for (_, e) in normalized_names):
-            edition = find_edition(name)
-            normalized_names = [(n, edition) for (n, _) in normalized_names]
-        assert len(normalized_names) > 0, f"{self.DATASOURCE}: unable to normalize {name=}"
+        with stage(self.DATASOURCE, "header"):
+            name = self.get_name(selector)
+            assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
+            if name.upper() == "EREWEWEWERW" or name.upper() == "REGATA" or "?" in name:  # wtf
+                raise AssertionError(f"{self.DATASOURCE}: invalid {name=} found for {race_id=}")
+
+            t_date = self.get_date(selector)
+            assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
+
+            league = self.get_league(selector)
+
+            normalized_names = normalize_name_parts(normalize_race_name(name))
+            normalized_names = [
+                self._normalizations(self._normalize(n, league, t_date), year=t_date.year, edition=e)
+                for (n, e) in normalized_names
+            ]
+            # try to find the edition in the original name before normalizations
+            if none(e for (_, e) in normalized_names):
+                edition = find_edition(name)
+                normalized_names = [(n, edition) for (n, _) in normalized_names]
+            assert len(normalized_names) > 0, f"{self.DATASOURCE}: unable to normalize {name=}"
 
         gender = GENDER_FEMALE if is_female(name) or (league is not None and "F" in league.split()) else GENDER_MALE
-        participants = self.get_participants(results_selector)
+        with stage(self.DATASOURCE, "participants"):
+            participants = self.get_participants(results_selector)
         race_laps = self.get_race_laps(results_selector)
         assert race_laps >= 0, f"{self.DATASOURCE}: unable to parse laps for {race_id=}"
 
-        race = Race(
-            name=self.get_name(selector),
-            normalized_names=normalized_names,
-            date=t_date.strftime("%d/%m/%Y"),
-            type=self.get_type(participants),
-            day=self.get_day(selector),
-            modality=RACE_TRAINERA,
-            league=league,
-            town=self.get_town(selector),
-            organizer=self.get_organizer(selector),
-            sponsor=find_race_sponsor(self.get_name(selector)),
-            race_ids=[race_id],
-            url=None,
-            datasource=self.DATASOURCE.value,
-            gender=gender,
-            category=CATEGORY_ABSOLUT,
-            cancelled=self.is_cancelled(participants),
-            race_laps=race_laps,
-            race_lanes=self.get_race_lanes(participants),
-            participants=[],
-        )
+        with stage(self.DATASOURCE, "race"):
+            race = Race(
+                name=self.get_name(selector),
+                normalized_names=normalized_names,
+                date=t_date.strftime("%d/%m/%Y"),
+                type=self.get_type(participants),
+                day=self.get_day(selector),
+                modality=RACE_TRAINERA,
+                league=league,
+                town=self.get_town(selector),
+                organizer=self.get_organizer(selector),
+                sponsor=find_race_sponsor(self.get_name(selector)),
+                race_ids=[race_id],
+                url=None,
+                datasource=self.DATASOURCE.value,
+                gender=gender,
+                category=CATEGORY_ABSOLUT,
+                cancelled=self.is_cancelled(participants),
+                race_laps=race_laps,
+                race_lanes=self.get_race_lanes(participants),
+                participants=[],
+            )
 
         for row in participants:
             disqualified = self.is_disqualified(row)
             penalty = Penalty(reason=None, disqualification=disqualified) if disqualified else None
+            with stage(self.DATASOURCE, "normalization"):
+                participant_name = normalize_club_name(self.get_club_name(row))
             race.participants.append(
                 Participant(
                     gender=gender,
                     category=CATEGORY_ABSOLUT,
                     club_name=self.get_club_name(row),
                     lane=self.get_lane(row),
-                    series=self.get_series(results_selector, row),
+                    series=self.get_series(row),
                     laps=self.get_laps(row),
                     distance=self.get_distance(),
                     handicap=None,
-                    participant=normalize_club_name(self.get_club_name(row)),
+                    participant=participant_name,
                     race=race,
                     penalty=penalty,
                     absent=False,
@@ -119,7 +151,7 @@ class LGTHtmlParser(HtmlParser):
 
     @override
     def parse_race_ids(self, selector: Selector, **_) -> Generator[str]:
-        urls = selector.xpath("//*/div/div/div[*]/div/a/@href").getall()
+        urls = self._XPATHS["race_urls"](selector).getall()
         return (u.split("/")[-1].split("-")[0] for u in urls[0:])
 
     @override
@@ -128,15 +160,13 @@ class LGTHtmlParser(HtmlParser):
         assert all(d.year == days[0].year for d in days), "all days must be from the same year"
 
         year, month, day = days[0].year, None, None
-        divs = [Selector(s) for s in selector.xpath("/html/body/div/div/div[*]").getall()]
-
-        for div in divs:
-            maybe_month = whitespaces_clean(div.xpath("//*/div/div/text()").get(""))
+        for div in self._XPATHS["calendar_days"](selector):
+            maybe_month = whitespaces_clean(self._XPATHS["calendar_month"](div).get(""))
             if maybe_month:
                 month = whitespaces_clean(maybe_month.upper())
                 continue
 
-            maybe_day = whitespaces_clean(div.xpath("//*/div/div/table/tr[1]/td[1]/text()").get(""))
+            maybe_day = whitespaces_clean(self._XPATHS["calendar_day"](div).get(""))
             if maybe_day:
                 day = int(maybe_day.upper().replace("D", "").replace("S", ""))
                 found_date = find_date(f"{day} {month} {year}", day_first=True)
@@ -144,20 +174,20 @@ class LGTHtmlParser(HtmlParser):
                 if (
                     found_date
                     and datetime.combine(found_date, datetime.min.time()) in days
-                    and div.xpath("//*/div/a/@href").get(None)
+                    and self._XPATHS["calendar_url"](div).get(None)
                 ):
-                    yield div.xpath("//*/div/a/@href").get("").split("/")[-1].split("-")[0]
+                    yield self._XPATHS["calendar_url"](div).get("").split("/")[-1].split("-")[0]
 
     @override
     def parse_race_names(self, selector: Selector, **_) -> Generator[RaceName]:
-        values = [Selector(u) for u in selector.xpath("//*/div/div/div[*]/div").getall()]
+        values = self._XPATHS["races"](selector)
         return (
             RaceName(
-                race_id=u.xpath("//*/a/@href").get("").split("/")[-1].split("-")[0],
-                name=u.xpath("//*/table/tr/td[2]/text()").get(""),
+                race_id=self._XPATHS["race_url"](u).get("").split("/")[-1].split("-")[0],
+                name=self._XPATHS["race_name"](u).get(""),
             )
             for u in values
-            if u.xpath("//*/a/@href").get(None)
+            if self._XPATHS["race_url"](u).get(None)
         )
 
     ####################################################
@@ -168,10 +198,10 @@ class LGTHtmlParser(HtmlParser):
         return bool(self.get_name(selector))
 
     def get_name(self, selector: Selector) -> str:
-        return whitespaces_clean(selector.xpath('//*[@id="regata"]/div/div/div[3]/div[2]/h1/text()').get("")).upper()
+        return whitespaces_clean(self._XPATHS["name"](selector).get("")).upper()
 
     def get_date(self, selector: Selector) -> date:
-        value = whitespaces_clean(selector.xpath('//*[@id="regata"]/div/div/div[3]/div[2]/p[2]/text()').get(""))
+        value = whitespaces_clean(self._XPATHS["date"](selector).get(""))
         return datetime.strptime(value, "%d/%m/%Y").date()
 
     def get_day(self, selector: Selector) -> int:
@@ -187,85 +217,89 @@ class LGTHtmlParser(HtmlParser):
             return 2 if self.get_date(selector).isoweekday() == 7 else 1  # 2 for sunday
         return 1
 
-    def get_type(self, participants: list[Selector]) -> str:
+    def get_type(self, participants: list[ParticipantRow]) -> str:
         lanes = list(self.get_lane(p) for p in participants)
         return RACE_TIME_TRIAL if all(int(lane) == int(lanes[0]) for lane in lanes) else RACE_CONVENTIONAL
 
     def get_league(self, selector: Selector) -> str | None:
         if is_play_off(self.get_name(selector)):
             return "LGT"
-        league = whitespaces_clean(selector.xpath('//*[@id="regata"]/div/div/div[3]/div[2]/p[3]/span/text()').get(""))
+        league = whitespaces_clean(self._XPATHS["league"](selector).get(""))
         return league if "LIGA" in league else None
 
     def get_town(self, selector: Selector) -> str:
-        value = selector.xpath('//*[@id="regata"]/div/div/div[3]/div[2]/p[1]/text()').get("")
+        value = self._XPATHS["town"](selector).get("")
         return normalize_town(value)
 
     def get_organizer(self, selector: Selector) -> str | None:
-        organizer = selector.xpath('//*[@id="regata"]/div/div/div[3]/div[1]/text()').get("")
+        organizer = self._XPATHS["organizer"](selector).get("")
         organizer = whitespaces_clean(organizer).upper().replace("ORGANIZA:", "").strip() if organizer else None
         return normalize_club_name(organizer) if organizer else None
 
-    def get_race_lanes(self, participants: list[Selector]) -> int:
+    def get_race_lanes(self, participants: list[ParticipantRow]) -> int:
         if self.get_type(participants) == RACE_TIME_TRIAL:
             return 1
         lanes = list(self.get_lane(p) for p in participants)
         return max(int(lane) for lane in lanes)
 
     def get_race_laps(self, results_selector: Selector) -> int:
-        return len(results_selector.xpath('//*[@id="tabla-tempos"]/tr[1]/th').getall()) - 2
+        return len(self._XPATHS["laps_header"](results_selector).getall()) - 2
 
-    def is_cancelled(self, participants: list[Selector]) -> bool:
+    def is_cancelled(self, participants: list[ParticipantRow]) -> bool:
         # race_id=114
         # assume no final time is set for cancelled races (as in the example)
-        times = [p.xpath("//*/td/text()").getall()[-1] for p in participants]
+        times = [p.cells[-1] for p in participants]
         return len([x for x in times if x == "-"]) > len(times) / 3
 
-    def get_participants(self, results_selector: Selector) -> list[Selector]:
-        def is_valid(row: Selector) -> bool:
-            if len(row.xpath("//*/td").getall()) <= 1:
-                return False
-            maybe_name = row.xpath("//*/td[2]/text()").get("")
-            return bool(maybe_name) and maybe_name != "LIBRE"
-
-        return [
-            Selector(p)
-            for p in results_selector.xpath('//*[@id="tabla-tempos"]/tr').getall()[1:]
-            if is_valid(Selector(p))
-        ]
-
-    def get_lane(self, participant: Selector) -> int:
-        lane = participant.xpath("//*/td[1]/text()").get()
-        return int(lane) if lane else 0
-
-    def get_club_name(self, participant: Selector) -> str:
-        name = participant.xpath("//*/td[2]/text()").get()
-        return whitespaces_clean(name).upper() if name else ""
+    def get_participants(self, results_selector: Selector) -> list[ParticipantRow]:
+        participants, series, idx = [], {}, 1
+        for row_idx, row in enumerate(self._XPATHS["results_rows"](results_selector)):
+            cells, name = len(self._XPATHS["row_columns"](row)), self._XPATHS["row_name"](row).get()
+            if name is not None:
+                # a club is in the first series it's found
+                series.setdefault(name, idx)
+            if cells == 1:
+                # single cell rows separate the series
+                idx += 1
+            if row_idx > 0 and cells > 1 and name and name != "LIBRE":
+                participants.append(self._participant_row(row, name, series[name]))
+        return participants
+
+    def get_lane(self, participant: ParticipantRow) -> int:
+        return participant.lane or 0
+
+    def get_club_name(self, participant: ParticipantRow) -> str:
+        return participant.name
 
     def get_distance(self) -> int:
         return 5556
 
-    def get_laps(self, participant: Selector) -> list[str]:
-        laps = participant.xpath("//*/td/text()").getall()[2:]
+    def get_laps(self, participant: ParticipantRow) -> list[str]:
+        laps = participant.cells[2:]
         return [t.strftime("%M:%S.%f") for t in [normalize_lap_time(e) for e in laps if e] if t is not None]
 
-    def is_disqualified(self, participant: Selector) -> bool:
+    def is_disqualified(self, participant: ParticipantRow) -> bool:
         # race_id=168
         # try to find the "-" text in the final crono
-        laps = participant.xpath("//*/td/text()").getall()[2:]
+        laps = participant.cells[2:]
         return whitespaces_clean(laps[-1]) == "-"
 
-    def get_series(self, results_selector: Selector, participant: Selector) -> int:
-        series = 1
-        searching_name = participant.xpath("//*/td[2]/text()").get("")
-        rows = [Selector(p) for p in results_selector.xpath('//*[@id="tabla-tempos"]/tr[*]').getall()]
-        for row in rows:
-            row_name = row.xpath("//*/td[2]/text()").get()
-            if row_name is not None and row_name == searching_name:
-                return series
-            if len(row.xpath("//*/td").getall()) == 1:
-                series += 1
-        return 0
+    def get_series(self, participant: ParticipantRow) -> int:
+        return participant.series
+
+    ####################################################
+    #                     PRIVATE                      #
+    ####################################################
+
+    def _participant_row(self, row: Selector, name: str, series: int) -> ParticipantRow:
+        lane = self._XPATHS["row_lane"](row).get()
+        return ParticipantRow(
+            selector=row,
+            lane=int(lane) if lane else 0,
+            series=series,
+            name=whitespaces_clean(name).upper(),
+            cells=tuple(self._XPATHS["row_cells"](row).getall()),
+        )
 
     ####################################################
     #                  NORMALIZATION                   #
@@ -1,13 +1,16 @@
 import logging
 import os
 from collections import Counter
-from collections.abc import Generator
-from datetime import date, datetime
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from functools import cached_property
 from typing import override
 
 from parsel.selector import Selector
 
 from pyutils.strings import find_date, whitespaces_clean
+from rscraping._timing import stage
 from rscraping.data.checks import is_branch_club, should_be_time_trial
 from rscraping.data.constants import (
     CATEGORY_ABSOLUT,
@@ -38,7 +41,10 @@ from rscraping.data.normalization import (
     retrieve_penalty_times,
 )
 
+from ._backend import LXML, HtmlNode
 from ._protocol import HtmlParser
+from ._row import ParticipantRow
+from ._xpath import LayoutProfile, XPathRegistry
 
 logger = logging.getLogger(os.path.dirname(os.path.realpath(__file__)))
 
@@ -47,126 +53,146 @@ class MultiRaceException(Exception):
     pass
 
 
-class TrainerasHtmlParser(HtmlParser):
+@dataclass
+class _RaceHeader:
     """
-    - both race 'day' are saved in the same 'ref_id'
-    - 'edition' can't be retrieved
-    - 'league' can't be retrieved
+    Fields shared by all the races (days) of a page.
     """
 
-    DATASOURCE = Datasource.TRAINERAS
+    name: str
+    normalized_names: list[tuple[str, int | None]]
+    gender: str
+    category: str
+    distance: int | None
+    race_notes: str | None
+    extra_times: dict[str, time]
 
-    _FEMALE = ["SF", "VF", "JF", "F"]
-    _MIX = ["M"]
-    _VETERAN = ["VF", "VM"]
-    _SCHOOL = ["JM", "JF", "CM", "CF"]
 
-    @override
-    def parse_race(self, selector: Selector, *, race_id: str, table: int | None = None, **_) -> Race:
-        if self._races_count(selector) > 1 and not table:
-            logger.error(f"{self.DATASOURCE}: multiple races found for {race_id=} without specifying a table")
-            raise MultiRaceException("no table specified")
-        table = table or 1
+class _ParseContext:
+    """
+    Values derived from a page, each one is computed the first time it's requested and then shared by all the getters
+    parsing the page.
+    """
 
-        name = self.get_name(selector)
-        assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
+    def __init__(self, parser: "TrainerasHtmlParser", selector: Selector, race_id: str):
+        self.parser = parser
+        self.selector = selector
+        self.race_id = race_id
+        self._values: dict[tuple[str, int], object] = {}
 
-        t_date = self.get_date(selector, table)
-        assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
+    @cached_property
+    def header(self) -> _RaceHeader:
+        return self.parser._parse_race_header(self.selector, self.race_id)
 
-        normalized_names = normalize_name_parts(normalize_race_name(name))
-        normalized_names = [(self._normalizations(n, name, t_date), e) for (n, e) in normalized_names]
-        assert len(normalized_names) > 0, f"{self.DATASOURCE}: unable to normalize {name=}"
-        logger.info(f"{self.DATASOURCE}: found race {t_date}::{name}")
+    @cached_property
+    def races_count(self) -> int:
+        return self.parser._races_count(self.selector)
 
-        gender = self.get_gender(selector)
-        category = self.get_category(selector)
-        distance = self.get_distance(selector)
+    def participants(self, table: int) -> list[ParticipantRow]:
+        return self._memo("participants", table, lambda: self.parser.get_participants(self.selector, table))
 
-        participants = self.get_participants(selector, table)
-        race_lanes = self.get_race_lanes(participants)
-        race_notes = self.get_race_notes(selector)
-        ttype = self.get_type(participants) if not should_be_time_trial(name, t_date) else RACE_TIME_TRIAL
+    def type(self, table: int) -> str:
+        return self._memo("type", table, lambda: self.parser.get_type(self.participants(table)))
 
-        race = Race(
-            name=name,
-            normalized_names=normalized_names,
-            date=t_date.strftime("%d/%m/%Y"),
-            type=ttype,
-            day=self._clean_day(table, name),
-            modality=RACE_TRAINERA,
-            league=find_league(name),
-            town=self.get_town(selector, race_table=table),
-            organizer=None,
-            sponsor=find_race_sponsor(self.get_name(selector)),
-            race_ids=[race_id],
-            url=None,
-            gender=gender,
-            category=category,
-            datasource=self.DATASOURCE.value,
-            cancelled=self.is_cancelled(participants) or is_cancelled(race_notes),
-            race_laps=self.get_race_laps(selector, table),
-            race_lanes=race_lanes,
-            race_notes=race_notes,
-            participants=[],
+    def laps(self, table: int) -> list[list[str]]:
+        return self._memo("laps", table, lambda: [self.parser.get_laps(p) for p in self.participants(table)])
+
+    def participant_names(self, table: int) -> list[str]:
+        return self._memo(
+            "participant_names",
+            table,
+            lambda: [normalize_club_name(self.parser.get_club_name(p)) for p in self.participants(table)],
         )
 
-        participant_names = [normalize_club_name(self.get_club_name(row)) for row in participants]
-        extra_times = retrieve_penalty_times(race_notes) if race_notes else {}
-        penalties = normalize_penalty(race_notes, participants=participant_names)
+    def _memo[T](self, name: str, table: int, compute: Callable[[], T]) -> T:
+        key = (name, table)
+        if key not in self._values:
+            self._values[key] = compute()
+        return self._values[key]  # pyright: ignore
 
-        if any(k == "" for k in penalties.keys()) and len(extra_times) == 0:
-            penalties[list(extra_times.keys())[0]] = penalties[""]
-            penalties.pop("")
-        if any(k == "" for k in extra_times.keys()) and len(penalties) == 0:
-            extra_times[list(extra_times.keys())[0]] = extra_times[""]
-            extra_times.pop("")
 
-        if "" in extra_times:
-            logger.warning(f"{self.DATASOURCE}: no participant found for extra time:\n\t{extra_times['']}")
-        if "" in penalties:
-            logger.warning(f"{self.DATASOURCE}: no participant found for penalty:\n\t{penalties['']}")
-        if race_notes and not penalties:
-            logger.warning(f"{self.DATASOURCE}: no penalties found for note:\n\t{race_notes}")
+class TrainerasHtmlParser(HtmlParser):
+    """
+    - both race 'day' are saved in the same 'ref_id'
+    - 'edition' can't be retrieved
+    - 'league' can't be retrieved
+    """
 
-        for row in participants:
-            participant_name = normalize_club_name(self.get_club_name(row))
-            participant_name = self._fix_castro_mess(participant_name, self.get_club_name(row), t_date)
+    DATASOURCE = Datasource.TRAINERAS
 
-            laps = self.get_laps(row)
-            time = extra_times.get(participant_name, None)
-            penalty = penalties.get(participant_name, None)
+    _FEMALE = ["SF", "VF", "JF", "F"]
+    _MIX = ["M"]
+    _VETERAN = ["VF", "VM"]
+    _SCHOOL = ["JM", "JF", "CM", "CF"]
 
-            if time:
-                laps.append(time.strftime("%M:%S.%f"))
+    _XPATHS = XPathRegistry(
+        {
+            "race_rows": "/html/body/div[1]/div[2]/table/tbody/tr",
+            "race_name": ".//td[1]/a/text()",
+            "race_type": ".//td[2]/text()",
+            "race_date": ".//td[5]/text()",
+            "race_url": ".//td[1]/a/@href",
+            "pages": "/html/body/div[1]/div[3]/nav/ul/li[*]",
+            "club_race_rows": "/html/body/div[1]/div[2]/div/table/tr",
+            "club_name": "/html/body/main/section[1]/div/div[2]/h1/text()",
+            "club_founding_year": "/html/body/main/section[1]/div/div[2]/div[1]/div[1]/span/text()",
+            "rower_race_rows": "/html/body/main/section[2]/div/div/div[1]/div/table/tr/td/table/tr",
+            "rower_race_url": ".//td/a/@href",
+            "rower_race_year": "//*/td[2]/text()",
+            "flag_urls": "/html/body/div[1]/div[2]/div/div/div[*]/div/div/div[2]/h5/a/@href",
+            "flag_titles": "/html/body/main/div/div/div/div[*]/h2/text()",
+            "flag_table": "/html/body/main/div/div/div/div[$idx]/div/table",
+            "flag_race_url": ".//td[3]/a/@href",
+            "table_rows": ".//tr",
+            "name": "/html/body/div[1]/div/h1/text()",
+            "header": "/html/body/div[1]/main/div/div/div/div[1]/h2/text()",
+            "notes": "/html/body/div[1]/main/div[2]/div[2]/div/text()",
+            "town": "/html/body/div[1]/main/div/div/div/div[$table]/h2/text()",
+            "date": "/html/body/div[1]/main/div/div/div/div[2]/h2[$table]/text()",
+            "races": "/html/body/div[1]/main/div[1]/div/div/div[2]/table[*]",
+            "participants": "/html/body/div[1]/main/div[1]/div/div/div[2]/table[$table]/tr",
+            "row_name": ".//td[2]/text()",
+            "row_lane": ".//td[3]/text()",
+            "row_series": ".//td[4]/text()",
+            "row_cells": ".//td/text()",
+        },
+        profiles=[
+            # race_id=5706|1625: a label before the results moves the tables and their dates one block down
+            LayoutProfile(
+                name="labelled",
+                match="not(/html/body/div[1]/main/div[1]/div/div/div[2]/table)",
+                paths={
+                    "date": "/html/body/div[1]/main/div/div/div/div[3]/h2[$table]/text()",
+                    "races": "/html/body/div[1]/main/div[1]/div/div/div[3]/table[*]",
+                    "participants": "/html/body/div[1]/main/div[1]/div/div/div[3]/table[$table]/tr",
+                },
+            ),
+        ],
+        # the busiest datasource, its values are read straight from the lxml results
+        backend=LXML,
+    )
 
-            if penalty:
-                penalty.disqualification = self.is_disqualified(row) or penalty.disqualification
-            elif self.is_disqualified(row):
-                penalty = Penalty(reason=None, disqualification=True)
+    @override
+    def parse_race(self, selector: Selector, *, race_id: str, table: int | None = None, **_) -> Race:
+        context = _ParseContext(self, selector, race_id)
+        if context.races_count > 1 and not table:
+            logger.error(f"{self.DATASOURCE}: multiple races found for {race_id=} without specifying a table")
+            raise MultiRaceException("no table specified")
 
-            race.participants.append(
-                Participant(
-                    gender=gender,
-                    category=category,
-                    club_name=self.get_club_name(row),
-                    lane=self.get_lane(row) if ttype == RACE_CONVENTIONAL else 1,
-                    series=self.get_series(row) if ttype == RACE_CONVENTIONAL else 1,
-                    laps=laps,
-                    distance=distance,
-                    handicap=None,
-                    participant=participant_name,
-                    race=race,
-                    penalty=penalty,
-                    retired=self.has_retired(row) or is_retired(participant_name, race_notes),
-                    absent=is_absent(participant_name, race_notes),
-                    guest=is_guest(participant_name, race_notes),
-                )
-            )
+        return self._parse_race_table(context, table or 1)
 
-        ensure_b_teams_have_the_main_team_racing(race)
+    def parse_races(self, selector: Selector, *, race_id: str, **_) -> list[Race]:
+        """
+        Parse all the races (days) in the page, the header of the page is only parsed once for all of them.
 
-        return race
+        Args:
+            selector (Selector): The Selector to parse.
+            race_id (str): The ID of the race.
+
+        Returns: list[Race]: A race for each table in the page.
+        """
+        context = _ParseContext(self, selector, race_id)
+        return [self._parse_race_table(context, table) for table in range(1, max(1, context.races_count) + 1)]
 
     @override
     def parse_race_ids(self, selector: Selector, **_) -> Generator[str]:
@@ -177,50 +203,48 @@ class TrainerasHtmlParser(HtmlParser):
         assert len(days) > 0, "days must have at least one element"
         assert all(d.year == days[0].year for d in days), "all days must be from the same year"
 
-        rows = [Selector(r) for r in selector.xpath("/html/body/div[1]/div[2]/table/tbody/tr").getall()]
-        for row in rows:
-            ttype = row.xpath("//*/td[2]/text()").get("")
-            name = whitespaces_clean(row.xpath("//*/td[1]/a/text()").get("").upper())
+        for row in self._XPATHS["race_rows"](selector):
+            ttype = self._XPATHS["race_type"](row).get("")
+            name = whitespaces_clean(self._XPATHS["race_name"](row).get("").upper())
             name = " ".join(n for n in name.split() if n != ttype)
-            if datetime.strptime(row.xpath("//*/td[5]/text()").get(""), "%d-%m-%Y") in days:
-                yield row.xpath("//*/td[1]/a/@href").get("").split("/")[-1]
+            if datetime.strptime(self._XPATHS["race_date"](row).get(""), "%d-%m-%Y") in days:
+                yield self._XPATHS["race_url"](row).get("").split("/")[-1]
 
     @override
     def parse_race_names(self, selector: Selector, **_) -> Generator[RaceName]:
-        rows = [Selector(r) for r in selector.xpath("/html/body/div[1]/div[2]/table/tbody/tr").getall()]
-        for row in rows:
-            ttype = row.xpath("//*/td[2]/text()").get("")
-            name = whitespaces_clean(row.xpath("//*/td[1]/a/text()").get("").upper())
+        for row in self._XPATHS["race_rows"](selector):
+            ttype = self._XPATHS["race_type"](row).get("")
+            name = whitespaces_clean(self._XPATHS["race_name"](row).get("").upper())
             name = " ".join(n for n in name.split() if n != ttype)
-            yield RaceName(race_id=row.xpath("//*/td[1]/a/@href").get("").split("/")[-1], name=name)
+            yield RaceName(race_id=self._XPATHS["race_url"](row).get("").split("/")[-1], name=name)
 
     def parse_flag_race_ids(self, selector: Selector, gender: str, category: str, **_) -> Generator[str]:
         table = self._get_matching_flag_table(gender, category, selector)
         if table:
-            rows = Selector(table).xpath("//*/tr").getall()
-            yield from (Selector(row).xpath("//*/td[3]/a/@href").get("").split("/")[-1] for row in rows[1:])
+            rows = self._XPATHS["table_rows"](table)
+            yield from (self._XPATHS["flag_race_url"](row).get("").split("/")[-1] for row in rows[1:])
 
     def parse_club_race_ids(self, selector: Selector) -> Generator[str]:
-        rows = selector.xpath("/html/body/div[1]/div[2]/div/table/tr").getall()
-        return (Selector(row).xpath("//*/td[1]/a/@href").get("").split("/")[-1] for row in rows[1:])
+        rows = self._XPATHS["club_race_rows"](selector)
+        return (self._XPATHS["race_url"](row).get("").split("/")[-1] for row in rows[1:])
 
     def parse_rower_race_ids(self, selector: Selector, year: str | None = None) -> Generator[str]:
-        rows = selector.xpath("/html/body/main/section[2]/div/div/div[1]/div/table/tr/td/table/tr").getall()
+        rows = self._XPATHS["rower_race_rows"](selector)
         if not year:
-            return (Selector(r).xpath("//*/td/a/@href").get("").split("/")[-1] for r in rows)
+            return (self._XPATHS["rower_race_url"](r).get("").split("/")[-1] for r in rows)
 
         return (
-            Selector(r).xpath("//*/td/a/@href").get("").split("/")[-1]
+            self._XPATHS["rower_race_url"](r).get("").split("/")[-1]
             for r in rows
-            if year in selector.xpath("//*/td[2]/text()").get("")
+            if year in self._XPATHS["rower_race_year"](selector).get("")
         )
 
     def parse_club_details(self, selector: Selector, **_) -> Club | None:
-        name = whitespaces_clean(selector.xpath("/html/body/main/section[1]/div/div[2]/h1/text()").get("").upper())
+        name = whitespaces_clean(self._XPATHS["club_name"](selector).get("").upper())
         if not name:
             return None
 
-        year = selector.xpath("/html/body/main/section[1]/div/div[2]/div[1]/div[1]/span/text()").get("")
+        year = self._XPATHS["club_founding_year"](selector).get("")
         year = whitespaces_clean(year)
         if not year.isdigit():
             year = None
@@ -233,41 +257,37 @@ class TrainerasHtmlParser(HtmlParser):
         )
 
     def parse_searched_flag_urls(self, selector: Selector) -> list[str]:
-        return selector.xpath("/html/body/div[1]/div[2]/div/div/div[*]/div/div/div[2]/h5/a/@href").getall()
+        return self._XPATHS["flag_urls"](selector).getall()
 
     def parse_flag_editions(self, selector: Selector, gender: str, category: str) -> Generator[tuple[int, int]]:
         table = self._get_matching_flag_table(gender, category, selector)
         if table:
-            for row in Selector(table).xpath("//*/tr").getall()[1:]:
-                parts = Selector(row).xpath("//*/td/text()").getall()
+            for row in self._XPATHS["table_rows"](table)[1:]:
+                parts = self._XPATHS["row_cells"](row).getall()
                 yield (
                     datetime.strptime(whitespaces_clean(parts[1]), "%d-%m-%Y").date().year,
                     int(whitespaces_clean(parts[0])),
                 )
 
     def get_number_of_pages(self, selector: Selector) -> int:
-        return len(selector.xpath("/html/body/div[1]/div[3]/nav/ul/li[*]").getall()) - 2
+        return len(self._XPATHS["pages"](selector).getall()) - 2
 
     ####################################################
     #                     GETTERS                      #
     ####################################################
 
     def get_name(self, selector: Selector) -> str:
-        name = whitespaces_clean(selector.xpath("/html/body/div[1]/div/h1/text()").get("")).upper()
+        name = whitespaces_clean(self._XPATHS["name"](selector).get("")).upper()
         name = " ".join(name.split()[:-1])
         return name
 
     def get_date(self, selector: Selector, table: int) -> date | None:
-        date_path = "div[1]/h2" if table == 1 else f"div[2]/h2[{table - 1}]"
-        t_date = find_date(selector.xpath(f"/html/body/div[1]/main/div/div/div/{date_path}/text()").get(""))
-        if not t_date:
-            # race_id=1625
-            date_path = f"div[3]/h2[{table - 1}]"
-            t_date = find_date(selector.xpath(f"/html/body/div[1]/main/div/div/div/{date_path}/text()").get(""))
-        return t_date
+        if table == 1:
+            return find_date(self._XPATHS["header"](selector).get(""))
+        return find_date(self._XPATHS.layout(selector)["date"](selector, table=table - 1).get(""))
 
     def get_gender(self, selector: Selector) -> str:
-        parts = selector.xpath("/html/body/div[1]/main/div/div/div/div[1]/h2/text()").get("")
+        parts = self._XPATHS["header"](selector).get("")
         part = whitespaces_clean(parts.split(" - ")[-1])
         if part in self._MIX:
             return GENDER_MIX
@@ -275,7 +295,7 @@ class TrainerasHtmlParser(HtmlParser):
             return GENDER_FEMALE
         return GENDER_MALE
 
-    def get_type(self, participants: list[Selector]) -> str:
+    def get_type(self, participants: list[ParticipantRow]) -> str:
         series = [self.get_series(p) for p in participants]
         series = [s for s in series if s]
         if len(set(series)) == len(series):
@@ -291,7 +311,7 @@ class TrainerasHtmlParser(HtmlParser):
         return RACE_CONVENTIONAL
 
     def get_category(self, selector: Selector) -> str:
-        subtitle = selector.xpath("/html/body/div[1]/main/div/div/div/div[1]/h2/text()").get("").upper()
+        subtitle = self._XPATHS["header"](selector).get("").upper()
         category = whitespaces_clean(subtitle.split("-")[-1])
         if category in self._VETERAN:
             return CATEGORY_VETERAN
@@ -300,11 +320,18 @@ class TrainerasHtmlParser(HtmlParser):
         return CATEGORY_ABSOLUT
 
     def get_town(self, selector: Selector, race_table: int) -> str:
-        parts = selector.xpath(f"/html/body/div[1]/main/div/div/div/div[{race_table}]/h2/text()").get("")
+        parts = self._XPATHS["town"](selector, table=race_table).get("")
         return normalize_town(whitespaces_clean(parts.split(" - ")[0]))
 
-    def get_race_lanes(self, participants: list[Selector]) -> int | None:
-        if self.get_type(participants) == RACE_TIME_TRIAL:
+    def get_race_lanes(self, participants: list[ParticipantRow], ttype: str | None = None) -> int | None:
+        """
+        Args:
+            participants (list[ParticipantRow]): The participants of the race.
+            ttype (str | None): The type of the race when it's already known, otherwise it's computed.
+
+        Returns: int | None: The number of lanes of the race.
+        """
+        if (ttype or self.get_type(participants)) == RACE_TIME_TRIAL:
             return 1
         lanes = list(self.get_lane(p) for p in participants)
         lanes = {int(lane) for lane in lanes if lane is not None}
@@ -318,66 +345,193 @@ class TrainerasHtmlParser(HtmlParser):
             return lanes
         return None
 
-    def get_race_laps(self, selector: Selector, table: int) -> int | None:
-        cia = []
-        for participant in self.get_participants(selector, table):
-            participant_cia = participant.xpath("//*/td/text()").getall()
-            cia.append([p for p in participant_cia if ":" in p])
+    def get_race_laps(self, participants: list[ParticipantRow]) -> int | None:
+        cia = [[p for p in participant.cells if ":" in p] for participant in participants]
         return len(max(cia, key=len)) if cia else None
 
-    def is_cancelled(self, participants: list[Selector]) -> bool:
+    def is_cancelled(self, participants: list[ParticipantRow], laps: list[list[str]] | None = None) -> bool:
+        """
+        Args:
+            participants (list[ParticipantRow]): The participants of the race.
+            laps (list[list[str]] | None): The laps of each participant when they are already known, otherwise they
+                are computed.
+
+        Returns: bool: Whether at least half of the participants have no times.
+        """
         # race_id=4061|211
-        laps = [self.get_laps(p) for p in participants if not self.is_disqualified(p)]
+        laps = laps if laps is not None else [self.get_laps(p) for p in participants]
+        laps = [lap for p, lap in zip(participants, laps) if not self.is_disqualified(p)]
         return len([lap for lap in laps if len(lap) == 0]) >= len(participants) // 2
 
-    def get_participants(self, selector: Selector, table: int) -> list[Selector]:
-        rows = selector.xpath(f"{self._participants_path(selector)}[{table}]/tr").getall()
-        return [Selector(t) for t in rows[1:]]
+    def get_participants(self, selector: Selector, table: int) -> list[ParticipantRow]:
+        rows = self._XPATHS.layout(selector)["participants"](selector, table=table)[1:]
+        return [self._participant_row(row) for row in rows]
 
-    def get_lane(self, participant: Selector) -> int | None:
-        lane = participant.xpath("//*/td[3]/text()").get()
-        return int(lane) if lane and int(lane) <= 6 else None
+    def get_lane(self, participant: ParticipantRow) -> int | None:
+        return participant.lane
 
-    def get_club_name(self, participant: Selector) -> str:
-        name = participant.xpath("//*/td[2]/text()").get()
-        return whitespaces_clean(name).upper() if name else ""
+    def get_club_name(self, participant: ParticipantRow) -> str:
+        return participant.name
 
     def get_distance(self, selector: Selector) -> int | None:
-        parts = whitespaces_clean(selector.xpath("/html/body/div[1]/main/div/div/div/div[1]/h2/text()").get(""))
+        parts = whitespaces_clean(self._XPATHS["header"](selector).get(""))
         parts = parts.split(" - ")
         part = next((p for p in parts if "metros" in p), None)
         return int(part.replace(" metros", "")) if part is not None else None
 
-    def get_laps(self, participant: Selector) -> list[str]:
-        laps = [e for e in participant.xpath("//*/td/text()").getall() if any(c in e for c in [":", ".", ","])]
+    def get_laps(self, participant: ParticipantRow) -> list[str]:
+        laps = [e for e in participant.cells if any(c in e for c in [":", ".", ","])]
         return [t.strftime("%M:%S.%f") for t in [normalize_lap_time(e) for e in laps if e] if t is not None]
 
-    def is_disqualified(self, participant: Selector) -> bool:
+    def is_disqualified(self, participant: ParticipantRow) -> bool:
         # race_id=5360|5535
         # try to find the "Desc." text in the final crono
-        laps = participant.xpath("//*/td/text()").getall()[2:-4]
+        laps = participant.cells[2:-4]
         return any(w in lap for w in ["Desc.", "FR"] for lap in laps)
 
-    def has_retired(self, participant: Selector) -> bool:
+    def has_retired(self, participant: ParticipantRow) -> bool:
         # race_id=5360|5535
         # try to find the "Desc." text in the final crono
-        laps = participant.xpath("//*/td/text()").getall()[2:-4]
+        laps = participant.cells[2:-4]
         return any(w in lap for w in ["Ret."] for lap in laps)
 
-    def get_series(self, participant: Selector) -> int:
-        series = participant.xpath("//*/td[4]/text()").get()
-        return int(series) if series else 0
+    def get_series(self, participant: ParticipantRow) -> int:
+        return participant.series
 
     def get_race_notes(self, selector: Selector) -> str | None:
-        notes = selector.xpath("/html/body/div[1]/main/div[2]/div[2]/div/text()").get(None)
+        notes = self._XPATHS["notes"](selector).get(None)
         return whitespaces_clean(notes) if notes else None
 
     ####################################################
     #                     PRIVATE                      #
     ####################################################
 
+    def _parse_race_header(self, selector: Selector, race_id: str) -> _RaceHeader:
+        with stage(self.DATASOURCE, "header"):
+            name = self.get_name(selector)
+            assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
+
+            normalized_names = normalize_name_parts(normalize_race_name(name))
+            assert len(normalized_names) > 0, f"{self.DATASOURCE}: unable to normalize {name=}"
+
+            race_notes = self.get_race_notes(selector)
+            gender, category = self.get_gender(selector), self.get_category(selector)
+            distance = self.get_distance(selector)
+
+        with stage(self.DATASOURCE, "penalty"):
+            extra_times = retrieve_penalty_times(race_notes) if race_notes else {}
+
+        return _RaceHeader(
+            name=name,
+            normalized_names=normalized_names,
+            gender=gender,
+            category=category,
+            distance=distance,
+            race_notes=race_notes,
+            extra_times=extra_times,
+        )
+
+    def _parse_race_table(self, context: _ParseContext, table: int) -> Race:
+        selector, header, race_id = context.selector, context.header, context.race_id
+        name, race_notes = header.name, header.race_notes
+        gender, category, distance = header.gender, header.category, header.distance
+
+        with stage(self.DATASOURCE, "header"):
+            t_date = self.get_date(selector, table)
+            assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
+
+            normalized_names = [(self._normalizations(n, name, t_date), e) for (n, e) in header.normalized_names]
+            logger.info(f"{self.DATASOURCE}: found race {t_date}::{name}")
+
+        with stage(self.DATASOURCE, "participants"):
+            participants = context.participants(table)
+
+        with stage(self.DATASOURCE, "race"):
+            race_lanes = self.get_race_lanes(participants, ttype=context.type(table))
+            ttype = context.type(table) if not should_be_time_trial(name, t_date) else RACE_TIME_TRIAL
+
+            race = Race(
+                name=name,
+                normalized_names=normalized_names,
+                date=t_date.strftime("%d/%m/%Y"),
+                type=ttype,
+                day=self._clean_day(table, name),
+                modality=RACE_TRAINERA,
+                league=find_league(name),
+                town=self.get_town(selector, race_table=table),
+                organizer=None,
+                sponsor=find_race_sponsor(name),
+                race_ids=[race_id],
+                url=None,
+                gender=gender,
+                category=category,
+                datasource=self.DATASOURCE.value,
+                cancelled=self.is_cancelled(participants, laps=context.laps(table)) or is_cancelled(race_notes),
+                race_laps=self.get_race_laps(participants),
+                race_lanes=race_lanes,
+                race_notes=race_notes,
+                participants=[],
+            )
+
+        with stage(self.DATASOURCE, "normalization"):
+            participant_names = context.participant_names(table)
+        with stage(self.DATASOURCE, "penalty"):
+            penalties = normalize_penalty(race_notes, participants=participant_names)
+        extra_times = dict(header.extra_times)
+
+        if any(k == "" for k in penalties.keys()) and len(extra_times) == 0:
+            penalties[list(extra_times.keys())[0]] = penalties[""]
+            penalties.pop("")
+        if any(k == "" for k in extra_times.keys()) and len(penalties) == 0:
+            extra_times[list(extra_times.keys())[0]] = extra_times[""]
+            extra_times.pop("")
+
+        if "" in extra_times:
+            logger.warning(f"{self.DATASOURCE}: no participant found for extra time:\n\t{extra_times['']}")
+        if "" in penalties:
+            logger.warning(f"{self.DATASOURCE}: no participant found for penalty:\n\t{penalties['']}")
+        if race_notes and not penalties:
+            logger.warning(f"{self.DATASOURCE}: no penalties found for note:\n\t{race_notes}")
+
+        for row, participant_name, laps in zip(participants, participant_names, context.laps(table)):
+            participant_name = self._fix_castro_mess(participant_name, self.get_club_name(row), t_date)
+            laps = list(laps)
+            time = extra_times.get(participant_name, None)
+            penalty = penalties.get(participant_name, None)
+
+            if time:
+                laps.append(time.strftime("%M:%S.%f"))
+
+            if penalty:
+                penalty.disqualification = self.is_disqualified(row) or penalty.disqualification
+            elif self.is_disqualified(row):
+                penalty = Penalty(reason=None, disqualification=True)
+
+            race.participants.append(
+                Participant(
+                    gender=gender,
+                    category=category,
+                    club_name=self.get_club_name(row),
+                    lane=self.get_lane(row) if ttype == RACE_CONVENTIONAL else 1,
+                    series=self.get_series(row) if ttype == RACE_CONVENTIONAL else 1,
+                    laps=laps,
+                    distance=distance,
+                    handicap=None,
+                    participant=participant_name,
+                    race=race,
+                    penalty=penalty,
+                    retired=self.has_retired(row) or is_retired(participant_name, race_notes),
+                    absent=is_absent(participant_name, race_notes),
+                    guest=is_guest(participant_name, race_notes),
+                )
+            )
+
+        ensure_b_teams_have_the_main_team_racing(race)
+
+        return race
+
     def _races_count(self, selector: Selector) -> int:
-        return len(selector.xpath(f"{self._participants_path(selector)}[*]").getall())
+        return len(self._XPATHS.layout(selector)["races"](selector))
 
     def _has_gender(self, is_female: bool | None, value: str) -> bool:
         return is_female is None or (value in self._FEMALE if is_female else value not in self._FEMALE)
@@ -398,7 +552,7 @@ class TrainerasHtmlParser(HtmlParser):
             return 1
         return table
 
-    def _get_matching_flag_table(self, gender: str, category: str, selector: Selector) -> str | None:
+    def _get_matching_flag_table(self, gender: str, category: str, selector: Selector) -> HtmlNode | None:
         """
         Returns the table that matches the gender|category combination we want.
         """
@@ -420,17 +574,20 @@ class TrainerasHtmlParser(HtmlParser):
         else:
             words = ["MIXTO"]
 
-        titles = selector.xpath("/html/body/main/div/div/div/div[*]/h2/text()").getall()
+        titles = self._XPATHS["flag_titles"](selector).getall()
         idx = next((i for i, t in enumerate(titles) if all(w in t for w in words)), -1)
-        return selector.xpath(f"/html/body/main/div/div/div/div[{idx + 1}]/div/table").get(None) if idx >= 0 else None
-
-    @staticmethod
-    def _participants_path(selector: Selector) -> str:
-        path = "/html/body/div[1]/main/div[1]/div/div/div[2]/table"
-        if not selector.xpath(path):
-            # race_id=5706
-            path = "/html/body/div[1]/main/div[1]/div/div/div[3]/table"
-        return path
+        tables = self._XPATHS["flag_table"](selector, idx=idx + 1) if idx >= 0 else []
+        return tables[0] if tables else None
+
+    def _participant_row(self, row: HtmlNode) -> ParticipantRow:
+        lane, name, series = (self._XPATHS[f"row_{cell}"](row).get() for cell in ("lane", "name", "series"))
+        return ParticipantRow(
+            selector=row,
+            lane=int(lane) if lane and int(lane) <= 6 else None,
+            series=int(series) if series else 0,
+            name=whitespaces_clean(name).upper() if name else "",
+            cells=tuple(self._XPATHS["row_cells"](row).getall()),
+        )
 
     @staticmethod
     def _normalizations(name: str, original_name: str, t_date: date) -> str:
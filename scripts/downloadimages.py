@@ -4,10 +4,7 @@ import argparse
 import logging
 import os
 import sys
-import time
-
-import requests
-from parsel.selector import Selector
+from concurrent.futures import ThreadPoolExecutor
 
 from pyutils.strings import find_date
 
@@ -18,37 +15,46 @@ logger = logging.getLogger(__name__)
 # this only works with traineras.es
 def main(rower_id: str, club_name: str, year: str | None = None, output: str = "./out"):
     client: TrainerasClient = Client(source=Datasource.TRAINERAS)  # type: ignore
+    downloader = Downloader(
+        client._transport,
+        output=output,
+        max_workers=client.RATE_LIMIT.max_concurrency,
+        rate_limit=client.RATE_LIMIT,
+    )
+
+    with ThreadPoolExecutor(max_workers=client.RATE_LIMIT.max_concurrency) as executor:
+        race_ids = client.get_race_ids_by_rower(rower_id, year=year)
+        galleries = [g for race in executor.map(lambda r: find_galleries(client, r, club_name), race_ids) for g in race]
+        images = [i for gallery in executor.map(lambda g: find_images(client, *g), galleries) for i in gallery]
+
+    for download in downloader.download(images):
+        if not download.skipped:
+            logger.info(f"downloaded {download.url} into {download.path}")
+
+
+def find_galleries(client: "TrainerasClient", race_id: str, club_name: str) -> list[tuple[str, str | None]]:
     parser: TrainerasHtmlParser = client._html_parser  # type: ignore
+    selector = client.get_race_selector(race_id)
+
+    t_date = find_date(selector.xpath(f"/html/body/div[1]/main/div/div/div/div[{1}]/h2/text()").get(""))
+    t_date = t_date.strftime("%d%m%Y") if t_date else None
+    galleries = []
+    participants = parser.get_participants(selector, table=1)
+    for participant in participants:
+        if (
+            club_name.upper() not in parser.get_club_name(participant)
+            or participant.selector.xpath(".//td[10]/a/text()").get("") == "No"
+        ):
+            logger.error(f"no image found for {t_date}")
+            continue
+        galleries.append((participant.selector.xpath(".//td[10]/a/@href").get(""), t_date))
+    return galleries
+
 
-    for race_id in client.get_race_ids_by_rower(rower_id, year=year):
-        content = requests.get(url=client.get_race_details_url(race_id), headers=HTTP_HEADERS()).content.decode("utf-8")
-        selector = Selector(content)
-
-        t_date = find_date(selector.xpath(f"/html/body/div[1]/main/div/div/div/div[{1}]/h2/text()").get(""))
-        t_date = t_date.strftime("%d%m%Y") if t_date else None
-        participants: list[Selector] = parser.get_participants(selector, table=1)
-        for participant in participants:
-            if (
-                club_name.upper() not in parser.get_club_name(participant)
-                or participant.xpath("//*/td[10]/a/text()").get("") == "No"
-            ):
-                logger.error(f"no image found for {t_date}")
-                continue
-            retrieve_images(participant.xpath("//*/td[10]/a/@href").get(""), t_date, output)
-        time.sleep(20)
-
-
-def retrieve_images(url: str, t_date: str | None, output: str):
-    content = requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8")
-    selector = Selector(content)
-
-    logger.info(f"downloading images for {t_date}")
-    for id, img in enumerate(selector.xpath('//*[@id="fotografias"]/a/img/@src').getall()):
-        content = requests.get(url=img, headers=HTTP_HEADERS()).content
-        extension = img.split(".")[-1]
-        with open(f"./{output}/{t_date}_{id}.{extension}", "wb") as file:
-            file.write(content)
-        time.sleep(1)
+def find_images(client: "TrainerasClient", url: str, t_date: str | None) -> list[tuple[str, str]]:
+    selector = client.get_gallery_selector(url)
+    images = selector.xpath('//*[@id="fotografias"]/a/img/@src').getall()
+    return [(img, f"{t_date}_{id}.{img.split('.')[-1]}") for id, img in enumerate(images)]
 
 
 def _parse_arguments():
@@ -61,9 +67,8 @@ def _parse_arguments():
 
 
 if __name__ == "__main__":
-    from rscraping.clients import Client
+    from rscraping.clients import Client, Downloader
     from rscraping.clients.traineras import TrainerasClient
-    from rscraping.data.constants import HTTP_HEADERS
     from rscraping.data.models import Datasource
     from rscraping.parsers.html.traineras import TrainerasHtmlParser
 
@@ -20,20 +20,39 @@ def _parse_arguments():
     )
     parser.add_argument("--table", type=int, help="Table we want (for multi races pages).")
     parser.add_argument("--save", action="store_true", default=False, help="Saves the output to a csv file.")
+    parser.add_argument(
+        "--cache", action="store_true", default=False, help="Reuses and stores the responses in the on-disk cache."
+    )
+    parser.add_argument("--record", type=str, help="Archive file where the responses are recorded.")
+    parser.add_argument("--replay", type=str, help="Archive file from where the responses are replayed.")
     return parser.parse_args()
 
 
-def main(race_id: str, datasource: str, is_female: bool, save: bool, table: int | None):
+def main(
+    race_id: str,
+    datasource: str,
+    is_female: bool,
+    save: bool,
+    table: int | None,
+    use_cache: bool = False,
+    record: str | None = None,
+    replay: str | None = None,
+):
     if not Datasource.has_value(datasource):
         raise ValueError(f"invalid datasource={datasource}")
     if datasource == Datasource.TABULAR.value:
         raise ValueError(f"datasource={datasource} is not supported in this script")
 
+    archive = None
+    if record or replay:
+        archive = ResponseArchive(replay or record, replay=replay is not None)  # type: ignore
+
     race = find_race(
         race_id=race_id,
         datasource=Datasource(datasource),
         is_female=is_female,
         table=table,
+        transport=Transport(cache=ResponseCache() if use_cache and not replay else None, archive=archive),
     )
     if not race:
         raise ValueError(f"not found race for race_id={race_id}")
@@ -46,10 +65,11 @@ def main(race_id: str, datasource: str, is_female: bool, save: bool, table: int
 
 if __name__ == "__main__":
     from rscraping import find_race
+    from rscraping.clients import ResponseArchive, ResponseCache, Transport
     from rscraping.data.functions import save_csv, sys_print_items
     from rscraping.data.models import Datasource
 
     args = _parse_arguments()
     logger.info(f"{os.path.basename(__file__)}:: args -> {args.__dict__}")
 
-    main(args.race_id, args.datasource, args.female, args.save, args.table)
+    main(args.race_id, args.datasource, args.female, args.save, args.table, args.cache, args.record, args.replay)
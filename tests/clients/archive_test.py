@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+from rscraping.clients import ArchiveMissException, ResponseArchive, Transport
+
+
+class TestResponseArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "crawl.archive")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_archive_record_and_replay(self):
+        url = "https://www.ligalgt.com/ajax/principal/ver_resultados.php"
+        with ResponseArchive(self.path) as archive:
+            archive.record("POST", url, {"regata_id": 1}, self._response(b"first"))
+            archive.record("POST", url, {"regata_id": 2}, self._response(b"second\nline"))
+            archive.record("POST", url, {"regata_id": 1}, self._response(b"updated"))
+
+        with ResponseArchive(self.path, replay=True) as archive:
+            self.assertEqual(len(archive.records), 2)
+            self.assertEqual(archive.get("POST", url, {"regata_id": 1}).content, b"updated")
+            self.assertEqual(archive.get("POST", url, {"regata_id": 2}).content, b"second\nline")
+            self.assertEqual(archive.get("POST", url, {"regata_id": 2}).headers["ETag"], '"1234"')
+            with self.assertRaises(ArchiveMissException):
+                archive.get("GET", url)
+
+    def test_archive_truncated(self):
+        with ResponseArchive(self.path) as archive:
+            archive.record("GET", "https://traineras.es/clasificaciones/1", None, self._response(b"race"))
+            archive.record("GET", "https://traineras.es/clasificaciones/2", None, self._response(b"x" * 100))
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 10)
+
+        with ResponseArchive(self.path, replay=True) as archive:
+            self.assertEqual([r.url for r in archive.records], ["https://traineras.es/clasificaciones/1"])
+
+        # a new recording continues after the last complete record
+        with ResponseArchive(self.path) as archive:
+            archive.record("GET", "https://traineras.es/clasificaciones/3", None, self._response(b"next"))
+
+        with ResponseArchive(self.path, replay=True) as archive:
+            self.assertEqual(len(archive.records), 2)
+            self.assertEqual(archive.get("GET", "https://traineras.es/clasificaciones/3").content, b"next")
+
+    def test_transport_replay(self):
+        url = "https://traineras.es/clasificaciones/1"
+        transport = Transport(archive=ResponseArchive(self.path))
+        with mock.patch.object(transport._session, "request", return_value=self._response(b"race")):
+            transport.get(url)
+        transport.close()
+
+        transport = Transport(archive=ResponseArchive(self.path, replay=True))
+        with mock.patch.object(transport._session, "request") as request:
+            self.assertEqual(transport.get(url).content, b"race")
+            request.assert_not_called()
+        transport.close()
+
+    @staticmethod
+    def _response(content: bytes) -> requests.Response:
+        response = requests.Response()
+        response.url = "https://traineras.es"
+        response.status_code = 200
+        response.headers["ETag"] = '"1234"'
+        response._content = content
+        return response
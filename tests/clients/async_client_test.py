@@ -0,0 +1,43 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from rscraping.clients import (
+    ACTAsyncClient,
+    ACTClient,
+    ARCAsyncClient,
+    AsyncClient,
+    LGTAsyncClient,
+    TrainerasAsyncClient,
+    TrainerasClient,
+)
+from rscraping.data.constants import CATEGORY_VETERAN, GENDER_FEMALE
+from rscraping.data.models import Datasource
+
+
+class TestAsyncClient(unittest.TestCase):
+    def test_client_initialization(self):
+        self.assertTrue(isinstance(AsyncClient(source=Datasource.TRAINERAS), TrainerasAsyncClient))
+        self.assertTrue(isinstance(AsyncClient(source=Datasource.ACT), ACTAsyncClient))
+        self.assertTrue(isinstance(AsyncClient(source=Datasource.ARC), ARCAsyncClient))
+        self.assertTrue(isinstance(AsyncClient(source=Datasource.LGT), LGTAsyncClient))
+
+    def test_client_initialization_with_config(self):
+        client = AsyncClient(source=Datasource.ACT, gender=GENDER_FEMALE)
+        self.assertTrue(isinstance(client.client, ACTClient))
+        self.assertTrue(client.client.is_female)
+
+        client = AsyncClient(source=Datasource.TRAINERAS, category=CATEGORY_VETERAN, max_concurrency=2)
+        self.assertTrue(isinstance(client.client, TrainerasClient))
+        self.assertEqual(client.MAX_CONCURRENCY, 2)
+
+    def test_get_races_by_ids(self):
+        client = AsyncClient(source=Datasource.ACT)
+
+        async def collect() -> list[str]:
+            return [r async for r in client.get_races_by_ids(["1", "2", "3"])]
+
+        with mock.patch.object(client.client, "get_race_by_id", side_effect=lambda r: r if r != "2" else None):
+            races = asyncio.run(collect())
+
+        self.assertEqual(sorted(races), ["1", "3"])
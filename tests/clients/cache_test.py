@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+import requests
+
+from rscraping.clients import CachePolicy, RateLimit, RateLimiter, ResponseCache, Transport
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(path=self.tmp.name, max_size=100)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cache_keys(self):
+        url = "https://www.ligalgt.com/ajax/principal/ver_resultados.php"
+        key = self.cache.key("POST", url, {"regata_id": 1})
+        self.assertEqual(key, self.cache.key("post", url, {"regata_id": 1}))
+        self.assertNotEqual(key, self.cache.key("POST", url, {"regata_id": 2}))
+        self.assertNotEqual(self.cache.key("GET", url), self.cache.key("POST", url))
+
+    def test_cache_entries(self):
+        key = self.cache.key("GET", "https://traineras.es/clasificaciones/1")
+        self.assertIsNone(self.cache.get(key))
+
+        self.cache.put(key, self._response(b"race", etag='"1234"'), ttl=0)
+        entry = self.cache.get(key)
+        assert entry is not None
+        self.assertEqual(entry.to_response().content, b"race")
+        self.assertFalse(entry.is_fresh)
+        self.assertEqual(entry.validators, {"If-None-Match": '"1234"'})
+
+        self.cache.pin(key)
+        entry = self.cache.get(key)
+        assert entry is not None
+        self.assertTrue(entry.is_fresh)
+
+    def test_cache_eviction(self):
+        keys = [self.cache.key("GET", f"https://traineras.es/clasificaciones/{i}") for i in range(3)]
+        for idx, key in enumerate(keys):
+            self.cache.put(key, self._response(b"x" * 40), ttl=None)
+            os.utime(self.cache._paths(key)[0], (idx, idx))
+
+        self.cache.put(self.cache.key("GET", "https://traineras.es/clasificaciones/3"), self._response(b"x" * 40), None)
+        self.assertIsNone(self.cache.get(keys[0]))
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertIsNotNone(self.cache.get(keys[2]))
+
+    def test_cache_shared_directory(self):
+        other = ResponseCache(path=self.tmp.name, max_size=100)
+        first, second = (self.cache.key("GET", f"https://traineras.es/clasificaciones/{i}") for i in range(2))
+
+        self.cache.put(first, self._response(b"x" * 60), ttl=None)
+        other.clear()
+        # the entries removed by the other process are not counted
+        self.cache.put(second, self._response(b"x" * 50), ttl=None)
+        self.assertIsNotNone(self.cache.get(second))
+
+    def test_cache_policy(self):
+        policy = CachePolicy(rules=[(r"/regatas/(?P<year>\d{4})", 60)], default_ttl=10)
+        self.assertEqual(policy.ttl("https://traineras.es/clasificaciones/1"), 10)
+        self.assertEqual(policy.ttl(f"https://traineras.es/regatas/{date.today().year}?page=1"), 60)
+        self.assertIsNone(policy.ttl("https://traineras.es/regatas/2010?page=1"))
+
+    def test_transport_revalidation(self):
+        transport = Transport(cache=self.cache, rate_limiter=RateLimiter(default=RateLimit(rate=100, burst=10)))
+        url = "https://traineras.es/clasificaciones/1"
+        key = self.cache.key("GET", url)
+        self.cache.put(key, self._response(b"race", etag='"1234"'), ttl=0)
+
+        not_modified = self._response(b"", status_code=304)
+        with mock.patch.object(transport._session, "request", return_value=not_modified) as request:
+            response = transport.get(url, cache_policy=CachePolicy(default_ttl=60))
+
+        self.assertEqual(request.call_args.kwargs["headers"]["If-None-Match"], '"1234"')
+        self.assertEqual((response.status_code, response.content), (200, b"race"))
+        entry = self.cache.get(key)
+        assert entry is not None
+        self.assertTrue(entry.is_fresh)
+
+        # fresh entries are served without hitting the network
+        with mock.patch.object(transport._session, "request") as request:
+            self.assertEqual(transport.get(url).content, b"race")
+        request.assert_not_called()
+
+    def test_transport_revalidation_modified(self):
+        transport = Transport(cache=self.cache, rate_limiter=RateLimiter(default=RateLimit(rate=100, burst=10)))
+        url = "https://traineras.es/clasificaciones/1"
+        key = self.cache.key("GET", url)
+        self.cache.put(key, self._response(b"race", etag='"1234"'), ttl=0)
+
+        modified = self._response(b"updated race", etag='"5678"')
+        with mock.patch.object(transport._session, "request", return_value=modified) as request:
+            response = transport.get(url, cache_policy=CachePolicy(default_ttl=60))
+
+        self.assertEqual(request.call_args.kwargs["headers"]["If-None-Match"], '"1234"')
+        self.assertEqual(response.content, b"updated race")
+        entry = self.cache.get(key)
+        assert entry is not None
+        self.assertTrue(entry.is_fresh)
+        self.assertEqual(entry.to_response().content, b"updated race")
+        self.assertEqual(entry.validators, {"If-None-Match": '"5678"'})
+
+    @staticmethod
+    def _response(content: bytes, etag: str | None = None, status_code: int = 200) -> requests.Response:
+        response = requests.Response()
+        response.url = "https://traineras.es"
+        response.status_code = status_code
+        response._content = content
+        if etag:
+            response.headers["ETag"] = etag
+        return response
@@ -8,6 +8,7 @@ from rscraping.clients import (
     TabularClientConfig,
     TabularDataClient,
     TrainerasClient,
+    Transport,
 )
 from rscraping.data.constants import CATEGORY_VETERAN, GENDER_FEMALE
 from rscraping.data.models import Datasource
@@ -40,6 +41,15 @@ class TestClient(unittest.TestCase):
         self.assertTrue(isinstance(client, TabularDataClient))
         self.assertTrue(client.is_female)
 
+    def test_client_transport(self):
+        act, lgt = Client(source=Datasource.ACT), Client(source=Datasource.LGT)
+        self.assertIs(act._transport, lgt._transport)
+
+        transport = Transport(pool_size=2)
+        client = Client(source=Datasource.TRAINERAS, transport=transport)
+        self.assertIs(client._transport, transport)
+        self.assertIsNot(Client(source=Datasource.TRAINERAS)._transport, transport)
+
     # testing replacement for _load_dataframe
     def _load_dataframe(*_, **__):
         return None
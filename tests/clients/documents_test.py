@@ -0,0 +1,49 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from parsel.selector import Selector
+
+from rscraping.clients import DocumentCache
+
+
+class TestDocumentCache(unittest.TestCase):
+    def setUp(self):
+        self.documents = DocumentCache(max_size=2)
+
+    def test_documents_cache(self):
+        for key in ["1", "2", "1", "3", "2"]:
+            self.documents.get_or_load(key, lambda: Selector("<html/>"))
+
+        self.assertEqual(self.documents.stats, {"hits": 1, "misses": 4, "size": 2})
+
+        self.documents.clear()
+        self.assertEqual(self.documents.stats, {"hits": 0, "misses": 0, "size": 0})
+
+    def test_documents_in_flight(self):
+        loads = []
+        release = threading.Event()
+
+        def load() -> Selector:
+            loads.append(1)
+            release.wait(timeout=1)
+            return Selector("<html/>")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(self.documents.get_or_load, "1", load) for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            documents = [f.result() for f in futures]
+
+        self.assertEqual(len(loads), 1)
+        self.assertTrue(all(d is documents[0] for d in documents))
+        self.assertEqual(self.documents.stats, {"hits": 3, "misses": 1, "size": 1})
+
+    def test_documents_errors(self):
+        def load() -> Selector:
+            raise ValueError("unable to load")
+
+        with self.assertRaises(ValueError):
+            self.documents.get_or_load("1", load)
+        self.assertEqual(self.documents.get_or_load("1", lambda: Selector("<p/>")).xpath("//p").get(), "<p></p>")
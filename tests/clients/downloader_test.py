@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+from contextlib import nullcontext
+from unittest import mock
+
+import requests
+
+from rscraping.clients import Downloader, RateLimit, RateLimiter, ResponseCache, Transport
+
+
+class TestDownloader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.transport = Transport()
+        self.contents = {
+            "https://traineras.es/images/1.jpg": b"first",
+            "https://traineras.es/images/2.jpg": b"second",
+            "https://traineras.es/images/3.jpg": b"first",
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_download(self):
+        files = [(url, url.split("/")[-1]) for url in self.contents.keys()]
+
+        with mock.patch.object(self.transport, "stream", side_effect=self._response) as get:
+            downloads = {d.url: d for d in Downloader(self.transport, self.tmp.name).download(files)}
+
+        # 1.jpg and 3.jpg have the same content, whichever finishes first is kept
+        first, third = downloads[files[0][0]], downloads[files[2][0]]
+        self.assertEqual(get.call_count, 3)
+        self.assertEqual(len([f for f in os.listdir(self.tmp.name) if f.endswith(".jpg")]), 2)
+        self.assertEqual((first.sha256, first.path), (third.sha256, third.path))
+        self.assertEqual([first.skipped, third.skipped].count(True), 1)
+
+        # resumed runs skip the files in the manifest
+        with mock.patch.object(self.transport, "stream", side_effect=self._response) as get:
+            files.append(("https://traineras.es/images/4.jpg", "4.jpg"))
+            downloads = list(Downloader(self.transport, self.tmp.name).download(files))
+
+        get.assert_called_once()
+        self.assertEqual(len([d for d in downloads if d.skipped]), 3)
+
+    def test_existing_files(self):
+        # saved by a run without manifest
+        with open(os.path.join(self.tmp.name, "1.jpg"), "wb") as file:
+            file.write(b"first")
+        files = [(url, url.split("/")[-1]) for url in self.contents.keys()]
+
+        with mock.patch.object(self.transport, "stream", side_effect=self._response) as get:
+            downloads = {d.url: d for d in Downloader(self.transport, self.tmp.name).download(files)}
+
+        self.assertEqual(sorted(c.args[0] for c in get.call_args_list), [files[1][0], files[2][0]])
+        self.assertEqual(sorted(f for f in os.listdir(self.tmp.name) if f.endswith(".jpg")), ["1.jpg", "2.jpg"])
+        self.assertTrue(downloads[files[0][0]].skipped)
+        self.assertEqual(downloads[files[2][0]].path, os.path.join(self.tmp.name, "1.jpg"))
+
+        # the existing file is now in the manifest
+        with mock.patch.object(self.transport, "stream", side_effect=self._response) as get:
+            list(Downloader(self.transport, self.tmp.name).download(files))
+
+        get.assert_not_called()
+
+    def test_same_name(self):
+        files = [("https://traineras.es/images/1.jpg", "image.jpg"), ("https://traineras.es/images/2.jpg", "image.jpg")]
+
+        with mock.patch.object(self.transport, "stream", side_effect=self._response):
+            downloads = [d for f in files for d in Downloader(self.transport, self.tmp.name).download([f])]
+
+        self.assertFalse(any(d.skipped for d in downloads))
+        self.assertEqual(len({d.path for d in downloads}), 2)
+        with open(downloads[0].path, "rb") as first, open(downloads[1].path, "rb") as second:
+            self.assertEqual((first.read(), second.read()), (b"first", b"second"))
+
+    def test_stream(self):
+        transport = Transport(
+            cache=ResponseCache(os.path.join(self.tmp.name, "cache")),
+            rate_limiter=RateLimiter(default=RateLimit(rate=100, burst=10, max_concurrency=1)),
+        )
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = mock.MagicMock()
+
+        _, slot = transport.rate_limiter._host("traineras.es", None)
+        with (
+            mock.patch.object(transport._session, "request", return_value=response) as request,
+            mock.patch.object(transport.cache, "put") as put,
+        ):
+            with transport.stream("https://traineras.es/images/1.jpg"):
+                # the slot is held while the body is read
+                self.assertFalse(slot.acquire(blocking=False))
+
+        self.assertTrue(slot.acquire(blocking=False))
+        self.assertTrue(request.call_args.kwargs["stream"])
+        response.raw.close.assert_called_once()
+        put.assert_not_called()
+
+    def _response(self, url: str, **_) -> nullcontext:
+        response = mock.MagicMock(spec=requests.Response)
+        response.iter_content.return_value = iter([self.contents.get(url, b"fourth")])
+        return nullcontext(response)
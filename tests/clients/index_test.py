@@ -0,0 +1,54 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from rscraping.clients import RaceYearIndex
+from rscraping.data.models import Datasource
+
+
+class TestRaceYearIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "race_years.sqlite")
+        self.index = RaceYearIndex(datasource=Datasource.LGT.value, path=self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_index(self):
+        self.index[2] = 2020
+        self.index[3] = 2021
+        self.index["1"] = None
+
+        index = RaceYearIndex(datasource=Datasource.LGT.value, path=self.path)
+        self.assertTrue("1" in index)
+        self.assertIsNone(index["1"])
+        self.assertEqual(index["2"], 2020)
+        self.assertFalse(4 in index)
+        self.assertFalse(2 in RaceYearIndex(datasource=Datasource.ACT.value, path=self.path))
+        with self.assertRaises(KeyError):
+            index[4]
+
+        self.assertEqual(index.items(), {1: None, 2: 2020, 3: 2021})
+
+        index.clear()
+        self.assertFalse(2 in self.index)
+
+    def test_unpublished_ids(self):
+        self.index[10] = 2022
+        self.index[5] = None
+        self.index[11] = None
+        self.assertEqual(self.index.items(), {5: None, 10: 2022})
+
+        # invalid IDs stored by older runs after the last valid race
+        with sqlite3.connect(self.path) as conn:
+            conn.executemany(
+                "INSERT INTO race_years (datasource, race_id, year) VALUES (?, ?, NULL)",
+                [(Datasource.LGT.value, 12), (Datasource.LGT.value, 13)],
+            )
+        conn.close()
+
+        index = RaceYearIndex(datasource=Datasource.LGT.value, path=self.path)
+        self.assertFalse(12 in index)
+        self.assertEqual(index.items(), {5: None, 10: 2022})
@@ -0,0 +1,135 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import requests
+
+from rscraping.clients import Client, LGTClient, RaceYearIndex, Transport
+from rscraping.data.models import Datasource, RaceName
+from rscraping.parsers.html import LGTHtmlParser
+
+
+class TestLGTClient(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(source=Datasource.LGT)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index = RaceYearIndex(
+            datasource=Datasource.LGT.value, path=os.path.join(self.tmp.name, "race_years.sqlite")
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_get_race_by_id(self):
+        # both documents must be in flight at the same time to get through the barrier
+        barrier = threading.Barrier(2, timeout=1)
+
+        def fetch(*_, **__) -> requests.Response:
+            barrier.wait()
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b"<html/>"
+            return response
+
+        with (
+            mock.patch.object(self.client, "_get", side_effect=fetch) as get,
+            mock.patch.object(self.client, "_post", side_effect=fetch) as post,
+            mock.patch.object(LGTHtmlParser, "parse_race", return_value=None) as parse_race,
+        ):
+            self.assertIsNone(self.client.get_race_by_id("300"))
+
+        get.assert_called_once_with("https://www.ligalgt.com/principal/regata/300")
+        post.assert_called_once_with(LGTClient._RESULTS_URL, data={"liga_id": 1, "regata_id": "300"})
+        self.assertIn("results_selector", parse_race.call_args.kwargs)
+
+    def test_static_selectors(self):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"<p>results</p>"
+
+        transport = Transport()
+        with mock.patch.object(transport, "post", return_value=response) as post:
+            selector = LGTClient.get_results_selector("300", transport=transport)
+            LGTClient.get_calendar_selector(transport)
+
+        self.assertEqual(selector.xpath("//p/text()").get(), "results")
+        self.assertEqual(post.call_args_list[0].args, (LGTClient._RESULTS_URL,))
+        self.assertEqual(post.call_args_list[0].kwargs["data"], {"liga_id": 1, "regata_id": "300"})
+
+        with mock.patch.object(Client._transport, "post", return_value=response) as post:
+            LGTClient.get_results_selector("300")
+        post.assert_called_once()
+
+    def test_race_ids_by_year(self):
+        for race_id in range(150, 300):
+            self.index[race_id] = 2021 if race_id < 200 else 2022 if race_id < 250 else 2023
+
+        with (
+            mock.patch.object(LGTClient, "RACE_YEARS", self.index),
+            mock.patch.object(self.client, "_get_selector") as get_selector,
+        ):
+            race_ids = list(self.client.get_race_ids_by_year(2022))
+
+        get_selector.assert_not_called()
+        self.assertEqual(race_ids, [str(i) for i in range(200, 250)])
+
+    def test_season_bounds(self):
+        years = {i: 2020 + (i - 160) // 40 for i in range(160, 300)} | {171: None, 230: None}
+        with (
+            mock.patch.object(LGTClient, "RACE_YEARS", self.index),
+            mock.patch.object(self.client, "_get_race_year", side_effect=lambda r: years.get(int(r))) as get_race_year,
+        ):
+            self.assertEqual(self.client._find_season_bounds(2021), (200, 239))
+            self.assertEqual(self.client._find_season_bounds(2022), (240, 279))
+            self.assertEqual(self.client._find_season_bounds(2023), (280, 299))
+
+        self.assertLess(get_race_year.call_count, 100)
+
+    def test_season_published_later(self):
+        years = {i: 2020 + (i - 160) // 40 for i in range(160, 280)}
+        # invalid IDs indexed by a run before the 2023 season was published
+        stale = years | {i: None for i in [280, 281, 282, *range(286, 334)]}
+        years |= {i: 2023 for i in range(280, 320)}
+
+        with (
+            mock.patch.object(LGTClient, "RACE_YEARS", mock.Mock(items=mock.Mock(return_value=stale))),
+            mock.patch.object(self.client, "_get_race_year", side_effect=lambda r: years.get(int(r))) as get_race_year,
+        ):
+            self.assertEqual(self.client._find_season_bounds(2023), (280, 319))
+
+        get_race_year.assert_called()
+
+    def test_race_names_by_year(self):
+        for race_id in range(150, 300):
+            self.index[race_id] = 2021 if race_id < 200 else 2022 if race_id < 250 else 2023
+        self.index[210] = None
+
+        with (
+            mock.patch.object(LGTClient, "RACE_YEARS", self.index),
+            mock.patch.object(
+                self.client, "_get_race_name", side_effect=lambda r: RaceName(r, f"RACE {r}")
+            ) as get_name,
+        ):
+            race_names = list(self.client.get_race_names_by_year(2022))
+
+        self.assertEqual([r.race_id for r in race_names], [str(i) for i in range(200, 250) if i != 210])
+        self.assertEqual(get_name.call_count, 49)
+
+    def test_race_names_by_year_stopped(self):
+        for race_id in range(150, 300):
+            self.index[race_id] = 2021 if race_id < 200 else 2022 if race_id < 250 else 2023
+
+        with (
+            mock.patch.object(LGTClient, "RACE_YEARS", self.index),
+            mock.patch.object(
+                self.client, "_get_race_name", side_effect=lambda r: RaceName(r, f"RACE {r}")
+            ) as get_name,
+        ):
+            race_names = self.client.get_race_names_by_year(2022)
+            self.assertEqual(next(race_names).race_id, "200")
+            race_names.close()
+
+        # only the pages fetched ahead are requested
+        self.assertLessEqual(get_name.call_count, LGTClient.RATE_LIMIT.max_concurrency * 2 + 1)
@@ -0,0 +1,41 @@
+import time
+import unittest
+
+from rscraping.clients import RateLimit, RateLimiter
+from rscraping.clients._ratelimit import TokenBucket
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=20, burst=2)
+
+        start = time.monotonic()
+        bucket.acquire()
+        bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.04)
+
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test_rate_limiter_hosts(self):
+        limiter = RateLimiter(limits={"traineras.es": RateLimit(rate=1, burst=1, max_concurrency=1)})
+
+        with limiter.acquire("https://traineras.es/clasificaciones/1", RateLimit(rate=10)):
+            bucket, _ = limiter._hosts["traineras.es"]
+            self.assertEqual(bucket.rate, 1)
+
+        with limiter.acquire("https://www.ligalgt.com/principal/regata/1", RateLimit(rate=10)):
+            bucket, _ = limiter._hosts["www.ligalgt.com"]
+            self.assertEqual(bucket.rate, 10)
+
+        with limiter.acquire("https://www.liga-arc.com/es/regata/1/unknown"):
+            bucket, _ = limiter._hosts["www.liga-arc.com"]
+            self.assertEqual(bucket.rate, limiter.default.rate)
+
+    def test_rate_limiter_concurrency(self):
+        limiter = RateLimiter(default=RateLimit(rate=100, burst=10, max_concurrency=1))
+
+        with limiter.acquire("https://traineras.es/clasificaciones/1"):
+            _, semaphore = limiter._hosts["traineras.es"]
+            self.assertFalse(semaphore.acquire(blocking=False))
+        self.assertTrue(semaphore.acquire(blocking=False))
@@ -0,0 +1,76 @@
+import io
+import unittest
+from unittest import mock
+
+import requests
+
+from rscraping.clients import (
+    CircuitBreaker,
+    CircuitOpenException,
+    RateLimit,
+    RateLimiter,
+    RetryBudget,
+    RetryPolicy,
+    Transport,
+)
+
+
+class TestRetry(unittest.TestCase):
+    def test_retry_policy(self):
+        policy = RetryPolicy(backoff=1, max_backoff=5)
+        self.assertTrue(all(0 <= policy.delay(attempt) <= 5 for attempt in range(10)))
+        self.assertEqual(policy.delay(0, retry_after="3"), 3)
+        self.assertEqual(policy.delay(0, retry_after="60"), 5)
+
+    def test_retry_budget(self):
+        budget = RetryBudget(ratio=0.5, max_tokens=1)
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+        budget.deposit()
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+    def test_circuit_breaker(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.failure("traineras.es")
+        breaker.check("traineras.es")
+
+        breaker.failure("traineras.es")
+        with self.assertRaises(CircuitOpenException):
+            breaker.check("traineras.es")
+        breaker.check("www.ligalgt.com")
+
+        breaker.success("traineras.es")
+        breaker.check("traineras.es")
+
+    def test_transport_retries(self):
+        transport = Transport(
+            rate_limiter=RateLimiter(default=RateLimit(rate=100, burst=10)),
+            retry_policy=RetryPolicy(retries=2, backoff=0),
+            circuit_breaker=CircuitBreaker(failure_threshold=10),
+        )
+        failed = self._response(502)
+        with (
+            mock.patch.object(transport._session, "request", side_effect=[failed, self._response(200)]),
+            mock.patch.object(failed, "close") as close,
+        ):
+            self.assertEqual(transport.get("https://traineras.es/clasificaciones/1").status_code, 200)
+        close.assert_called_once()
+
+        with mock.patch.object(transport._session, "request", side_effect=requests.Timeout()) as request:
+            with self.assertRaises(requests.Timeout):
+                transport.get("https://traineras.es/clasificaciones/1")
+            self.assertEqual(request.call_count, 3)
+
+        with mock.patch.object(transport._session, "request", return_value=self._response(503)):
+            with self.assertRaises(requests.HTTPError):
+                transport.get("https://traineras.es/clasificaciones/1")
+
+    @staticmethod
+    def _response(status_code: int) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response.raw = io.BytesIO()
+        return response
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest import mock
+
+from rscraping._timing import StageRecorder, in_context, record_stages, stage
+from rscraping.clients import Client, LGTClient, RaceYearIndex
+from rscraping.data.models import Datasource
+from rscraping.parsers.html import TrainerasHtmlParser
+
+
+class TestStageTiming(unittest.TestCase):
+    def test_disabled(self):
+        self.assertIs(stage(Datasource.ACT, "parse"), stage(Datasource.ARC, "fetch"))
+
+        recorder = StageRecorder()
+        with record_stages(recorder):
+            self.assertIsNot(stage(Datasource.ACT, "parse"), stage(Datasource.ARC, "fetch"))
+        with stage(Datasource.ACT, "parse"):
+            pass
+        self.assertEqual(recorder.stats, {})
+
+    def test_record_stages(self):
+        with record_stages() as recorder:
+            for _ in range(2):
+                with stage(Datasource.ACT, "parse"):
+                    pass
+            with self.assertRaises(AssertionError), stage(Datasource.ARC, "header"):
+                raise AssertionError()
+        with stage(Datasource.ACT, "parse"):
+            pass
+
+        stats = recorder.stats
+        self.assertEqual(stats.keys(), {"act", "arc"})
+        self.assertEqual(stats["act"]["parse"]["calls"], 2)
+        self.assertEqual(stats["arc"]["header"]["calls"], 1)
+        self.assertAlmostEqual(stats["act"]["parse"]["mean"], stats["act"]["parse"]["total"] / 2)
+
+        recorder.clear()
+        self.assertEqual(recorder.stats, {})
+
+    def test_in_context(self):
+        def parse(_):
+            with stage(Datasource.TRAINERAS, "parse"):
+                pass
+
+        with record_stages() as recorder, ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(in_context(parse), range(4)))
+            list(executor.map(parse, range(4)))
+
+        self.assertEqual(recorder.stats["traineras"]["parse"]["calls"], 4)
+
+    def test_get_race_by_url(self):
+        client = Client(source=Datasource.TRAINERAS)
+        with open(os.path.join(os.getcwd(), "tests", "fixtures", "html", "traineras_race.html"), "rb") as file:
+            response = SimpleNamespace(content=file.read(), headers={})
+
+        with (
+            mock.patch.object(client, "_get", return_value=response),
+            mock.patch.object(client._transport, "pin"),
+            record_stages() as recorder,
+        ):
+            client.get_race_by_url(client.get_race_details_url("1234"), race_id="1234")
+
+        stages = recorder.stats["traineras"]
+        self.assertEqual(
+            stages.keys(), {"fetch", "tree", "parse", "header", "participants", "race", "normalization", "penalty"}
+        )
+        self.assertEqual(stages["fetch"]["calls"], 1)
+        self.assertLessEqual(stages["participants"]["total"], stages["parse"]["total"])
+
+    def test_worker_stages(self):
+        response = SimpleNamespace(content=b"<html/>", headers={})
+
+        client = Client(source=Datasource.TRAINERAS)
+        with (
+            mock.patch.object(client, "_get", return_value=response),
+            mock.patch.object(TrainerasHtmlParser, "get_number_of_pages", return_value=4),
+            record_stages() as recorder,
+        ):
+            list(client._get_pages(2020))
+
+        self.assertEqual(recorder.stats["traineras"]["fetch"]["calls"], 4)
+        self.assertEqual(recorder.stats["traineras"]["tree"]["calls"], 4)
+
+        client = Client(source=Datasource.LGT)
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            mock.patch.object(LGTClient, "RACE_YEARS", RaceYearIndex(Datasource.LGT.value, os.path.join(tmp, "idx"))),
+            mock.patch.object(client, "_get", return_value=response) as get,
+            mock.patch.object(client, "get_race_ids_by_year", return_value=iter(["300", "301"])),
+            record_stages() as recorder,
+        ):
+            client._find_season_bounds(2022)
+            list(client.get_race_names_by_year(2022))
+
+        self.assertEqual(recorder.stats["lgt"]["fetch"]["calls"], get.call_count)
+        self.assertEqual(recorder.stats["lgt"]["tree"]["calls"], get.call_count)
@@ -0,0 +1,76 @@
+import os
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import requests
+from parsel.selector import Selector
+
+from rscraping.clients import Client, TrainerasClient
+from rscraping.data.models import Datasource
+from rscraping.parsers.html import TrainerasHtmlParser
+
+
+class TestTrainerasClient(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(source=Datasource.TRAINERAS)
+
+    def test_get_races_by_ids(self):
+        races = {
+            "1": SimpleNamespace(name="BANDERA DE BERMEO", year=2010, normalized_names=[("BANDERA DE BERMEO", None)]),
+            "2": SimpleNamespace(name="BANDERA BERMEO", year=2011, normalized_names=[("BANDERA DE BERMEO", None)]),
+            "3": SimpleNamespace(name="BANDERA DE ORIO", year=2011, normalized_names=[("BANDERA DE ORIO", None)]),
+        }
+
+        with (
+            mock.patch.object(Client, "get_race_by_id", side_effect=lambda _, r, **__: races.get(r)),
+            mock.patch.object(TrainerasClient, "_get_flag_editions", return_value={2010: 5, 2011: 6}) as editions,
+        ):
+            result = list(self.client.get_races_by_ids(["1", "2", "4", "3"]))
+
+        self.assertEqual(result, [races["1"], races["2"], races["3"]])
+        self.assertEqual(editions.call_count, 2)
+        self.assertEqual(races["1"].normalized_names, [("BANDERA DE BERMEO", 5)])
+        self.assertEqual(races["2"].normalized_names, [("BANDERA DE BERMEO", 6)])
+        self.assertEqual(races["3"].normalized_names, [("BANDERA DE ORIO", 6)])
+
+    def test_get_races_by_ids_multi_race(self):
+        pages = {"1": "traineras_race.html", "2": "traineras_race_double.html"}
+
+        def get(url: str, **_) -> SimpleNamespace:
+            race_id = url.rstrip("/").split("/")[-1]
+            if race_id not in pages:
+                raise requests.ConnectionError(url)
+            with open(os.path.join(os.getcwd(), "tests", "fixtures", "html", pages[race_id]), "rb") as file:
+                return SimpleNamespace(content=file.read(), headers={})
+
+        with (
+            mock.patch.object(self.client, "_get", side_effect=get),
+            mock.patch.object(self.client._transport, "pin"),
+            mock.patch.object(TrainerasClient, "_get_flag_editions", return_value={}),
+        ):
+            races = list(self.client.get_races_by_ids(["1", "2", "3"]))
+
+        self.assertEqual([r.race_ids for r in races], [["1"], ["2"], ["2"]])
+        self.assertEqual([r.day for r in races], [1, 1, 2])
+
+    def test_get_flag_editions(self):
+        with (
+            mock.patch.object(self.client, "_get_selector"),
+            mock.patch.object(TrainerasHtmlParser, "parse_searched_flag_urls", return_value=["flag"]),
+            mock.patch.object(
+                TrainerasHtmlParser, "parse_flag_editions", return_value=iter([(2010, 5), (2011, 6), (2010, 7)])
+            ),
+        ):
+            self.assertEqual(self.client._get_flag_editions("BANDERA DE BERMEO"), {2010: 5, 2011: 6})
+
+    def test_get_pages(self):
+        pages = {self.client.get_races_url(2020, page=i): Selector(f"<p>{i}</p>") for i in range(1, 5)}
+
+        with (
+            mock.patch.object(self.client, "_get_selector", side_effect=lambda url: pages[url]),
+            mock.patch.object(TrainerasHtmlParser, "get_number_of_pages", return_value=4),
+        ):
+            selectors = list(self.client._get_pages(2020))
+
+        self.assertEqual([s.xpath("//p/text()").get() for s in selectors], ["1", "2", "3", "4"])
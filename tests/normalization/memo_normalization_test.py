@@ -0,0 +1,84 @@
+import unittest
+from unittest import mock
+
+from rscraping.data.normalization import (
+    clear_memoization,
+    enable_memoization,
+    memoization_stats,
+    normalize_name_parts,
+    normalize_town,
+)
+from rscraping.data.normalization._memo import _CACHES, memoized
+
+TOWNS = "rscraping.data.normalization.towns.normalize_town"
+NAME_PARTS = "rscraping.data.normalization.races.normalize_name_parts"
+
+
+class TestMemoNormalization(unittest.TestCase):
+    def tearDown(self):
+        enable_memoization(False)
+
+    def test_disabled(self):
+        clear_memoization()
+        normalize_town("PORTO DA POBRA")
+
+        self.assertEqual(memoization_stats()[TOWNS]["misses"], 0)
+
+    def test_enabled(self):
+        expected = normalize_town("PORTO DA POBRA")
+        enable_memoization()
+
+        for _ in range(3):
+            self.assertEqual(normalize_town("PORTO DA POBRA"), expected)
+        self.assertEqual(memoization_stats()[TOWNS], {"hits": 2, "misses": 1, "size": 1, "max_size": 512})
+
+        clear_memoization()
+        self.assertEqual(memoization_stats()[TOWNS], {"hits": 0, "misses": 0, "size": 0, "max_size": 512})
+
+    def test_mutable_results(self):
+        enable_memoization()
+
+        parts = normalize_name_parts("XXII BANDERA DE BERMEO")
+        expected = list(parts)
+        parts.append(("BANDERA DE MUNDAKA", None))
+
+        self.assertEqual(normalize_name_parts("XXII BANDERA DE BERMEO"), expected)
+        self.assertEqual(memoization_stats()[NAME_PARTS]["hits"], 1)
+
+    def test_max_size(self):
+        calls = []
+
+        with mock.patch.dict(_CACHES, clear=True):
+
+            @memoized(max_size=2)
+            def _normalize(name: str) -> str:
+                calls.append(name)
+                return name.upper()
+
+            enable_memoization()
+            for name in ["a", "b", "a", "c", "b", "a"]:
+                _normalize(name)
+
+            self.assertEqual(calls, ["a", "b", "c", "b", "a"])
+            stats = memoization_stats()[f"{__name__}.{_normalize.__qualname__}"]
+            self.assertEqual(stats, {"hits": 1, "misses": 5, "size": 2, "max_size": 2})
+
+            self.assertEqual(_normalize("a"), "A")
+            self.assertEqual(memoization_stats()[f"{__name__}.{_normalize.__qualname__}"]["hits"], 2)
+
+        self.assertNotIn(f"{__name__}.{_normalize.__qualname__}", memoization_stats())
+
+    def test_same_name(self):
+        with mock.patch.dict(_CACHES, clear=True):
+
+            def normalize(name: str) -> str:
+                return name
+
+            first = memoized()(normalize)
+            normalize.__module__ = "other"
+            memoized()(normalize)
+
+            enable_memoization()
+            first("a")
+            self.assertEqual(memoization_stats()[f"{__name__}.{normalize.__qualname__}"]["misses"], 1)
+            self.assertEqual(memoization_stats()[f"other.{normalize.__qualname__}"]["misses"], 0)
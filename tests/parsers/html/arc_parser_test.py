@@ -51,6 +51,19 @@ class TestARCParser(unittest.TestCase):
 
         self.assertEqual(list(race_names), self._RACE_NAMES)
 
+    def test_get_final_times(self):
+        rows = "".join(
+            f"<tr><td><span><a> {name} </a></span></td><td></td><td>{points}</td></tr>"
+            for name, points in [("Hondarribia", "16"), ("Zumaia", "0"), ("Hondarribia", "0")]
+        )
+        selector = Selector(
+            '<html><body><div id="widget-resultados"><div><div><div></div><div><div><table><tbody>'
+            f"{rows}"
+            "</tbody></table></div></div></div></div></div></body></html>"
+        )
+
+        self.assertEqual(self.parser.get_final_times(selector), {"HONDARRIBIA": "16", "ZUMAIA": "0"})
+
     _RACE = Race(
         name="XVII BANDERA RIA DEL ASON",
         date="22/08/2009",
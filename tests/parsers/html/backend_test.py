@@ -0,0 +1,46 @@
+import os
+import unittest
+
+from parsel.selector import Selector
+
+from rscraping.parsers.html import TrainerasHtmlParser
+from rscraping.parsers.html._backend import LXML, PARSEL
+from rscraping.parsers.html._xpath import XPath
+
+PAGE = '<html><body><table><tr><td class="name">CLUB A</td><td><a href="/race/1">1</a></td></tr></table></body></html>'
+
+
+class _ParselTrainerasHtmlParser(TrainerasHtmlParser):
+    _XPATHS = TrainerasHtmlParser._XPATHS.with_backend(PARSEL)
+
+
+class TestHtmlBackend(unittest.TestCase):
+    def setUp(self):
+        self.fixtures = os.path.join(os.getcwd(), "tests", "fixtures", "html")
+
+    def test_select(self):
+        selector = Selector(PAGE)
+        for query in ["//td", "//td/text()", "//a/@href", "count(//td)", "boolean(//a)", "string(//a)", "//tr/td[3]"]:
+            xpath, fast_xpath = XPath(query), XPath(query, backend=LXML)
+            self.assertEqual(xpath(selector).getall(), fast_xpath(selector).getall(), query)
+            self.assertEqual(xpath(selector).get("-"), fast_xpath(selector).get("-"), query)
+
+        row = XPath("//tr", backend=LXML)(selector)[0]
+        self.assertEqual(XPath(".//td[2]/a/@href", backend=LXML)(row).get(), "/race/1")
+        self.assertEqual(row.xpath(".//td[@class=$name]/text()", name="name").getall(), ["CLUB A"])
+
+    def test_parse_races(self):
+        parser, parsel_parser = TrainerasHtmlParser(), _ParselTrainerasHtmlParser()
+        for fixture in ["traineras_race.html", "traineras_race_triple.html", "traineras_race_with_label.html"]:
+            with open(os.path.join(self.fixtures, fixture), "rb") as file:
+                body = file.read()
+
+            races = parser.parse_races(Selector(body=body, encoding="utf-8"), race_id="1")
+            parsel_races = parsel_parser.parse_races(Selector(body=body, encoding="utf-8"), race_id="1")
+            self.assertEqual(len(races), len(parsel_races), fixture)
+            for race, parsel_race in zip(races, parsel_races):
+                participants, parsel_participants = race.participants, parsel_race.participants
+                race.participants, parsel_race.participants = [], []
+
+                self.assertEqual(race, parsel_race, fixture)
+                self.assertEqual(participants, parsel_participants, fixture)
@@ -54,6 +54,16 @@ class TestLGTParser(unittest.TestCase):
 
         self.assertEqual(list(race_names), self._RACE_NAMES)
 
+    def test_get_participants(self):
+        with open(os.path.join(self.fixtures, "lgt_results.html")) as file:
+            participants = self.parser.get_participants(Selector(file.read()))
+
+        self.assertEqual(
+            [(p.lane, p.series, p.name) for p in participants],
+            [(4, 1, "CR MUROS"), (2, 2, "CR CABO DA CRUZ"), (4, 2, "SD TIRÁN - PEREIRA")],
+        )
+        self.assertEqual(participants[0].cells, ("4", "CR MUROS", "06:35", "11:59", "19:08", "24:24:97"))
+
     _RACE = Race(
         name="IX BANDEIRA VIRXE DO CARME",
         date="25/07/2020",
@@ -107,6 +107,23 @@ class TestTrainerasParser(unittest.TestCase):
             self.assertEqual(race, self._RACES_TRIPLE[idx])
             self.assertEqual(participants, self._PARTICIPANTS_TRIPLE[idx])
 
+    def test_parse_races(self):
+        # race_id=2503
+        with open(os.path.join(self.fixtures, "traineras_race_triple.html")) as file:
+            races = self.parser.parse_races(Selector(file.read()), race_id="1234")
+
+        self.assertEqual(len(races), 3)
+        for idx, race in enumerate(races):
+            participants = race.participants
+            race.participants = []
+
+            self.assertEqual(race, self._RACES_TRIPLE[idx])
+            self.assertEqual(participants, self._PARTICIPANTS_TRIPLE[idx])
+
+        with open(os.path.join(self.fixtures, "traineras_race.html")) as file:
+            races = self.parser.parse_races(Selector(file.read()), race_id="1234")
+        self.assertEqual(len(races), 1)
+
     def test_parse_race_names(self):
         with open(os.path.join(self.fixtures, "traineras_results.html")) as file:
             data = file.read()
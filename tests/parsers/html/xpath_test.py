@@ -0,0 +1,56 @@
+import unittest
+
+from parsel.selector import Selector
+
+from rscraping.parsers.html._xpath import LayoutProfile, XPath, XPathRegistry
+
+PAGE = """
+<html><body>
+    <div id="results"><table><tr><td>1</td><td>CLUB A</td></tr><tr><td>2</td><td>CLUB B</td></tr></table></div>
+</body></html>
+"""
+LABELLED_PAGE = """
+<html><body>
+    <div id="label">LABEL</div>
+    <div id="results"><table><tr><td>3</td><td>CLUB C</td></tr></table></div>
+</body></html>
+"""
+
+
+class TestXPath(unittest.TestCase):
+    def test_call(self):
+        rows = XPath("//table/tr")(Selector(PAGE))
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(XPath(".//td[2]/text()")(rows[1]).get(), "CLUB B")
+        self.assertEqual(XPath("//table/tr[$row]/td[1]/text()")(Selector(PAGE), row=2).getall(), ["2"])
+
+    def test_matches(self):
+        self.assertTrue(XPath("not(//*[@id='label'])").matches(Selector(PAGE)))
+        self.assertFalse(XPath("//*[@id='label']").matches(Selector(PAGE)))
+
+
+class TestXPathRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = XPathRegistry(
+            {"rows": "/html/body/div[1]/table/tr", "name": ".//td[2]/text()"},
+            profiles=[
+                LayoutProfile(name="labelled", match="//*[@id='label']", paths={"rows": "/html/body/div[2]/table/tr"})
+            ],
+        )
+
+    def test_layout(self):
+        page, labelled_page = Selector(PAGE), Selector(LABELLED_PAGE)
+
+        self.assertEqual(self.registry.layout(page).name, "default")
+        self.assertEqual(self.registry.layout(labelled_page).name, "labelled")
+        self.assertIs(self.registry.layout(labelled_page), self.registry.layout(labelled_page))
+
+        rows = self.registry.layout(labelled_page)["rows"](labelled_page)
+        self.assertEqual([self.registry["name"](r).get() for r in rows], ["CLUB C"])
+
+    def test_unknown_profile_path(self):
+        with self.assertRaises(AssertionError):
+            XPathRegistry(
+                {"rows": "//tr"}, profiles=[LayoutProfile(name="broken", match="//tr", paths={"cells": "//td"})]
+            )